@@ -0,0 +1,30 @@
+"""Artifact fetch validators
+
+Revision ID: 5d2e8f1a9c3b
+Revises: 07458c963f45
+Create Date: 2026-10-17 09:12:41.218305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8f1a9c3b'
+down_revision: Union[str, Sequence[str], None] = '07458c963f45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('artifacts', sa.Column('etag', sa.String(), nullable=True))
+    op.add_column('artifacts', sa.Column('last_modified', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('artifacts', 'last_modified')
+    op.drop_column('artifacts', 'etag')
@@ -0,0 +1,28 @@
+"""Document version diff metrics
+
+Revision ID: 9b41c7d2e6a0
+Revises: 5d2e8f1a9c3b
+Create Date: 2026-10-17 11:47:03.662914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b41c7d2e6a0'
+down_revision: Union[str, Sequence[str], None] = '5d2e8f1a9c3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('document_versions', sa.Column('diff_metrics', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('document_versions', 'diff_metrics')
@@ -0,0 +1,67 @@
+"""Document latest version pointer
+
+Revision ID: c3f7a18d5b20
+Revises: 9b41c7d2e6a0
+Create Date: 2026-10-17 13:05:27.140872
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f7a18d5b20'
+down_revision: Union[str, Sequence[str], None] = '9b41c7d2e6a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('document_versions', sa.Column('previous_version_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_document_versions_previous_version_id', 'document_versions', 'document_versions',
+        ['previous_version_id'], ['id'],
+    )
+    op.add_column('documents', sa.Column('latest_version_id', sa.Integer(), nullable=True))
+    op.add_column('documents', sa.Column('latest_content_hash', sa.String(), nullable=True))
+    op.create_foreign_key(
+        'fk_documents_latest_version_id', 'documents', 'document_versions',
+        ['latest_version_id'], ['id'], ondelete='SET NULL',
+    )
+
+    # Backfill the version chain and latest pointers from existing rows
+    op.execute(
+        """
+        UPDATE document_versions AS dv
+        SET previous_version_id = chain.previous_id
+        FROM (
+            SELECT id, LAG(id) OVER (PARTITION BY document_id ORDER BY created_at, id) AS previous_id
+            FROM document_versions
+        ) AS chain
+        WHERE dv.id = chain.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE documents AS d
+        SET latest_version_id = latest.id, latest_content_hash = latest.content_hash
+        FROM (
+            SELECT DISTINCT ON (document_id) document_id, id, content_hash
+            FROM document_versions
+            ORDER BY document_id, created_at DESC, id DESC
+        ) AS latest
+        WHERE d.id = latest.document_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_documents_latest_version_id', 'documents', type_='foreignkey')
+    op.drop_column('documents', 'latest_content_hash')
+    op.drop_column('documents', 'latest_version_id')
+    op.drop_constraint('fk_document_versions_previous_version_id', 'document_versions', type_='foreignkey')
+    op.drop_column('document_versions', 'previous_version_id')
@@ -0,0 +1,45 @@
+"""Document latest artifact
+
+Revision ID: e4a9c2f7b1d6
+Revises: c3f7a18d5b20
+Create Date: 2026-10-17 16:22:41.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a9c2f7b1d6'
+down_revision: Union[str, Sequence[str], None] = 'c3f7a18d5b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('documents', sa.Column('latest_artifact_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_documents_latest_artifact_id', 'documents', 'artifacts',
+        ['latest_artifact_id'], ['id'], ondelete='SET NULL',
+    )
+
+    # Backfill from the artifact crawled by the run that created the latest version
+    op.execute(
+        """
+        UPDATE documents AS d
+        SET latest_artifact_id = a.id
+        FROM document_versions AS dv, artifacts AS a
+        WHERE dv.id = d.latest_version_id
+          AND a.run_id = dv.run_id
+          AND a.source_url = d.source_url
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_documents_latest_artifact_id', 'documents', type_='foreignkey')
+    op.drop_column('documents', 'latest_artifact_id')
@@ -0,0 +1,41 @@
+"""Document selectors hash
+
+Revision ID: f2b8d4e6a1c9
+Revises: e4a9c2f7b1d6
+Create Date: 2026-10-17 17:04:12.391876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4e6a1c9'
+down_revision: Union[str, Sequence[str], None] = 'e4a9c2f7b1d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'documents',
+        sa.Column('selectors_hash', sa.String(), nullable=False, server_default=''),
+    )
+    # A URL now has one document per selector spec
+    op.drop_index(op.f('ix_documents_source_url'), table_name='documents')
+    op.create_index(op.f('ix_documents_source_url'), 'documents', ['source_url'], unique=False)
+    op.create_index(
+        'uq_document_source_url_selectors_hash', 'documents',
+        ['source_url', 'selectors_hash'], unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_document_source_url_selectors_hash', table_name='documents')
+    op.drop_index(op.f('ix_documents_source_url'), table_name='documents')
+    op.create_index(op.f('ix_documents_source_url'), 'documents', ['source_url'], unique=True)
+    op.drop_column('documents', 'selectors_hash')
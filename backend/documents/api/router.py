@@ -66,6 +66,7 @@ def list_documents(
             language=item.language,
             created_at=item.created_at,
             updated_at=item.updated_at,
+            latest_version_id=item.latest_version_id,
         )
         for item in items
     ]
@@ -102,6 +103,7 @@ def list_documents_with_versions(
             language=doc_with_versions.document.language,
             created_at=doc_with_versions.document.created_at,
             updated_at=doc_with_versions.document.updated_at,
+            latest_version_id=doc_with_versions.document.latest_version_id,
             versions=[
                 {
                     "id": v.id,
@@ -110,6 +112,7 @@ def list_documents_with_versions(
                     "diff_uri": v.diff_uri,
                     "content_hash": v.content_hash,
                     "created_at": v.created_at,
+                    "previous_version_id": v.previous_version_id,
                 }
                 for v in doc_with_versions.versions
             ],
@@ -150,6 +153,7 @@ def get_document(
         language=result.language,
         created_at=result.created_at,
         updated_at=result.updated_at,
+        latest_version_id=result.latest_version_id,
     )
 
 
@@ -180,6 +184,7 @@ def get_document_with_versions(
         language=result.document.language,
         created_at=result.document.created_at,
         updated_at=result.document.updated_at,
+        latest_version_id=result.document.latest_version_id,
         versions=[
             {
                 "id": v.id,
@@ -188,6 +193,7 @@ def get_document_with_versions(
                 "diff_uri": v.diff_uri,
                 "content_hash": v.content_hash,
                 "created_at": v.created_at,
+                "previous_version_id": v.previous_version_id,
             }
             for v in result.versions
         ],
@@ -336,6 +342,7 @@ def get_document_by_url(
         language=result.language,
         created_at=result.created_at,
         updated_at=result.updated_at,
+        latest_version_id=result.latest_version_id,
     )
 
 
@@ -17,6 +17,7 @@ class DocumentVersionOut(BaseModel):
     diff_uri: Optional[str]
     content_hash: str
     created_at: datetime
+    previous_version_id: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -32,6 +33,7 @@ class DocumentOut(BaseModel):
     language: str
     created_at: datetime
     updated_at: datetime
+    latest_version_id: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -47,6 +49,7 @@ class DocumentDetailOut(BaseModel):
     language: str
     created_at: datetime
     updated_at: datetime
+    latest_version_id: Optional[int] = None
     versions: List[DocumentVersionOut]
     version_count: int
 
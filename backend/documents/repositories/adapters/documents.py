@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session, joinedload
 from datetime import datetime, timezone
@@ -51,9 +50,16 @@ class DocumentsAdapter(DocumentsRepository):
         return self._document_to_dto(result) if result else None
 
     def get_document_by_url(self, source_url: str) -> Optional[DocumentDTO]:
-        """Get a document by source URL (unique lookup)."""
+        """Get a document by source URL.
+
+        A URL has one document per subscription selector spec; the whole-page
+        document (empty selectors_hash) is preferred.
+        """
         result = (
-            self.db.query(Document).filter(Document.source_url == source_url).first()
+            self.db.query(Document)
+            .filter(Document.source_url == source_url)
+            .order_by(Document.selectors_hash, Document.id)
+            .first()
         )
         return self._document_to_dto(result) if result else None
 
@@ -133,11 +139,9 @@ class DocumentsAdapter(DocumentsRepository):
 
         # Download from MinIO
         try:
-            from jobs_engine.utils.minio_artifact_handler import download_artifact
+            from jobs_engine.utils.minio_artifact_handler import download_json_artifact
 
-            content_bytes = download_artifact(version.parsed_uri)
-            parsed_doc = json.loads(content_bytes.decode('utf-8'))
-            return parsed_doc
+            return download_json_artifact(version.parsed_uri)
 
         except Exception as e:
             raise ValueError(f"Failed to fetch parsed document: {e}")
@@ -305,6 +309,7 @@ class DocumentsAdapter(DocumentsRepository):
             language=doc.language,
             created_at=doc.created_at,
             updated_at=doc.updated_at,
+            latest_version_id=doc.latest_version_id,
         )
 
     @staticmethod
@@ -317,6 +322,7 @@ class DocumentsAdapter(DocumentsRepository):
             diff_uri=version.diff_uri,
             content_hash=version.content_hash,
             created_at=version.created_at,
+            previous_version_id=version.previous_version_id,
         )
 
     def _document_with_versions_to_dto(
@@ -17,6 +17,7 @@ class DocumentVersionDTO:
     diff_uri: Optional[str]
     content_hash: str
     created_at: datetime
+    previous_version_id: Optional[int] = None
 
 
 @dataclass(frozen=True)
@@ -30,6 +31,7 @@ class DocumentDTO:
     language: str
     created_at: datetime
     updated_at: datetime
+    latest_version_id: Optional[int] = None
 
 
 @dataclass(frozen=True)
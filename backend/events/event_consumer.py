@@ -3,16 +3,26 @@
 This module provides a base class for consuming Kafka events and routing them
 to registered Celery tasks via the routing system. Event type consumers should
 inherit from GenericEventConsumer and provide a job_type_extractor function.
+
+Consumers join a Kafka consumer group, so running several job-handler replicas
+spreads the topic partitions across them instead of every replica reading
+every message. Polling, batching and offset commits are handled by
+events.event_router.EventRouter; a consumer run on its own is simply a router
+with a single topic, and the job handler multiplexes all consumers through one
+router.
 """
 
-import json
 import logging
 from typing import Callable, Any, Dict, Optional
 
-from kafka import KafkaConsumer
-from events.kafkaconfig import kafka_config
+from events.event_router import (
+    EVENT_CONSUMER_BATCH_SIZE,
+    EVENT_CONSUMER_BATCH_TIMEOUT_MS,
+    EventRouter,
+)
+from events.kafkaconfig import consumer_group_prefix
 from jobs_engine.celery_app import app
-from jobs_engine.routing import pick_task
+from jobs_engine.routing import pick_queue, pick_task
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +30,18 @@ logger = logging.getLogger(__name__)
 class GenericEventConsumer:
     """Generic Kafka event consumer that dispatches to Celery tasks via routing.
 
-    This consumer:
-    1. Subscribes to a Kafka topic
-    2. For each event message:
+    This consumer (directly or through a multiplexed EventRouter):
+    1. Joins a consumer group and subscribes to a Kafka topic
+    2. For each event message in a polled batch:
        - Parses JSON
        - Extracts job_type using a provided extractor function
-       - Looks up task name using routing.pick_task(job_type)
+       - Looks up task name and stage queue using routing.pick_task/pick_queue
        - Dispatches to Celery with event data as kwargs
+    3. Commits the offsets of the whole polled batch once dispatch succeeded
 
     Subclasses should provide a job_type_extractor function that knows how to
     extract the job_type from the specific event format they're consuming.
+    Consumers that do not dispatch to Celery can override handle_event().
     """
 
     def __init__(
@@ -38,6 +50,9 @@ class GenericEventConsumer:
         job_type_extractor: Callable[[Dict[str, Any]], str],
         consumer_name: str = "EventConsumer",
         event_payload_extractor: Callable[[Dict[str, Any]], Dict[str, Any]] = None,
+        group_id: Optional[str] = None,
+        batch_size: int = EVENT_CONSUMER_BATCH_SIZE,
+        batch_timeout_ms: int = EVENT_CONSUMER_BATCH_TIMEOUT_MS,
     ):
         """Initialize the generic event consumer.
 
@@ -47,75 +62,65 @@ class GenericEventConsumer:
             consumer_name: Name for logging purposes
             event_payload_extractor: Optional function to extract task kwargs from event.
                 If not provided, entire event is passed as kwargs.
+            group_id: Kafka consumer group id. Defaults to "{prefix}.{topic}" so
+                all replicas of this consumer share the topic's partitions.
+            batch_size: Maximum number of records dispatched per poll
+            batch_timeout_ms: Maximum time to wait for a batch to fill
         """
         self.topic = topic
         self.job_type_extractor = job_type_extractor
         self.event_payload_extractor = event_payload_extractor or (lambda e: e)
         self.consumer_name = consumer_name
+        self.group_id = group_id or f"{consumer_group_prefix}.{topic}"
+        self.batch_size = batch_size
+        self.batch_timeout_ms = batch_timeout_ms
         self.logger = logging.getLogger(f"{__name__}.{consumer_name}")
 
+    def handle_event(self, event_dict: Dict[str, Any], producer: Any = None) -> None:
+        """Route a decoded event to its Celery task.
+
+        Events that can never be dispatched (no job_type, no registered task)
+        are logged and skipped. Failures to reach the Celery broker propagate so
+        the message is not committed and gets retried.
+
+        Args:
+            event_dict: Decoded event from Kafka
+            producer: Optional Celery producer shared across a batch
+        """
+        # Extract job_type using consumer-specific extractor
+        job_type = self.job_type_extractor(event_dict)
+        if not job_type:
+            self.logger.warning(
+                f"job_type_extractor returned None/empty for event: {event_dict}"
+            )
+            return
+
+        # Resolve job_type to task name via routing
+        task_name = pick_task(job_type)
+        if not task_name:
+            self.logger.warning(f"No task registered for job_type: {job_type}")
+            return
+
+        queue = pick_queue(job_type)
+        self.logger.info(
+            f"Dispatching: job_type={job_type}, task={task_name}, queue={queue}"
+        )
+
+        # Extract task payload from event and dispatch to Celery
+        task_kwargs = self.event_payload_extractor(event_dict)
+        app.send_task(task_name, kwargs=task_kwargs, queue=queue, producer=producer)
+        self.logger.debug(f"Successfully dispatched task: {task_name}")
+
     def run(self) -> None:
         """Start consuming events from Kafka topic.
 
         This runs indefinitely until interrupted or an unrecoverable error occurs.
         """
-        self.logger.info(f"Starting {self.consumer_name} for topic: {self.topic}")
-
-        consumer = KafkaConsumer(**kafka_config)
-        consumer.subscribe([self.topic])
-        self.logger.info(f"Kafka consumer subscribed to topic: {self.topic}")
-
-        try:
-            for msg in consumer:
-                self.logger.debug(f"Received message from {self.topic}: {msg}")
-                try:
-                    # Parse JSON event
-                    event_dict = json.loads(msg.value.decode())
-                except Exception as e:
-                    self.logger.exception(
-                        f"Failed to parse event JSON from {self.topic}; skipping: {e}"
-                    )
-                    continue
-
-                try:
-                    # Extract job_type using consumer-specific extractor
-                    job_type = self.job_type_extractor(event_dict)
-                    if not job_type:
-                        self.logger.warning(
-                            f"job_type_extractor returned None/empty for event: {event_dict}"
-                        )
-                        continue
-
-                    # Resolve job_type to task name via routing
-                    task_name = pick_task(job_type)
-                    if not task_name:
-                        self.logger.warning(
-                            f"No task registered for job_type: {job_type}"
-                        )
-                        continue
-
-                    self.logger.info(
-                        f"Dispatching: job_type={job_type}, task={task_name}"
-                    )
-
-                    # Dispatch to Celery with event data as kwargs
-                    try:
-                        # Extract task payload from event
-                        task_kwargs = self.event_payload_extractor(event_dict)
-                        app.send_task(task_name, kwargs=task_kwargs, queue="jobs")
-                        self.logger.info(f"Successfully dispatched task: {task_name}")
-                    except Exception as e:
-                        self.logger.exception(
-                            f"Failed to dispatch task {task_name}: {e}"
-                        )
-                        continue
-
-                except Exception as e:
-                    self.logger.exception(
-                        f"Unexpected error processing event from {self.topic}: {e}"
-                    )
-                    continue
-
-        finally:
-            consumer.close()
-            self.logger.info(f"{self.consumer_name} stopped")
+        router = EventRouter(
+            [self],
+            group_id=self.group_id,
+            router_name=self.consumer_name,
+            batch_size=self.batch_size,
+            batch_timeout_ms=self.batch_timeout_ms,
+        )
+        router.run()
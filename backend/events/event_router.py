@@ -0,0 +1,224 @@
+"""Multiplexed Kafka event router.
+
+A single KafkaConsumer subscribes to every topic handled by a set of
+GenericEventConsumer instances and runs one poll loop for all of them. Each
+polled record is handed to the consumer registered for its topic, so one
+broker connection and one thread replace a thread and connection per topic.
+
+Records are polled in batches (up to EVENT_CONSUMER_BATCH_SIZE records or
+EVENT_CONSUMER_BATCH_TIMEOUT_MS milliseconds), dispatched to Celery over a
+single broker producer, and their offsets committed once per batch after the
+events have been handed to Celery, giving at-least-once dispatch.
+
+Only transport failures (broker unreachable, see RETRYABLE_DISPATCH_ERRORS)
+rewind a partition for redelivery. Records that cannot be handled because of
+their content are logged and skipped, so one malformed record cannot stall
+its partition.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
+
+from kafka import KafkaConsumer, TopicPartition
+from kafka.consumer.subscription_state import ConsumerRebalanceListener
+from kombu.exceptions import OperationalError
+from events.kafkaconfig import consumer_config
+from jobs_engine.celery_app import app
+
+if TYPE_CHECKING:
+    from events.event_consumer import GenericEventConsumer
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before re-reading a message whose dispatch failed
+DISPATCH_RETRY_BACKOFF = 2.0
+
+# Batch limits for a single poll/dispatch/commit cycle
+EVENT_CONSUMER_BATCH_SIZE = int(os.getenv("EVENT_CONSUMER_BATCH_SIZE", "500"))
+EVENT_CONSUMER_BATCH_TIMEOUT_MS = int(os.getenv("EVENT_CONSUMER_BATCH_TIMEOUT_MS", "200"))
+
+
+class DispatchUnavailableError(Exception):
+    """An event could not be passed on because a downstream broker is unavailable.
+
+    Raised by consumers that do not dispatch to Celery so the router retries
+    the record instead of skipping it.
+    """
+
+
+# Errors that mean "try again later" rather than "this record is bad"
+RETRYABLE_DISPATCH_ERRORS = (OperationalError, OSError, DispatchUnavailableError)
+
+
+class _RebalanceLogger(ConsumerRebalanceListener):
+    """Logs partition assignment changes for a consumer group member."""
+
+    def __init__(self, router_logger: logging.Logger):
+        self.logger = router_logger
+
+    def on_partitions_revoked(self, revoked):
+        self.logger.info(f"Partitions revoked: {sorted(str(tp) for tp in revoked)}")
+
+    def on_partitions_assigned(self, assigned):
+        self.logger.info(f"Partitions assigned: {sorted(str(tp) for tp in assigned)}")
+
+
+class EventRouter:
+    """Single poll loop routing records from many topics to their consumers.
+
+    The handler table maps each topic to the GenericEventConsumer that knows
+    how to extract job types and task payloads for it.
+    """
+
+    def __init__(
+        self,
+        consumers: Iterable["GenericEventConsumer"],
+        group_id: str,
+        router_name: str = "EventRouter",
+        batch_size: int = EVENT_CONSUMER_BATCH_SIZE,
+        batch_timeout_ms: int = EVENT_CONSUMER_BATCH_TIMEOUT_MS,
+    ):
+        """Initialize the router.
+
+        Args:
+            consumers: Consumers to multiplex; each must own a distinct topic
+            group_id: Kafka consumer group id shared by all router replicas
+            router_name: Name for logging purposes
+            batch_size: Maximum number of records dispatched per poll
+            batch_timeout_ms: Maximum time to wait for a batch to fill
+        """
+        self.handlers: Dict[str, "GenericEventConsumer"] = {}
+        for consumer in consumers:
+            if consumer.topic in self.handlers:
+                raise ValueError(f"Duplicate consumer for topic: {consumer.topic}")
+            self.handlers[consumer.topic] = consumer
+
+        self.group_id = group_id
+        self.router_name = router_name
+        self.batch_size = batch_size
+        self.batch_timeout_ms = batch_timeout_ms
+        self.logger = logging.getLogger(f"{__name__}.{router_name}")
+
+    @property
+    def topics(self) -> List[str]:
+        """Topics handled by this router."""
+        return list(self.handlers)
+
+    def run(self) -> None:
+        """Start consuming events from all handled topics.
+
+        This runs indefinitely until interrupted or an unrecoverable error occurs.
+        """
+        self.logger.info(
+            f"Starting {self.router_name} for topics: {self.topics} "
+            f"(group_id={self.group_id})"
+        )
+
+        consumer = KafkaConsumer(group_id=self.group_id, **consumer_config)
+        consumer.subscribe(self.topics, listener=_RebalanceLogger(self.logger))
+        self.logger.info(f"Kafka consumer subscribed to topics: {self.topics}")
+
+        try:
+            while True:
+                batch = consumer.poll(
+                    timeout_ms=self.batch_timeout_ms, max_records=self.batch_size
+                )
+                if not batch:
+                    continue
+
+                try:
+                    failed = self.dispatch_batch(consumer, batch)
+                except Exception as e:
+                    # Broker unavailable for the whole batch: rewind everything
+                    self.logger.exception(f"Failed to dispatch batch; will retry: {e}")
+                    for tp, records in batch.items():
+                        consumer.seek(tp, records[0].offset)
+                    failed = True
+
+                # Commits consumed positions; failed partitions were rewound
+                # to their first undispatched record and will be re-polled
+                consumer.commit()
+
+                if failed:
+                    time.sleep(DISPATCH_RETRY_BACKOFF)
+
+        finally:
+            consumer.close()
+            self.logger.info(f"{self.router_name} stopped")
+
+    def dispatch_batch(
+        self, consumer: KafkaConsumer, batch: Dict[TopicPartition, List[Any]]
+    ) -> bool:
+        """Dispatch one polled batch to Celery over a single broker producer.
+
+        Records are processed in partition order. When a record cannot be
+        dispatched because a broker is unavailable, the rest of its partition
+        is skipped and the consumer is rewound to that record so it is retried
+        after the batch commit. Records that are not JSON objects, or that
+        their handler rejects, are logged and skipped.
+
+        Args:
+            consumer: Consumer the batch was polled from
+            batch: Records grouped by topic partition, as returned by poll()
+
+        Returns:
+            True if any partition had to be rewound
+        """
+        failed = False
+        dispatched = 0
+
+        with app.producer_or_acquire() as producer:
+            for tp, records in batch.items():
+                handler = self.handlers.get(tp.topic)
+                if handler is None:
+                    self.logger.warning(f"No consumer registered for topic: {tp.topic}")
+                    continue
+
+                for msg in records:
+                    try:
+                        # Parse JSON event
+                        event_dict = json.loads(msg.value.decode())
+                    except Exception as e:
+                        self.logger.exception(
+                            f"Failed to parse event JSON from {msg.topic}; skipping: {e}"
+                        )
+                        continue
+
+                    if not isinstance(event_dict, dict):
+                        self.logger.error(
+                            f"Event from {msg.topic} (partition={msg.partition}, "
+                            f"offset={msg.offset}) is not a JSON object; skipping"
+                        )
+                        continue
+
+                    try:
+                        handler.handle_event(event_dict, producer=producer)
+                        dispatched += 1
+                    except RETRYABLE_DISPATCH_ERRORS as e:
+                        self.logger.exception(
+                            f"Failed to dispatch event from {msg.topic} "
+                            f"(partition={msg.partition}, offset={msg.offset}); "
+                            f"will retry: {e}"
+                        )
+                        # Rewind so this record is redelivered on the next poll
+                        consumer.seek(tp, msg.offset)
+                        failed = True
+                        break
+                    except Exception as e:
+                        # Retrying cannot fix a record its handler rejects
+                        self.logger.exception(
+                            f"Failed to handle event from {msg.topic} "
+                            f"(partition={msg.partition}, offset={msg.offset}); "
+                            f"skipping: {e}"
+                        )
+
+        self.logger.info(
+            f"Dispatched {dispatched} events from a batch of "
+            f"{sum(len(r) for r in batch.values())} records"
+        )
+        return failed
@@ -3,9 +3,15 @@
 This provides a simple interface to publish events directly to Kafka topics.
 Celery workers consume these events and route them to appropriate handlers.
 
+The producer batches records in memory (``linger_ms`` / ``batch_size``) and
+compresses each batch before it goes on the wire. ``emit_event`` only enqueues
+the record; delivery is confirmed asynchronously through callbacks, and the
+buffer is flushed explicitly at task boundaries or via ``flush_events()`` on
+shutdown.
+
 Usage:
     from events.kafka_emitter import emit_event
-    
+
     emit_event("target.created", {"target_id": str(target.id), "email": target.email})
 """
 
@@ -14,45 +20,144 @@ from __future__ import annotations
 import json
 import logging
 import os
+import threading
 from typing import Any, Dict, Optional
 from kafka import KafkaProducer
+from kafka.producer.future import FutureRecordMetadata
 
 logger = logging.getLogger(__name__)
 
-# Singleton producer instance
+# Producer batching / compression settings
+KAFKA_PRODUCER_LINGER_MS = int(os.getenv("KAFKA_PRODUCER_LINGER_MS", "20"))
+KAFKA_PRODUCER_BATCH_SIZE = int(os.getenv("KAFKA_PRODUCER_BATCH_SIZE", str(64 * 1024)))
+KAFKA_PRODUCER_COMPRESSION = os.getenv("KAFKA_PRODUCER_COMPRESSION", "gzip") or None
+KAFKA_PRODUCER_ACKS = os.getenv("KAFKA_PRODUCER_ACKS", "1")
+KAFKA_FLUSH_TIMEOUT = float(os.getenv("KAFKA_FLUSH_TIMEOUT", "5.0"))
+
+# Singleton producer instance (per process: a forked child cannot reuse the
+# parent's producer because its background sender thread is not inherited)
 _producer: Optional[KafkaProducer] = None
+_producer_pid: Optional[int] = None
+_producer_lock = threading.Lock()
 
 
 def _get_producer() -> KafkaProducer:
     """Get or create the Kafka producer singleton."""
-    global _producer
-    
-    if _producer is None:
-        # Determine Kafka connection based on environment
-        kafka_host = os.getenv("KAFKA_HOST", "kafka")
-        kafka_port = os.getenv("KAFKA_PORT", "9093")
-        
-        bootstrap_servers = f"{kafka_host}:{kafka_port}"
-        
-        _producer = KafkaProducer(bootstrap_servers=[bootstrap_servers])
-        logger.info("Kafka producer initialized with bootstrap_servers=%s", bootstrap_servers)
-    
+    global _producer, _producer_pid
+
+    if _producer is None or _producer_pid != os.getpid():
+        with _producer_lock:
+            if _producer is None or _producer_pid != os.getpid():
+                # Determine Kafka connection based on environment
+                kafka_host = os.getenv("KAFKA_HOST", "kafka")
+                kafka_port = os.getenv("KAFKA_PORT", "9093")
+
+                bootstrap_servers = f"{kafka_host}:{kafka_port}"
+
+                acks: Any = "all" if KAFKA_PRODUCER_ACKS == "all" else int(KAFKA_PRODUCER_ACKS)
+                _producer = KafkaProducer(
+                    bootstrap_servers=[bootstrap_servers],
+                    linger_ms=KAFKA_PRODUCER_LINGER_MS,
+                    batch_size=KAFKA_PRODUCER_BATCH_SIZE,
+                    compression_type=KAFKA_PRODUCER_COMPRESSION,
+                    acks=acks,
+                )
+                _producer_pid = os.getpid()
+                logger.info(
+                    "Kafka producer initialized with bootstrap_servers=%s "
+                    "(linger_ms=%s, batch_size=%s, compression=%s)",
+                    bootstrap_servers,
+                    KAFKA_PRODUCER_LINGER_MS,
+                    KAFKA_PRODUCER_BATCH_SIZE,
+                    KAFKA_PRODUCER_COMPRESSION,
+                )
+
     return _producer
 
 
-def emit_event(event_name: str, data: Dict[str, Any], topic: str = "events") -> bool:
+def _on_send_success(event_name: str, topic: str, metadata: Any) -> None:
+    logger.debug(
+        "Event delivered to Kafka: %s → topic=%s partition=%s offset=%s",
+        event_name,
+        topic,
+        metadata.partition,
+        metadata.offset,
+    )
+
+
+def _on_send_error(event_name: str, topic: str, exc: BaseException) -> None:
+    logger.error("Failed to deliver event to Kafka: %s → topic=%s: %s", event_name, topic, exc)
+
+
+def publish_event(
+    event_name: str,
+    data: Dict[str, Any],
+    topic: str = "events",
+    key: Optional[str] = None,
+) -> FutureRecordMetadata:
+    """Enqueue an event on the batching producer and return its delivery future.
+
+    The record is sent together with other buffered records once ``linger_ms``
+    elapses or the batch is full. Callers that need delivery confirmation can
+    block on the returned future (``future.get(timeout=...)``) after a flush.
+
+    Args:
+        event_name: Name of the event (e.g., "target.created")
+        data: Event payload as a dictionary
+        topic: Kafka topic to publish to
+        key: Partition key; events sharing a key keep their order.
+            Defaults to the event name.
+
+    Returns:
+        Future resolving to the record metadata once the broker acknowledges it
+
+    Raises:
+        KafkaError: If the record cannot be enqueued (e.g., buffer exhausted)
+    """
+    producer = _get_producer()
+
+    # Prepare message with event metadata
+    message = {
+        "event": event_name,
+        "data": data,
+    }
+    message_bytes = json.dumps(message).encode("utf-8")
+
+    future = producer.send(
+        topic=topic,
+        value=message_bytes,
+        key=(key or event_name).encode("utf-8")
+    )
+    future.add_callback(lambda metadata: _on_send_success(event_name, topic, metadata))
+    future.add_errback(lambda exc: _on_send_error(event_name, topic, exc))
+    return future
+
+
+def emit_event(
+    event_name: str,
+    data: Dict[str, Any],
+    topic: str = "events",
+    key: Optional[str] = None,
+) -> bool:
     """Publish an event to Kafka.
-    
+
     Events are published to the "events" topic and consumed by Celery workers
     which route them to appropriate task handlers.
-    
+
+    The event is buffered by the producer and sent asynchronously; use
+    ``flush_events()`` (called automatically after every Celery task) to force
+    delivery of everything buffered so far.
+
     Args:
         event_name: Name of the event (e.g., "target.created")
         data: Event payload as a dictionary
-        
+        topic: Kafka topic to publish to
+        key: Partition key; events sharing a key keep their order.
+            Defaults to the event name.
+
     Returns:
-        True if event was published successfully, False otherwise
-        
+        True if event was enqueued successfully, False otherwise
+
     Example:
         emit_event("target.created", {
             "target_id": "123e4567-e89b-12d3-a456-426614174000",
@@ -61,36 +166,25 @@ def emit_event(event_name: str, data: Dict[str, Any], topic: str = "events") ->
         })
     """
     try:
-        producer = _get_producer()
-        
-        # Prepare message with event metadata
-        message = {
-            "event": event_name,
-            "data": data,
-        }
-        message_bytes = json.dumps(message).encode("utf-8")
-        
-        # Produce to Kafka asynchronously
-        producer.send(
-            topic=topic,
-            value=message_bytes,
-            key=event_name.encode("utf-8")
-        )
-        
-        # Trigger delivery of any buffered messages (non-blocking)
-        producer.flush()
-        
-        logger.info("Event published to Kafka: %s → topic=%s", event_name, topic)
+        publish_event(event_name, data, topic=topic, key=key)
+        logger.info("Event queued for Kafka: %s → topic=%s", event_name, topic)
         return True
-        
+
     except Exception:
         logger.exception("Failed to publish event to Kafka: %s", event_name)
         return False
 
-def flush_events() -> None:
-    """Flush any pending events. Useful for graceful shutdown."""
-    global _producer
-    if _producer is not None:
-        _producer.flush(timeout=5.0)
-        logger.info("Kafka producer flushed")
+def flush_events(timeout: Optional[float] = None) -> None:
+    """Flush any pending events. Called at task boundaries and on graceful shutdown.
 
+    Args:
+        timeout: Maximum seconds to wait for buffered records to be delivered.
+            Defaults to KAFKA_FLUSH_TIMEOUT.
+    """
+    global _producer
+    if _producer is not None and _producer_pid == os.getpid():
+        try:
+            _producer.flush(timeout=timeout if timeout is not None else KAFKA_FLUSH_TIMEOUT)
+            logger.debug("Kafka producer flushed")
+        except Exception:
+            logger.exception("Failed to flush Kafka producer")
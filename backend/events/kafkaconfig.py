@@ -4,4 +4,17 @@ import os
 kafka_config = {
     "bootstrap_servers": f"{os.getenv('KAFKA_HOST')}:{os.getenv('KAFKA_PORT')}",
     "security_protocol": "PLAINTEXT",
-}
\ No newline at end of file
+}
+
+# Consumer group membership for the job-handler consumers. Replicas sharing a
+# group id split the topic partitions between them; offsets are committed
+# manually once the event has been handed to Celery.
+consumer_group_prefix = os.getenv("KAFKA_CONSUMER_GROUP_PREFIX", "jobs-engine")
+
+consumer_config = {
+    **kafka_config,
+    "enable_auto_commit": False,
+    "auto_offset_reset": os.getenv("KAFKA_AUTO_OFFSET_RESET", "earliest"),
+    "session_timeout_ms": int(os.getenv("KAFKA_SESSION_TIMEOUT_MS", "10000")),
+    "max_poll_interval_ms": int(os.getenv("KAFKA_MAX_POLL_INTERVAL_MS", "300000")),
+}
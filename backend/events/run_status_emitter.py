@@ -4,12 +4,15 @@ Provides standardized event emission for task lifecycle tracking:
 - run.started: Task begins execution
 - run.completed: Task completes successfully
 - run.failed: Task fails with exception
+
+Status events are keyed by run_id so all events of one run land on the same
+partition and are consumed in the order they were emitted.
 """
 
 import logging
 from typing import Any, Dict, Optional
 
-from events.kafka_emitter import emit_event
+from events.kafka_emitter import KAFKA_FLUSH_TIMEOUT, emit_event, publish_event
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +31,7 @@ def emit_run_started(run_id: int, trace_id: str) -> bool:
         "run_id": run_id,
         "trace_id": trace_id,
     }
-    return emit_event("run.started", payload, topic="run.status")
+    return emit_event("run.started", payload, topic="run.status", key=str(run_id))
 
 
 def emit_run_completed(
@@ -49,7 +52,37 @@ def emit_run_completed(
         "trace_id": trace_id,
         "result": result,
     }
-    return emit_event("run.completed", payload, topic="run.status")
+    return emit_event("run.completed", payload, topic="run.status", key=str(run_id))
+
+
+def publish_run_completed(
+    run_id: int,
+    trace_id: str,
+    result: Optional[Dict[str, Any]] = None,
+    timeout: float = KAFKA_FLUSH_TIMEOUT,
+) -> None:
+    """Emit run.completed and wait until the broker has acknowledged it.
+
+    Unlike emit_run_completed, which only enqueues the event on the batching
+    producer, this is safe to call before committing the Kafka offset of the
+    record that triggered it.
+
+    Args:
+        run_id: The run ID
+        trace_id: Trace ID for provenance tracking
+        result: Optional result data from the task
+        timeout: Maximum seconds to wait for the acknowledgement
+
+    Raises:
+        KafkaError: If the event could not be delivered in time
+    """
+    payload = {
+        "run_id": run_id,
+        "trace_id": trace_id,
+        "result": result,
+    }
+    future = publish_event("run.completed", payload, topic="run.status", key=str(run_id))
+    future.get(timeout=timeout)
 
 
 def emit_run_failed(
@@ -75,4 +108,4 @@ def emit_run_failed(
         "error_message": error_message,
         "error_traceback": error_traceback,
     }
-    return emit_event("run.failed", payload, topic="run.status")
+    return emit_event("run.failed", payload, topic="run.status", key=str(run_id))
@@ -1,6 +1,12 @@
 """Celery application instance for Redcrawl."""
 
 from celery import Celery
+from celery.signals import task_postrun, worker_init, worker_process_init, worker_shutdown
+
+from database.sync import engine_sync
+from events.kafka_emitter import flush_events
+from jobs_engine.minio_client import warm_bucket_cache
+from jobs_engine.parse_engine import shutdown_parse_engine
 
 app = Celery("redcrawl_job_handler")
 app.config_from_object("jobs_engine.celeryconfig")
@@ -8,3 +14,32 @@ app.config_from_object("jobs_engine.celeryconfig")
 # Auto-discover tasks from package-local tasks module
 app.autodiscover_tasks(["jobs_engine"])
 
+
+@task_postrun.connect
+def _flush_events_after_task(**kwargs) -> None:
+    """Deliver events buffered by the Kafka producer at the end of every task."""
+    flush_events()
+
+
+@worker_shutdown.connect
+def _flush_events_on_shutdown(**kwargs) -> None:
+    """Drain the Kafka producer before the worker exits."""
+    flush_events()
+
+
+@worker_shutdown.connect
+def _stop_parse_engine(**kwargs) -> None:
+    """Stop the parse engine's pool processes before the worker exits."""
+    shutdown_parse_engine()
+
+
+@worker_process_init.connect
+def _reset_connections_in_child(**kwargs) -> None:
+    """Drop DB connections inherited from the parent in prefork children."""
+    engine_sync.dispose(close=False)
+
+
+@worker_init.connect
+def _warm_minio_buckets(**kwargs) -> None:
+    """Check the MinIO buckets once before the pool starts; children inherit the cache."""
+    warm_bucket_cache()
@@ -34,7 +34,29 @@ result_backend = f"db+postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES
 worker_prefetch_multiplier = 1
 worker_max_tasks_per_child = 1000
 
-worker_pool = "solo"  # Use solo pool for better async support
+# Execution pool. "threads" suits the I/O-bound crawl work; CPU-bound HTML
+# parsing runs in the parse engine's own process pool (see
+# jobs_engine.parse_engine), so parse workers use threads too. Async helpers
+# run on a per-process background loop (see jobs_engine.utils.async_runner)
+# so every pool type is safe.
+worker_pool = os.getenv("CELERY_WORKER_POOL", "threads")
+worker_concurrency = int(os.getenv("CELERY_WORKER_CONCURRENCY", "8"))
+
+# One queue per pipeline stage so each stage can be scaled independently
+PIPELINE_QUEUES = ["crawl", "parse", "version", "deliver", "status"]
+
+# Default pool and concurrency for workers consuming a given queue. A worker
+# consuming several queues needs them to agree on the pool type and takes the
+# largest concurrency; the CELERY_WORKER_POOL / CELERY_WORKER_CONCURRENCY env
+# vars override both.
+QUEUE_WORKER_OPTIONS = {
+    "crawl": {"pool": "threads", "concurrency": 16},
+    "parse": {"pool": "threads", "concurrency": 2 * (os.cpu_count() or 2)},
+    "version": {"pool": "prefork", "concurrency": 2},
+    "deliver": {"pool": "threads", "concurrency": 8},
+    "status": {"pool": "threads", "concurrency": 8},
+    "jobs": {"pool": "threads", "concurrency": 8},
+}
 
 # Task result settings
 result_expires = 604800  # 7 days (was 1 hour)
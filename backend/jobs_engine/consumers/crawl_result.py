@@ -70,6 +70,7 @@ class CrawlResultConsumer(GenericEventConsumer):
         return {
             "artifact_id": data.get("artifact_id"),
             "blob_uri": data.get("blob_uri"),
+            "content_type": data.get("content_type"),
             "run_id": data.get("run_id"),
             "trace_id": data.get("trace_id"),
             "source_url": data.get("source_url"),
@@ -8,7 +8,8 @@ import logging
 from typing import Any, Dict
 
 from events.event_consumer import GenericEventConsumer
-from events.run_status_emitter import emit_run_completed
+from events.event_router import DispatchUnavailableError
+from events.run_status_emitter import publish_run_completed
 
 logger = logging.getLogger(__name__)
 
@@ -30,40 +31,32 @@ class DeliveryResultConsumer(GenericEventConsumer):
             consumer_name="DeliveryResultConsumer",
         )
 
-    def run(self) -> None:
-        """Override run to handle terminal event specially.
+    def handle_event(self, event_dict: Dict[str, Any], producer: Any = None) -> None:
+        """Handle terminal event specially.
 
         Instead of dispatching to a task, directly emit run.completed.
         """
-        logger.info(f"Starting {self.consumer_name} (topic={self.topic})")
+        logger.info(
+            f"{self.consumer_name} received event: {event_dict.get('event')}"
+        )
+
+        # Extract fields and emit run.completed
+        data = event_dict.get("data", {})
+        run_id = data.get("run_id")
+        trace_id = data.get("trace_id")
+        result = data.get("result", {})
+
+        logger.info(
+            f"{self.consumer_name}: Emitting run.completed for run_id={run_id}"
+        )
+        # Wait for the acknowledgement: the router commits this record's
+        # offset as soon as handle_event returns
         try:
-            for message in self.consumer:
-                try:
-                    event_dict = self.deserialize(message.value)
-                    logger.info(
-                        f"{self.consumer_name} received event: {event_dict.get('event')}"
-                    )
-
-                    # Extract fields and emit run.completed
-                    data = event_dict.get("data", {})
-                    run_id = data.get("run_id")
-                    trace_id = data.get("trace_id")
-                    result = data.get("result", {})
-
-                    logger.info(
-                        f"{self.consumer_name}: Emitting run.completed for run_id={run_id}"
-                    )
-                    emit_run_completed(run_id, trace_id, result)
-
-                except Exception as e:
-                    logger.exception(f"Error processing delivery.result event: {e}")
-
-        except KeyboardInterrupt:
-            logger.info(f"{self.consumer_name} interrupted by user")
+            publish_run_completed(run_id, trace_id, result)
         except Exception as e:
-            logger.exception(f"Fatal error in {self.consumer_name}: {e}")
-        finally:
-            self.consumer.close()
+            raise DispatchUnavailableError(
+                f"Failed to emit run.completed for run_id={run_id}: {e}"
+            ) from e
 
     @staticmethod
     def _job_type_extractor(event: Dict[str, Any]) -> str:
@@ -71,6 +71,7 @@ class ParseResultConsumer(GenericEventConsumer):
             "doc_id": data.get("doc_id"),
             "version_id": data.get("version_id"),
             "parsed_uri": data.get("parsed_uri"),
+            "section_count": data.get("section_count"),
             "run_id": data.get("run_id"),
             "trace_id": data.get("trace_id"),
         }
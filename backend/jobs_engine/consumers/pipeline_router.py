@@ -0,0 +1,63 @@
+"""Multiplexed router for all pipeline topics.
+
+Builds a single EventRouter whose handler table is made of the existing
+per-topic consumer classes, so the job handler needs one Kafka consumer and
+one poll thread for the whole pipeline instead of one per topic.
+"""
+
+import logging
+
+from events.event_router import EventRouter
+from events.kafkaconfig import consumer_group_prefix
+from jobs_engine.consumers.subscription_scheduled import SubscriptionScheduledConsumer
+from jobs_engine.consumers.crawl_request import CrawlRequestConsumer
+from jobs_engine.consumers.crawl_result import CrawlResultConsumer
+from jobs_engine.consumers.run_status import RunStatusConsumer
+from jobs_engine.consumers.parse_result import ParseResultConsumer
+from jobs_engine.consumers.versioning_result import VersioningResultConsumer
+from jobs_engine.consumers.delivery_result import DeliveryResultConsumer
+
+logger = logging.getLogger(__name__)
+
+# Consumer classes multiplexed by the pipeline router, one per topic
+PIPELINE_CONSUMERS = (
+    SubscriptionScheduledConsumer,
+    CrawlRequestConsumer,
+    CrawlResultConsumer,
+    RunStatusConsumer,
+    ParseResultConsumer,
+    VersioningResultConsumer,
+    DeliveryResultConsumer,
+)
+
+
+def build_pipeline_router() -> EventRouter:
+    """Create a router handling every pipeline topic.
+
+    Returns:
+        EventRouter with one handler per pipeline topic
+    """
+    return EventRouter(
+        [consumer_cls() for consumer_cls in PIPELINE_CONSUMERS],
+        group_id=f"{consumer_group_prefix}.pipeline",
+        router_name="PipelineRouter",
+    )
+
+
+def run_pipeline_router() -> None:
+    """Run the pipeline router.
+
+    This subscribes to all pipeline topics with a single Kafka consumer and
+    routes each event through its topic's consumer.
+    """
+    router = build_pipeline_router()
+    router.run()
+
+
+if __name__ == "__main__":
+    # Router-only instance: python -m jobs_engine.consumers.pipeline_router
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s - %(message)s",
+    )
+    run_pipeline_router()
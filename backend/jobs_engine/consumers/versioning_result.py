@@ -51,6 +51,9 @@ class VersioningResultConsumer(GenericEventConsumer):
           "data": {
             "doc_id": 1,
             "version_id": 2,
+            "parsed_uri": "s3://...",
+            "section_count": 12,
+            "change_summary": {...},
             "run_id": 5,
             "trace_id": "...",
             ...
@@ -69,6 +72,10 @@ class VersioningResultConsumer(GenericEventConsumer):
         return {
             "doc_id": data.get("doc_id"),
             "version_id": data.get("version_id"),
+            "parsed_uri": data.get("parsed_uri"),
+            "diff_uri": data.get("diff_uri"),
+            "section_count": data.get("section_count"),
+            "change_summary": data.get("change_summary"),
             "run_id": data.get("run_id"),
             "trace_id": data.get("trace_id"),
         }
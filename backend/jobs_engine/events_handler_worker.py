@@ -2,19 +2,28 @@
 """Celery worker for event-driven job handling with Kafka consumers.
 
 This script starts:
-1. A Celery worker that processes jobs from the jobs queue
-2. Multiple Kafka consumer threads that listen to different event topics
-   and route events to registered Celery tasks
+1. A Celery worker that processes jobs from a chosen subset of the pipeline
+   stage queues (crawl, parse, version, deliver, status)
+2. A single Kafka router thread that subscribes to all pipeline topics and
+   routes events to registered Celery tasks (can be disabled so stage-only
+   workers can be scaled separately)
 
-Event consumers use the routing system to find registered tasks for each
-job_type, enabling extensible event handling without hardcoding.
+The router's handler table is built from the per-topic event consumers, which
+use the routing system to find registered tasks for each job_type, enabling
+extensible event handling without hardcoding.
 
-Run with: python -m jobs_engine.events_handler_worker
+Queues served by one worker must share a pool type (see QUEUE_WORKER_OPTIONS),
+so e.g. the prefork version queue runs in its own worker.
+
+Run with: python -m jobs_engine.events_handler_worker [--queues parse] [--no-router]
 """
 
+import argparse
 import logging
+import os
 import sys
 import threading
+from typing import Any, Dict, List
 
 # Configure logging as early as possible
 logging.basicConfig(
@@ -23,29 +32,62 @@ logging.basicConfig(
 )
 
 from jobs_engine.celery_app import app  # noqa: E402
+from jobs_engine.celeryconfig import PIPELINE_QUEUES, QUEUE_WORKER_OPTIONS  # noqa: E402
 import jobs_engine.tasks.crawl_tasks  # noqa: E402, F401
 import jobs_engine.tasks.run_status_tasks  # noqa: E402, F401
-from jobs_engine.consumers.subscription_scheduled import (  # noqa: E402
-    run_subscription_scheduled_consumer,
-)
-from jobs_engine.consumers.crawl_request import run_crawl_request_consumer  # noqa: E402
-from jobs_engine.consumers.crawl_result import run_crawl_result_consumer  # noqa: E402
-from jobs_engine.consumers.run_status import run_run_status_consumer  # noqa: E402
-from jobs_engine.consumers.parse_result import run_parse_result_consumer  # noqa: E402
-from jobs_engine.consumers.versioning_result import run_versioning_result_consumer  # noqa: E402
-from jobs_engine.consumers.delivery_result import run_delivery_result_consumer  # noqa: E402
+from jobs_engine.consumers.pipeline_router import run_pipeline_router  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
 
-def run_celery_worker():
+def resolve_worker_options(queues: List[str]) -> Dict[str, Any]:
+    """Resolve pool type and concurrency for a worker consuming the given queues.
+
+    Args:
+        queues: Queues the worker consumes
+
+    Returns:
+        Dict with "pool" and "concurrency" keys
+
+    Raises:
+        ValueError: If the queues want different pool types and
+            CELERY_WORKER_POOL does not choose one
+    """
+    default = {"pool": "threads", "concurrency": 8}
+    queue_options = [QUEUE_WORKER_OPTIONS.get(queue, default) for queue in queues]
+
+    pools = {queue: opts["pool"] for queue, opts in zip(queues, queue_options)}
+    if os.getenv("CELERY_WORKER_POOL"):
+        pool = os.environ["CELERY_WORKER_POOL"]
+    elif len(set(pools.values())) > 1:
+        raise ValueError(
+            f"Queues {queues} need different worker pools ({pools}); run them in "
+            "separate workers or set CELERY_WORKER_POOL"
+        )
+    else:
+        pool = queue_options[0]["pool"]
+
+    if os.getenv("CELERY_WORKER_CONCURRENCY"):
+        concurrency = int(os.environ["CELERY_WORKER_CONCURRENCY"])
+    else:
+        concurrency = max(opts["concurrency"] for opts in queue_options)
+    return {"pool": pool, "concurrency": concurrency}
+
+
+def run_celery_worker(queues: List[str], options: Dict[str, Any]):
     """Run the Celery worker in the main thread."""
-    logger.info("Starting Celery worker for job processing...")
+    logger.info(
+        "Starting Celery worker for job processing (queues=%s, pool=%s, concurrency=%s)...",
+        queues,
+        options["pool"],
+        options["concurrency"],
+    )
 
     worker = app.Worker(
         loglevel="INFO",
-        queues=["jobs"],
-        pool="solo",  # Use solo pool for simpler async task handling
+        queues=queues,
+        pool=options["pool"],
+        concurrency=options["concurrency"],
     )
 
     try:
@@ -54,80 +96,54 @@ def run_celery_worker():
         logger.exception("Celery worker error: %s", exc)
 
 
-def main() -> int:
-    """Start Celery worker and all event consumers."""
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line options, falling back to environment variables."""
+    parser = argparse.ArgumentParser(description="Events handler worker")
+    parser.add_argument(
+        "--queues",
+        default=os.getenv("JOBS_WORKER_QUEUES", ",".join(PIPELINE_QUEUES)),
+        help="Comma-separated pipeline queues to consume (default: all stages)",
+    )
+    parser.add_argument(
+        "--no-router",
+        action="store_true",
+        default=os.getenv("JOBS_WORKER_ROUTER", "true").lower() == "false",
+        help="Do not start the Kafka pipeline router in this process",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> int:
+    """Start Celery worker and the pipeline event router."""
+    args = parse_args(argv)
+    queues = [q.strip() for q in args.queues.split(",") if q.strip()] or PIPELINE_QUEUES
+
+    try:
+        options = resolve_worker_options(queues)
+    except ValueError as exc:
+        logger.error("Invalid worker configuration: %s", exc)
+        return 1
+
     logger.info("=" * 60)
     logger.info("Starting Events Handler Worker")
-    logger.info("  - Celery worker: processes jobs from jobs queue")
-    logger.info("  - Event consumers: route Kafka events to registered tasks")
+    logger.info(f"  - Celery worker: processes jobs from queues {queues}")
+    if not args.no_router:
+        logger.info("  - Event router: routes Kafka events to registered tasks")
     logger.info("=" * 60)
 
     try:
-        # Start subscription scheduled consumer thread
-        subscription_consumer_thread = threading.Thread(
-            target=run_subscription_scheduled_consumer,
-            name="SubscriptionScheduledConsumer",
-            daemon=True,
-        )
-        subscription_consumer_thread.start()
-        logger.info("Started SubscriptionScheduledConsumer thread")
-
-        # Start crawl request consumer thread
-        crawl_request_consumer_thread = threading.Thread(
-            target=run_crawl_request_consumer,
-            name="CrawlRequestConsumer",
-            daemon=True,
-        )
-        crawl_request_consumer_thread.start()
-        logger.info("Started CrawlRequestConsumer thread")
-
-        # Start crawl result consumer thread (scaffolded for parse phase)
-        crawl_result_consumer_thread = threading.Thread(
-            target=run_crawl_result_consumer,
-            name="CrawlResultConsumer",
-            daemon=True,
-        )
-        crawl_result_consumer_thread.start()
-        logger.info("Started CrawlResultConsumer thread")
-
-        # Start run status consumer thread
-        run_status_consumer_thread = threading.Thread(
-            target=run_run_status_consumer,
-            name="RunStatusConsumer",
-            daemon=True,
-        )
-        run_status_consumer_thread.start()
-        logger.info("Started RunStatusConsumer thread")
-
-        # Start parse result consumer thread
-        parse_result_consumer_thread = threading.Thread(
-            target=run_parse_result_consumer,
-            name="ParseResultConsumer",
-            daemon=True,
-        )
-        parse_result_consumer_thread.start()
-        logger.info("Started ParseResultConsumer thread")
-
-        # Start versioning result consumer thread
-        versioning_result_consumer_thread = threading.Thread(
-            target=run_versioning_result_consumer,
-            name="VersioningResultConsumer",
-            daemon=True,
-        )
-        versioning_result_consumer_thread.start()
-        logger.info("Started VersioningResultConsumer thread")
-
-        # Start delivery result consumer thread (terminal stage)
-        delivery_result_consumer_thread = threading.Thread(
-            target=run_delivery_result_consumer,
-            name="DeliveryResultConsumer",
-            daemon=True,
-        )
-        delivery_result_consumer_thread.start()
-        logger.info("Started DeliveryResultConsumer thread")
+        if not args.no_router:
+            # Start the pipeline router thread (one consumer for all topics)
+            router_thread = threading.Thread(
+                target=run_pipeline_router,
+                name="PipelineRouter",
+                daemon=True,
+            )
+            router_thread.start()
+            logger.info("Started PipelineRouter thread")
 
         # Run Celery worker in main thread (blocks)
-        run_celery_worker()
+        run_celery_worker(queues, options)
 
         return 0
 
@@ -0,0 +1,93 @@
+"""Pooled HTTP client for crawl tasks.
+
+A single requests.Session per worker process keeps connections alive and
+reuses them across crawls, so repeated fetches from the same regulator hosts
+skip DNS, TCP and TLS setup. Each host gets its own bounded connection pool,
+and gzip/deflate (plus brotli when the brotli package is installed) response
+bodies are decoded transparently by urllib3.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Number of distinct hosts whose pools are kept alive
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "32"))
+# Maximum open connections per host; callers wait for a free one when exceeded
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "10"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+HTTP_USER_AGENT = os.getenv("HTTP_USER_AGENT", "better-comply-crawler/1.0")
+
+# (connect, read) timeout tuple accepted by requests
+HTTP_TIMEOUT = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Create a session with per-host connection pooling and retries."""
+    retry = Retry(
+        total=2,
+        connect=2,
+        read=1,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "User-Agent": HTTP_USER_AGENT,
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        }
+    )
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Get the process-wide pooled HTTP session.
+
+    The session is created lazily and recreated in forked worker processes,
+    which must not share sockets with their parent.
+
+    Returns:
+        Shared requests.Session for the current process
+    """
+    global _session, _session_pid
+
+    if _session is None or _session_pid != os.getpid():
+        with _session_lock:
+            if _session is None or _session_pid != os.getpid():
+                _session = _build_session()
+                _session_pid = os.getpid()
+                logger.info(
+                    "HTTP session initialized (pool_connections=%s, pool_maxsize=%s, "
+                    "accept_encoding=%s)",
+                    HTTP_POOL_CONNECTIONS,
+                    HTTP_POOL_MAXSIZE,
+                    ACCEPT_ENCODING,
+                )
+
+    return _session
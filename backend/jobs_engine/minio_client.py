@@ -1,18 +1,71 @@
-"""MinIO client configuration for job result submission."""
+"""MinIO client configuration for job result submission.
+
+Use ``get_minio_client()`` rather than constructing ``MinIOClient`` directly:
+it returns one thread-safe client per process whose urllib3 connection pool
+(MINIO_POOL_SIZE connections) is reused by every pipeline stage. Buckets known
+to exist are cached process-wide, so puts do not pay a bucket_exists round
+trip each time; the cache is warmed once at worker startup.
+"""
 
 import json
 import os
+import threading
 from datetime import datetime
 from io import BytesIO
+from typing import Optional, Set
 from uuid import UUID
+
+import certifi
+import urllib3
 from minio import Minio
+from minio.commonconfig import CopySource
 from minio.error import S3Error
 
+# Part size for multipart uploads of unknown length (S3 minimum is 5 MiB)
+MINIO_UPLOAD_PART_SIZE = int(os.getenv("MINIO_UPLOAD_PART_SIZE", str(5 * 1024 * 1024)))
+# Maximum pooled connections to the MinIO endpoint per process
+MINIO_POOL_SIZE = int(os.getenv("MINIO_POOL_SIZE", "16"))
+MINIO_CONNECT_TIMEOUT = float(os.getenv("MINIO_CONNECT_TIMEOUT", "5"))
+MINIO_READ_TIMEOUT = float(os.getenv("MINIO_READ_TIMEOUT", "300"))
+
+# Buckets checked when a worker starts
+STARTUP_BUCKETS = ("artifacts",)
+
+# Buckets known to exist; inherited by forked workers since buckets are
+# never deleted by the pipeline
+_known_buckets: Set[str] = set()
+_known_buckets_lock = threading.Lock()
+
+_client: Optional["MinIOClient"] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def _build_http_client() -> urllib3.PoolManager:
+    """Create the pooled HTTP client used to talk to MinIO."""
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=MINIO_CONNECT_TIMEOUT, read=MINIO_READ_TIMEOUT),
+        maxsize=MINIO_POOL_SIZE,
+        block=True,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.getenv("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504],
+        ),
+    )
+
+
 class MinIOClient:
     """MinIO client wrapper for OSINT result submission."""
     
-    def __init__(self):
-        """Initialize MinIO client with environment configuration."""
+    def __init__(self, http_client: Optional[urllib3.PoolManager] = None):
+        """Initialize MinIO client with environment configuration.
+
+        Args:
+            http_client: Optional urllib3 pool to send requests through
+        """
         self.endpoint = os.getenv("MINIO_ENDPOINT", "minio:9000")
         self.access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
         self.secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
@@ -22,7 +75,8 @@ class MinIOClient:
             self.endpoint,
             access_key=self.access_key,
             secret_key=self.secret_key,
-            secure=self.secure
+            secure=self.secure,
+            http_client=http_client,
         )
         
         self.bucket_name = "osint-sink"
@@ -30,6 +84,8 @@ class MinIOClient:
     
     def ensure_bucket_exists(self, bucket_name: str = None) -> bool:
         """Ensure a bucket exists, create if it doesn't.
+
+        Buckets already known to exist are not checked again.
         
         Args:
             bucket_name: Bucket name to check. If None, uses self.bucket_name.
@@ -38,10 +94,13 @@ class MinIOClient:
             True if bucket exists or was created successfully.
         """
         bucket = bucket_name or self.bucket_name
+        if bucket in _known_buckets:
+            return True
         try:
             if not self.client.bucket_exists(bucket):
                 self.client.make_bucket(bucket)
-                return True
+            with _known_buckets_lock:
+                _known_buckets.add(bucket)
             return True
         except S3Error as e:
             print(f"Error ensuring bucket exists: {e}")
@@ -135,6 +194,126 @@ class MinIOClient:
             print(f"Unexpected error uploading artifact: {e}")
             return False
 
+    def upload_stream(
+        self,
+        bucket_name: str,
+        object_key: str,
+        stream: object,
+        content_type: str = "application/octet-stream",
+        part_size: int = MINIO_UPLOAD_PART_SIZE,
+    ) -> bool:
+        """Upload a stream of unknown length to MinIO as a multipart upload.
+
+        The stream is read ``part_size`` bytes at a time, so memory use is
+        bounded by the part size regardless of the object size.
+
+        Args:
+            bucket_name: Target bucket name
+            object_key: Object key/path in bucket
+            stream: File-like object with a read(size) method
+            content_type: MIME type of the content
+            part_size: Size of each uploaded part in bytes
+
+        Returns:
+            True if upload was successful, False otherwise
+        """
+        try:
+            if not self.ensure_bucket_exists(bucket_name):
+                return False
+
+            self.client.put_object(
+                bucket_name=bucket_name,
+                object_name=object_key,
+                data=stream,
+                length=-1,
+                content_type=content_type,
+                part_size=part_size,
+            )
 
-# Global instance for easy access
-minio_client = MinIOClient()
+            print(f"Successfully streamed artifact: s3://{bucket_name}/{object_key}")
+            return True
+
+        except S3Error as e:
+            print(f"MinIO S3 error streaming artifact: {e}")
+            return False
+        except Exception as e:
+            print(f"Unexpected error streaming artifact: {e}")
+            return False
+
+    def move_object(self, bucket_name: str, source_key: str, target_key: str) -> bool:
+        """Move an object within a bucket (server-side copy, then delete).
+
+        Args:
+            bucket_name: Bucket holding the object
+            source_key: Current object key
+            target_key: New object key
+
+        Returns:
+            True if the object was moved, False otherwise
+        """
+        try:
+            self.client.copy_object(
+                bucket_name, target_key, CopySource(bucket_name, source_key)
+            )
+            self.client.remove_object(bucket_name, source_key)
+            return True
+
+        except S3Error as e:
+            print(f"MinIO S3 error moving {source_key} to {target_key}: {e}")
+            return False
+        except Exception as e:
+            print(f"Unexpected error moving {source_key} to {target_key}: {e}")
+            return False
+
+    def delete_object(self, bucket_name: str, object_key: str) -> bool:
+        """Delete an object from MinIO.
+
+        Args:
+            bucket_name: Bucket holding the object
+            object_key: Object key/path in bucket
+
+        Returns:
+            True if the object was deleted, False otherwise
+        """
+        try:
+            self.client.remove_object(bucket_name, object_key)
+            return True
+        except Exception as e:
+            print(f"Error deleting s3://{bucket_name}/{object_key}: {e}")
+            return False
+
+
+def get_minio_client() -> MinIOClient:
+    """Get the process-wide pooled MinIO client.
+
+    The client is created lazily and recreated in forked worker processes,
+    which must not share sockets with their parent.
+
+    Returns:
+        Shared MinIOClient for the current process
+    """
+    global _client, _client_pid
+
+    if _client is None or _client_pid != os.getpid():
+        with _client_lock:
+            if _client is None or _client_pid != os.getpid():
+                _client = MinIOClient(http_client=_build_http_client())
+                _client_pid = os.getpid()
+
+    return _client
+
+
+def warm_bucket_cache(buckets=STARTUP_BUCKETS) -> None:
+    """Check (and create) the pipeline buckets once, filling the bucket cache.
+
+    Args:
+        buckets: Bucket names to check
+    """
+    client = get_minio_client()
+    for bucket in buckets:
+        try:
+            if client.ensure_bucket_exists(bucket):
+                continue
+        except Exception as e:
+            print(f"Error checking MinIO bucket {bucket}: {e}")
+        print(f"MinIO bucket {bucket} unavailable at startup; will retry on first use")
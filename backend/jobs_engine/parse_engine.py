@@ -0,0 +1,437 @@
+"""Process-pool parse engine for CPU-bound HTML and PDF extraction.
+
+Encoding detection, lxml parsing, trafilatura extraction, PDF layout analysis
+and section building are pure CPU work that serializes on the GIL, so parse
+workers hand documents to a warm pool of spawned processes instead of parsing
+inline:
+
+- Each pool process imports trafilatura, lxml and pdfminer and parses a small
+  document once at start-up, so the first real parse does not pay the import
+  cost. A process is replaced after PARSE_ENGINE_MAX_TASKS_PER_CHILD
+  documents.
+- At most PARSE_ENGINE_PROCESSES documents are in flight, one per process,
+  which lets every submitted document start immediately. At most
+  PARSE_ENGINE_MAX_QUEUED callers wait for a slot; beyond that
+  ``ParseEngineBusyError`` is raised and the task is rescheduled.
+- A document must parse within PARSE_ENGINE_TIMEOUT seconds, plus
+  PARSE_ENGINE_PDF_PAGE_TIMEOUT seconds per page for PDFs, whose parse time
+  grows with their page count. PDFs over PARSE_ENGINE_PDF_MAX_PAGES pages are
+  rejected. The limit is enforced inside the pool process by SIGALRM, which
+  keeps the process alive.
+  If a parse is stuck in C code and ignores the alarm, the caller gives up
+  after a short grace period and kills that one process; documents running
+  in the other processes are not affected.
+
+Celery's prefork children are daemonic and may not start processes; there,
+and when PARSE_ENGINE_PROCESSES is 0, documents are parsed inline. Inline
+parses only get a deadline on the main thread, since signals cannot be
+delivered to any other: in a threaded worker (the parse queue's default)
+with PARSE_ENGINE_PROCESSES=0, documents are parsed without a time limit.
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from jobs_engine.schemas.parse_schemas import ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+PARSE_ENGINE_PROCESSES = int(os.getenv("PARSE_ENGINE_PROCESSES", str(os.cpu_count() or 2)))
+PARSE_ENGINE_MAX_QUEUED = int(os.getenv("PARSE_ENGINE_MAX_QUEUED", str(PARSE_ENGINE_PROCESSES * 2)))
+PARSE_ENGINE_QUEUE_TIMEOUT = float(os.getenv("PARSE_ENGINE_QUEUE_TIMEOUT", "120"))
+PARSE_ENGINE_TIMEOUT = float(os.getenv("PARSE_ENGINE_TIMEOUT", "60"))
+PARSE_ENGINE_MAX_TASKS_PER_CHILD = int(os.getenv("PARSE_ENGINE_MAX_TASKS_PER_CHILD", "500"))
+# PDF layout analysis runs at roughly 0.1s per page; the budget leaves headroom
+PARSE_ENGINE_PDF_PAGE_TIMEOUT = float(os.getenv("PARSE_ENGINE_PDF_PAGE_TIMEOUT", "0.25"))
+PARSE_ENGINE_PDF_MAX_PAGES = int(os.getenv("PARSE_ENGINE_PDF_MAX_PAGES", "5000"))
+# Extra seconds the caller waits for a pool process to honour its own alarm
+PARSE_ENGINE_KILL_GRACE = 10.0
+
+_WARMUP_HTML = "<html><body><h1>Warm-up</h1><p>Pool process warm-up document.</p></body></html>"
+
+
+class ParseTimeoutError(Exception):
+    """A document took longer than its parse deadline."""
+
+
+class ParseEngineBusyError(Exception):
+    """Too many documents are already waiting for the parse engine."""
+
+
+class _DeadlineExceeded(BaseException):
+    """Raised by the SIGALRM handler.
+
+    Not an Exception, so the ``except Exception`` blocks in trafilatura and
+    the parsers cannot swallow it.
+    """
+
+
+def _parse(
+    content_bytes: bytes,
+    source_url: str,
+    headers: Optional[Dict[str, str]],
+    selectors: Optional[Dict[str, Any]] = None,
+    source_kind: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Decode and parse a document as HTML or PDF.
+
+    Returns:
+        Tuple of (ParsedDocument as dict, encoding info dict)
+    """
+    from jobs_engine.utils.html_parser import detect_encoding, parse_html_to_sections
+    from jobs_engine.utils.pdf_parser import is_pdf, parse_pdf_to_sections
+
+    headers = {key.lower(): value for key, value in (headers or {}).items()}
+    if is_pdf(headers.get("content-type"), content_bytes, source_kind):
+        if selectors:
+            logger.info(f"Ignoring subscription selectors for PDF {source_url}")
+        parsed_doc = parse_pdf_to_sections(content_bytes, source_url)
+        encoding_info = {
+            "encoding": None,
+            "encoding_method": "pdf",
+            "encoding_confidence": None,
+        }
+        return parsed_doc.model_dump(), encoding_info
+
+    encoding, encoding_method, confidence = detect_encoding(headers or {}, content_bytes)
+    html_text = content_bytes.decode(encoding, errors="replace")
+    parsed_doc = parse_html_to_sections(html_text, source_url, content_bytes, selectors)
+    encoding_info = {
+        "encoding": encoding,
+        "encoding_method": encoding_method,
+        "encoding_confidence": confidence,
+    }
+    return parsed_doc.model_dump(), encoding_info
+
+
+def _document_deadline(
+    content_bytes: bytes,
+    headers: Optional[Dict[str, str]],
+    source_kind: Optional[str],
+    timeout: float,
+) -> float:
+    """Parse deadline of a document: the base timeout, scaled by page count for PDFs.
+
+    Raises:
+        ValueError: If a PDF has more than PARSE_ENGINE_PDF_MAX_PAGES pages
+    """
+    from jobs_engine.utils.pdf_parser import count_pdf_pages, is_pdf
+
+    headers = {key.lower(): value for key, value in (headers or {}).items()}
+    if not is_pdf(headers.get("content-type"), content_bytes, source_kind):
+        return timeout
+    pages = count_pdf_pages(content_bytes)
+    if pages > PARSE_ENGINE_PDF_MAX_PAGES:
+        raise ValueError(
+            f"PDF has {pages} pages, more than the {PARSE_ENGINE_PDF_MAX_PAGES} page limit"
+        )
+    return timeout + pages * PARSE_ENGINE_PDF_PAGE_TIMEOUT
+
+
+def _parse_with_deadline(
+    content_bytes: bytes,
+    source_url: str,
+    headers: Optional[Dict[str, str]],
+    selectors: Optional[Dict[str, Any]],
+    source_kind: Optional[str],
+    timeout: float,
+    on_deadline: Optional[Callable[[float], None]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run ``_parse`` under a SIGALRM deadline.
+
+    The alarm is first set to ``timeout``, which also bounds counting the
+    pages of a PDF; it is then extended to the document's full deadline,
+    which is reported to ``on_deadline``.
+
+    Signals can only be handled on the main thread; elsewhere (inline parsing
+    in a threaded worker) the document is parsed without a deadline.
+
+    Raises:
+        ParseTimeoutError: If the deadline passes, even when the parse
+            itself caught the alarm and returned or raised something else
+    """
+    if timeout <= 0 or threading.current_thread() is not threading.main_thread():
+        return _parse(content_bytes, source_url, headers, selectors, source_kind)
+
+    expired = False
+    deadline = timeout
+
+    def _on_alarm(signum, frame):
+        nonlocal expired
+        expired = True
+        raise _DeadlineExceeded()
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        deadline = _document_deadline(content_bytes, headers, source_kind, timeout)
+        if deadline > timeout:
+            remaining, _ = signal.getitimer(signal.ITIMER_REAL)
+            signal.setitimer(signal.ITIMER_REAL, remaining + deadline - timeout)
+            if on_deadline is not None:
+                on_deadline(deadline)
+        result = _parse(content_bytes, source_url, headers, selectors, source_kind)
+    except _DeadlineExceeded:
+        raise ParseTimeoutError(f"Parsing {source_url} exceeded {deadline}s") from None
+    except Exception as e:
+        # The parser wraps its errors, so check the flag rather than the type
+        if expired:
+            raise ParseTimeoutError(f"Parsing {source_url} exceeded {deadline}s") from e
+        raise
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+    if expired:
+        # A bare except in the parsing stack ate the alarm
+        raise ParseTimeoutError(f"Parsing {source_url} exceeded {deadline}s")
+    return result
+
+
+def _warm_worker() -> None:
+    """Preload the parsing stack in a fresh pool process."""
+    try:
+        import pdfminer.high_level  # noqa: F401
+
+        _parse(_WARMUP_HTML.encode("utf-8"), "warmup://", {"content-type": "text/html; charset=utf-8"})
+    except Exception as e:
+        logger.warning(f"Parse engine warm-up failed in pid {os.getpid()}: {e}")
+
+
+def _worker_main(conn) -> None:
+    """Pool process loop: parse documents received on the pipe until None."""
+    _warm_worker()
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        def _report_deadline(seconds: float) -> None:
+            conn.send(("deadline", seconds))
+
+        try:
+            reply = ("ok", _parse_with_deadline(*job, on_deadline=_report_deadline))
+        except Exception as e:
+            reply = ("error", e)
+        try:
+            conn.send(reply)
+        except Exception:
+            # The exception did not pickle
+            conn.send(("error", ValueError(str(reply[1]))))
+
+
+class _Worker:
+    """One spawned pool process and the pipe it receives documents on."""
+
+    def __init__(self):
+        # spawn: forking a threaded worker can copy held locks
+        context = multiprocessing.get_context("spawn")
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn,), name="parse-engine", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+
+    def run(self, job: Tuple, wait: float) -> Tuple[str, Any]:
+        """Send a job and wait for its reply.
+
+        ``wait`` is extended when the process reports a longer deadline for
+        the document.
+
+        Returns:
+            Tuple of ("ok", result) or ("error", exception)
+
+        Raises:
+            multiprocessing.TimeoutError: If no reply arrives in time
+            EOFError: If the process died
+        """
+        self.tasks += 1
+        self.conn.send(job)
+        while True:
+            if not self.conn.poll(wait):
+                raise multiprocessing.TimeoutError()
+            status, value = self.conn.recv()
+            if status != "deadline":
+                return status, value
+            wait = value + PARSE_ENGINE_KILL_GRACE
+
+    def stop(self) -> None:
+        """Ask the process to exit after its current job."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(PARSE_ENGINE_KILL_GRACE)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+_idle: List[_Worker] = []
+_idle_pid = None
+_workers_lock = threading.Lock()
+
+_slots = threading.BoundedSemaphore(max(PARSE_ENGINE_PROCESSES, 1))
+_queued = 0
+_queued_lock = threading.Lock()
+
+_warned_no_deadline = False
+
+
+def _checkout_worker() -> _Worker:
+    """Take an idle pool process, starting the pool on first use in this process.
+
+    The caller must hold a slot, which keeps the number of processes at
+    PARSE_ENGINE_PROCESSES.
+    """
+    global _idle, _idle_pid
+
+    with _workers_lock:
+        if _idle_pid != os.getpid():
+            # Processes inherited from a parent are not ours to use
+            _idle = [_Worker() for _ in range(PARSE_ENGINE_PROCESSES)]
+            _idle_pid = os.getpid()
+            logger.info(f"Started parse engine pool with {PARSE_ENGINE_PROCESSES} processes")
+        if _idle:
+            return _idle.pop()
+    # Only after a failed replacement
+    return _Worker()
+
+
+def _checkin_worker(worker: _Worker, healthy: bool = True) -> None:
+    """Return a pool process to the idle list.
+
+    A process that had to be killed, or has parsed
+    PARSE_ENGINE_MAX_TASKS_PER_CHILD documents, is replaced by a fresh one.
+    """
+    if not healthy:
+        worker.kill()
+        worker = _Worker()
+    elif PARSE_ENGINE_MAX_TASKS_PER_CHILD and worker.tasks >= PARSE_ENGINE_MAX_TASKS_PER_CHILD:
+        worker.stop()
+        worker = _Worker()
+    with _workers_lock:
+        if _idle_pid == os.getpid():
+            _idle.append(worker)
+            return
+    worker.stop()
+
+
+def shutdown_parse_engine() -> None:
+    """Stop the idle pool processes, if any were started in this process."""
+    global _idle
+
+    with _workers_lock:
+        if _idle_pid != os.getpid():
+            return
+        workers, _idle = _idle, []
+    for worker in workers:
+        worker.stop()
+
+
+def _use_pool() -> bool:
+    return PARSE_ENGINE_PROCESSES > 0 and not multiprocessing.current_process().daemon
+
+
+def _acquire_slot() -> None:
+    """Wait for an in-flight slot, bounding the number of waiting callers."""
+    global _queued
+
+    if _slots.acquire(blocking=False):
+        return
+
+    with _queued_lock:
+        if _queued >= PARSE_ENGINE_MAX_QUEUED:
+            raise ParseEngineBusyError(
+                f"Parse engine busy: {PARSE_ENGINE_MAX_QUEUED} documents already queued"
+            )
+        _queued += 1
+    try:
+        if not _slots.acquire(timeout=PARSE_ENGINE_QUEUE_TIMEOUT):
+            raise ParseEngineBusyError(
+                f"Parse engine busy: no slot within {PARSE_ENGINE_QUEUE_TIMEOUT}s"
+            )
+    finally:
+        with _queued_lock:
+            _queued -= 1
+
+
+def parse_document(
+    content_bytes: bytes,
+    source_url: str,
+    headers: Optional[Dict[str, str]] = None,
+    selectors: Optional[Dict[str, Any]] = None,
+    source_kind: Optional[str] = None,
+) -> Tuple[ParsedDocument, Dict[str, Any]]:
+    """Parse raw HTML or PDF bytes into a ParsedDocument.
+
+    Args:
+        content_bytes: Raw document bytes as crawled
+        source_url: Source URL for reference
+        headers: HTTP response headers used for encoding detection
+        selectors: Subscription selectors restricting the parsed content
+            (HTML only)
+        source_kind: Source.kind, used to recognize PDFs served without a
+            usable content-type
+
+    Returns:
+        Tuple of (ParsedDocument, encoding info with encoding,
+        encoding_method and encoding_confidence)
+
+    Raises:
+        ParseTimeoutError: If parsing exceeds the document's deadline
+        ParseEngineBusyError: If too many documents are waiting
+        ValueError: If the document cannot be parsed or is a PDF with too
+            many pages
+    """
+    global _warned_no_deadline
+
+    if not _use_pool():
+        if threading.current_thread() is not threading.main_thread() and not _warned_no_deadline:
+            _warned_no_deadline = True
+            logger.warning(
+                "Parsing inline off the main thread: documents have no parse deadline"
+            )
+        parsed_dict, encoding_info = _parse_with_deadline(
+            content_bytes, source_url, headers, selectors, source_kind, PARSE_ENGINE_TIMEOUT
+        )
+        return ParsedDocument.model_validate(parsed_dict), encoding_info
+
+    job = (content_bytes, source_url, headers, selectors, source_kind, PARSE_ENGINE_TIMEOUT)
+    _acquire_slot()
+    try:
+        worker = _checkout_worker()
+        try:
+            status, value = worker.run(job, PARSE_ENGINE_TIMEOUT + PARSE_ENGINE_KILL_GRACE)
+        except multiprocessing.TimeoutError:
+            # Stuck past its own alarm: replace only this process
+            logger.warning(f"Killing parse engine process {worker.process.pid} stuck on {source_url}")
+            _checkin_worker(worker, healthy=False)
+            raise ParseTimeoutError(f"Parsing {source_url} did not finish within its deadline")
+        except (EOFError, OSError) as e:
+            _checkin_worker(worker, healthy=False)
+            raise ValueError(f"Parse engine process died while parsing {source_url}") from e
+        except BaseException:
+            _checkin_worker(worker, healthy=False)
+            raise
+        _checkin_worker(worker)
+    finally:
+        _slots.release()
+
+    if status == "error":
+        raise value
+    parsed_dict, encoding_info = value
+    return ParsedDocument.model_validate(parsed_dict), encoding_info
@@ -0,0 +1,125 @@
+"""Distributed per-source token-bucket rate limiter.
+
+Every crawl worker draws tokens from a bucket stored in Redis, keyed by
+source and host, so the configured ``Source.rate_limit`` (requests per
+minute) holds for the whole fleet rather than per worker.
+
+A draw always succeeds atomically but may leave the bucket in debt: the
+returned wait is the time until the caller's token becomes available. The
+token is reserved for the caller, so a task that sleeps (or is rescheduled)
+for that long may fetch without drawing again, and concurrent callers are
+spaced out instead of all waking at the same moment.
+
+Wait times are accumulated per source in Redis (see ``get_wait_metrics``).
+"""
+
+import logging
+import os
+from typing import Dict, Optional
+
+from jobs_engine.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of requests that may be sent back to back after idling
+RATE_LIMIT_BURST = int(os.getenv("CRAWL_RATE_LIMIT_BURST", "1"))
+# Waits up to this many seconds are slept inline; longer ones are rescheduled
+RATE_LIMIT_MAX_INLINE_WAIT = float(os.getenv("CRAWL_RATE_LIMIT_MAX_INLINE_WAIT", "5"))
+
+_BUCKET_KEY = "ratelimit:bucket:{source_id}:{host}"
+_METRICS_KEY = "ratelimit:metrics:{source_id}"
+
+# KEYS[1] bucket hash; ARGV[1] refill rate (tokens/s), ARGV[2] capacity.
+# Returns the wait in seconds as a string (Lua numbers are truncated to ints).
+_ACQUIRE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+local wait = 0
+if tokens < 0 then
+    wait = -tokens / rate
+end
+return tostring(wait)
+"""
+
+_acquire_script = None
+
+
+def acquire(source_id: int, host: str, rate_per_minute: Optional[float]) -> float:
+    """Reserve one request token for a source/host pair.
+
+    Args:
+        source_id: Source the request belongs to
+        host: Host the request is sent to
+        rate_per_minute: Allowed requests per minute (may be fractional);
+            falsy disables limiting
+
+    Returns:
+        Seconds the caller must wait before sending the request (0 if it may
+        proceed immediately). Returns 0 when Redis is unreachable so crawling
+        is not blocked by the limiter itself.
+    """
+    global _acquire_script
+
+    if not rate_per_minute or rate_per_minute <= 0:
+        return 0.0
+
+    try:
+        client = get_redis()
+        if _acquire_script is None:
+            _acquire_script = client.register_script(_ACQUIRE_SCRIPT)
+        wait = float(
+            _acquire_script(
+                keys=[_BUCKET_KEY.format(source_id=source_id, host=host)],
+                args=[rate_per_minute / 60.0, max(RATE_LIMIT_BURST, 1)],
+                client=client,
+            )
+        )
+    except Exception as e:
+        logger.warning(f"Rate limiter unavailable, not throttling source {source_id}: {e}")
+        return 0.0
+
+    _record_wait(source_id, wait)
+    return wait
+
+
+def _record_wait(source_id: int, wait: float) -> None:
+    """Accumulate wait-time counters for a source."""
+    try:
+        key = _METRICS_KEY.format(source_id=source_id)
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.hincrby(key, "acquired", 1)
+        if wait > 0:
+            pipe.hincrby(key, "throttled", 1)
+            pipe.hincrbyfloat(key, "wait_seconds_total", wait)
+            if wait > RATE_LIMIT_MAX_INLINE_WAIT:
+                pipe.hincrby(key, "rescheduled", 1)
+        pipe.execute()
+    except Exception as e:
+        logger.debug(f"Failed to record rate limit metrics for source {source_id}: {e}")
+
+
+def get_wait_metrics(source_id: int) -> Dict[str, float]:
+    """Get accumulated token wait metrics for a source.
+
+    Args:
+        source_id: Source to report on
+
+    Returns:
+        Dictionary with acquired, throttled and rescheduled request counts and
+        the total seconds spent waiting for tokens
+    """
+    raw = get_redis().hgetall(_METRICS_KEY.format(source_id=source_id))
+    return {
+        "acquired": int(raw.get("acquired", 0)),
+        "throttled": int(raw.get("throttled", 0)),
+        "rescheduled": int(raw.get("rescheduled", 0)),
+        "wait_seconds_total": float(raw.get("wait_seconds_total", 0.0)),
+    }
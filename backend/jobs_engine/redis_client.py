@@ -0,0 +1,59 @@
+"""Shared Redis client for coordination state across workers.
+
+Celery already requires Redis as its broker; the same instance also holds
+small pieces of state that every crawl worker must agree on (rate-limit
+buckets, cached robots.txt rules). One connection pool is kept per worker
+process.
+"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+import redis
+
+from jobs_engine.celeryconfig import redis_host, redis_port
+
+logger = logging.getLogger(__name__)
+
+# Database index for coordination state (the Celery broker uses db 0)
+REDIS_STATE_DB = int(os.getenv("REDIS_STATE_DB", "2"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2.0"))
+
+_client: Optional[redis.Redis] = None
+_client_pid: Optional[int] = None
+_client_lock = threading.Lock()
+
+
+def get_redis() -> redis.Redis:
+    """Get the process-wide Redis client.
+
+    The client is created lazily and recreated in forked worker processes,
+    which must not share sockets with their parent.
+
+    Returns:
+        Shared redis.Redis client for the current process
+    """
+    global _client, _client_pid
+
+    if _client is None or _client_pid != os.getpid():
+        with _client_lock:
+            if _client is None or _client_pid != os.getpid():
+                _client = redis.Redis(
+                    host=redis_host,
+                    port=int(redis_port),
+                    db=REDIS_STATE_DB,
+                    socket_timeout=REDIS_SOCKET_TIMEOUT,
+                    socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+                    decode_responses=True,
+                )
+                _client_pid = os.getpid()
+                logger.info(
+                    "Redis state client initialized (%s:%s db=%s)",
+                    redis_host,
+                    redis_port,
+                    REDIS_STATE_DB,
+                )
+
+    return _client
@@ -0,0 +1,144 @@
+"""Robots.txt fetch-and-cache service for crawl tasks.
+
+Rules are looked up in two cache tiers before anything goes over the wire:
+
+1. An in-process LRU of parsed rules (ROBOTS_LOCAL_TTL seconds), so the hot
+   crawl path usually pays only a dict lookup.
+2. The raw robots.txt body in Redis (ROBOTS_CACHE_TTL seconds), shared by
+   every crawl worker so each host's robots.txt is fetched about once per TTL
+   for the whole fleet.
+
+Following RFC 9309, a missing robots.txt (4xx) allows everything. An
+unreachable one (5xx or network error) disallows everything for the shorter
+ROBOTS_ERROR_TTL, after which the fetch is retried.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+from jobs_engine.http_client import HTTP_TIMEOUT, HTTP_USER_AGENT, get_http_session
+from jobs_engine.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_CACHE_TTL = int(os.getenv("ROBOTS_CACHE_TTL", "86400"))
+ROBOTS_ERROR_TTL = int(os.getenv("ROBOTS_ERROR_TTL", "600"))
+ROBOTS_LOCAL_TTL = int(os.getenv("ROBOTS_LOCAL_TTL", "300"))
+ROBOTS_LOCAL_CACHE_SIZE = int(os.getenv("ROBOTS_LOCAL_CACHE_SIZE", "256"))
+ROBOTS_MAX_BYTES = 512 * 1024
+
+_REDIS_KEY = "robots:{origin}"
+_DISALLOW_ALL = "User-agent: *\nDisallow: /\n"
+
+# origin -> (expires_at, parser)
+_local_cache: "OrderedDict[str, Tuple[float, RobotFileParser]]" = OrderedDict()
+_local_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RobotsDecision:
+    """Outcome of a robots.txt check for one URL."""
+
+    allowed: bool
+    crawl_delay: Optional[float] = None
+
+
+def _fetch_robots(origin: str) -> Tuple[str, int]:
+    """Fetch robots.txt for an origin.
+
+    Returns:
+        Tuple of (robots.txt body, seconds to cache it for)
+    """
+    robots_url = f"{origin}/robots.txt"
+    try:
+        response = get_http_session().get(robots_url, timeout=HTTP_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"robots.txt unreachable at {robots_url}: {e}")
+        return _DISALLOW_ALL, ROBOTS_ERROR_TTL
+
+    if response.status_code >= 500:
+        logger.warning(f"robots.txt unavailable at {robots_url}: HTTP {response.status_code}")
+        return _DISALLOW_ALL, ROBOTS_ERROR_TTL
+    if response.status_code >= 400:
+        return "", ROBOTS_CACHE_TTL
+
+    body = response.content[:ROBOTS_MAX_BYTES].decode("utf-8", errors="replace")
+    return body, ROBOTS_CACHE_TTL
+
+
+def _load_robots(origin: str) -> RobotFileParser:
+    """Load parsed rules for an origin from Redis, fetching on a miss."""
+    key = _REDIS_KEY.format(origin=origin)
+    body = None
+    try:
+        body = get_redis().get(key)
+    except Exception as e:
+        logger.warning(f"Robots cache unavailable, fetching directly: {e}")
+
+    if body is None:
+        body, ttl = _fetch_robots(origin)
+        try:
+            get_redis().set(key, body, ex=ttl)
+        except Exception as e:
+            logger.debug(f"Failed to cache robots.txt for {origin}: {e}")
+        logger.info(f"Fetched robots.txt for {origin} (cached {ttl}s)")
+
+    parser = RobotFileParser()
+    parser.parse(body.splitlines())
+    return parser
+
+
+def get_robots(url: str) -> RobotFileParser:
+    """Get the parsed robots.txt rules governing a URL.
+
+    Args:
+        url: Any URL on the origin of interest
+
+    Returns:
+        Parsed rules for the URL's scheme and host
+    """
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    now = time.monotonic()
+
+    with _local_lock:
+        cached = _local_cache.get(origin)
+        if cached is not None and cached[0] > now:
+            _local_cache.move_to_end(origin)
+            return cached[1]
+
+    parser = _load_robots(origin)
+
+    with _local_lock:
+        _local_cache[origin] = (now + ROBOTS_LOCAL_TTL, parser)
+        _local_cache.move_to_end(origin)
+        while len(_local_cache) > ROBOTS_LOCAL_CACHE_SIZE:
+            _local_cache.popitem(last=False)
+
+    return parser
+
+
+def check_robots(url: str, user_agent: str = HTTP_USER_AGENT) -> RobotsDecision:
+    """Check whether a URL may be crawled and at what pace.
+
+    Args:
+        url: URL about to be fetched
+        user_agent: User agent the rules are evaluated for
+
+    Returns:
+        RobotsDecision with the allow verdict and the Crawl-delay (seconds),
+        if the site declares one
+    """
+    parser = get_robots(url)
+    delay = parser.crawl_delay(user_agent)
+    return RobotsDecision(
+        allowed=parser.can_fetch(user_agent, url),
+        crawl_delay=float(delay) if delay else None,
+    )
@@ -4,18 +4,29 @@ from typing import Dict
 from celery.utils.log import get_task_logger
 logger = get_task_logger(__name__)
 
+# Queue used when a job type was registered without an explicit queue
+DEFAULT_QUEUE = "jobs"
+
 # Dynamic registry mapping job types to Celery task names
 JOB_TYPE_TO_TASK: Dict[str, str] = {}
 
-def register_task_route(job_type: str, task_name: str) -> None:
-    """Register a mapping from a domain job type to a Celery task name.
+# Dynamic registry mapping job types to the Celery queue of their pipeline stage
+JOB_TYPE_TO_QUEUE: Dict[str, str] = {}
+
+def register_task_route(job_type: str, task_name: str, queue: str = DEFAULT_QUEUE) -> None:
+    """Register a mapping from a domain job type to a Celery task name and queue.
 
     This enables a simple, maintainable way to route incoming job events to
     Celery tasks without hard-coding static dictionaries in code.
     """
     JOB_TYPE_TO_TASK[job_type] = task_name
-    logger.info(f"Registering task {task_name} with job type {job_type}")
+    JOB_TYPE_TO_QUEUE[job_type] = queue
+    logger.info(f"Registering task {task_name} with job type {job_type} on queue {queue}")
 
 def pick_task(job_type: str) -> str | None:
     """Resolve job type to Celery task name."""
     return JOB_TYPE_TO_TASK.get(job_type)
+
+def pick_queue(job_type: str) -> str:
+    """Resolve job type to the Celery queue its task is consumed from."""
+    return JOB_TYPE_TO_QUEUE.get(job_type, DEFAULT_QUEUE)
@@ -59,15 +59,27 @@ class VersioningResultPayload(BaseModel):
     doc_id: int
     version_id: int
     diff_uri: Optional[str]  # NULL for first version
+    parsed_uri: Optional[str] = None
+    section_count: Optional[int] = None
+    change_summary: Optional[Dict[str, int]] = None  # NULL for first version
     run_id: int
     trace_id: str
 
 
 class DeliveryRequestPayload(BaseModel):
-    """Payload for delivery.request events."""
+    """Payload for delivery.request events.
+
+    Claim check: the parsed document itself stays in MinIO and consumers
+    fetch it from parsed_uri when they need the body.
+    """
     doc_id: int
     version_id: int
-    parsed_document: Dict[str, Any]  # Full parsed document JSON
+    parsed_uri: str  # s3://artifacts/parsed/{doc_id}/{content_hash}.json
+    content_hash: str  # SHA256 of the parsed document
+    size_bytes: int  # Stored object size
+    section_count: Optional[int] = None
+    diff_uri: Optional[str] = None  # NULL for first version
+    change_summary: Optional[Dict[str, int]] = None  # Section-level change counts
     run_id: int
     trace_id: str
 
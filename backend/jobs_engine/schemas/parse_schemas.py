@@ -15,15 +15,18 @@ class TableData(BaseModel):
 
 
 class ParsedSection(BaseModel):
-    """A section of parsed HTML content."""
+    """A section of parsed HTML or PDF content."""
 
     id: int
     level: int  # 1-4 for H1-H4
+    parent_id: Optional[int] = None  # id of the enclosing higher-level section
     heading: str
     text: str
     sha256: str  # SHA256 of section text
-    byte_offset_start: int
+    byte_offset_start: int  # into the raw bytes (HTML) or extracted text (PDF)
     byte_offset_end: int
+    page_start: Optional[int] = None  # 1-based page range, PDFs only
+    page_end: Optional[int] = None
     tables: List[TableData] = []
     language: str = "en"
 
@@ -43,7 +46,7 @@ class ParseResultPayload(BaseModel):
 
     doc_id: int
     version_id: int
-    parsed_uri: str  # s3://artifacts/parsed/{doc_id}/{version_id}.json
+    parsed_uri: str  # s3://artifacts/parsed/{doc_id}/{content_hash}.json
     section_count: int
     run_id: int
     trace_id: str
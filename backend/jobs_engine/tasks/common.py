@@ -29,6 +29,7 @@ def simple_task(
         name: Celery task name (dotted path, e.g. "tasks.example.echo")
         queue: Queue name (default "default")
         job_type: If provided, register this domain job type to this task name
+            and queue
         base: Celery base task class (default BaseTask)
         bind: Whether to bind self (default False)
         **task_kwargs: Additional Celery @task kwargs
@@ -41,7 +42,7 @@ def simple_task(
         task = app.task(name=name, queue=queue, base=base, bind=bind, **task_kwargs)(func)
         logger.info(f"Registering task {name} with job type {job_type}")
         if job_type:
-            register_task_route(job_type, name)
+            register_task_route(job_type, name, queue=queue)
         return task
 
     return wrapper
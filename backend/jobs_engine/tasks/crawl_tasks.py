@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
+import os
+import time
 import traceback
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
 from uuid import uuid4
 
-import requests
-
 from jobs_engine.tasks.common import simple_task
-from jobs_engine.minio_client import MinIOClient
+from jobs_engine.http_client import HTTP_TIMEOUT, get_http_session
+from jobs_engine.minio_client import MINIO_UPLOAD_PART_SIZE, get_minio_client
+from jobs_engine.parse_engine import ParseEngineBusyError
+from jobs_engine.rate_limiter import RATE_LIMIT_MAX_INLINE_WAIT, acquire as acquire_rate_limit
+from jobs_engine.robots import check_robots
+from jobs_engine.utils.hashing_stream import HashingChunkReader
 from models.artifact import Artifact
+from models.document import Document
 from models.subscription import Subscription
-from models.source import Source
+from models.source import RobotsMode, Source
 from models.run import Run
 from events.kafka_emitter import emit_event
 from events.run_status_emitter import (
@@ -27,10 +33,15 @@ from database.sync import SessionLocalSync
 
 logger = logging.getLogger(__name__)
 
+# Size of each read from a streamed HTTP response body
+CRAWL_READ_CHUNK_SIZE = int(os.getenv("CRAWL_READ_CHUNK_SIZE", str(64 * 1024)))
+# Seconds before a parse turned away by a busy parse engine runs again
+PARSE_BUSY_RETRY_DELAY = float(os.getenv("PARSE_BUSY_RETRY_DELAY", "30"))
+
 
 @simple_task(
     name="jobs_engine.tasks.crawl_tasks.handle_subscription_scheduled",
-    queue="jobs",
+    queue="crawl",
     job_type="subs.schedule"
 )
 def handle_subscription_scheduled(
@@ -118,9 +129,170 @@ def handle_subscription_scheduled(
         raise
 
 
+def _complete_unchanged_crawl(
+    artifact: Artifact, status: str, url: str, run_id: int, trace_id: str
+) -> Dict[str, Any]:
+    """Complete a run whose source did not change since its latest artifact.
+
+    There is nothing new to parse, version or deliver, so instead of emitting
+    crawl.result the run is marked completed with a lightweight result that
+    points at the reused artifact.
+
+    Args:
+        artifact: Latest artifact for the URL, reused as-is
+        status: Result status ("not_modified" or "unchanged")
+        url: The crawled URL
+        run_id: The run ID
+        trace_id: Trace ID for provenance tracking
+
+    Returns:
+        Dictionary with the unchanged crawl result
+    """
+    result = {
+        "status": status,
+        "artifact_id": artifact.id,
+        "blob_uri": artifact.blob_uri,
+        "fetch_hash": artifact.fetch_hash,
+        "source_url": url,
+        "run_id": run_id,
+        "trace_id": trace_id,
+    }
+    logger.info(f"Reusing artifact_id={artifact.id} for {url} ({status})")
+    emit_run_completed(run_id, trace_id, result)
+    return result
+
+
+def _run_selectors(db, run_id: int) -> Optional[Dict[str, Any]]:
+    """Selectors of the subscription a run belongs to (None without one)."""
+    run = db.get(Run, run_id)
+    if run is None or run.subscription_id is None:
+        return None
+    subscription = db.get(Subscription, run.subscription_id)
+    return subscription.selectors if subscription else None
+
+
+def _artifact_parsed(db, artifact: Artifact, run_id: int) -> bool:
+    """Whether the run's document was last confirmed from an artifact.
+
+    A crawl may only stop at unchanged content when the artifact holding it
+    made it through parsing and versioning with the selectors of this run's
+    subscription; after a failed parse, or for a new or edited selector spec,
+    the content has to be parsed again.
+
+    Args:
+        db: Open database session
+        artifact: Latest artifact for the URL
+        run_id: The run ID, whose subscription selects the document
+
+    Returns:
+        True if Document.latest_artifact_id points at the artifact
+    """
+    from jobs_engine.utils.content_selectors import selectors_hash
+
+    doc = (
+        db.query(Document)
+        .filter_by(
+            source_url=artifact.source_url,
+            selectors_hash=selectors_hash(_run_selectors(db, run_id)),
+        )
+        .first()
+    )
+    return doc is not None and doc.latest_artifact_id == artifact.id
+
+
+def _emit_crawl_result(
+    artifact: Artifact,
+    status_code: int,
+    headers: Dict[str, str],
+    source_id: int,
+    run_id: int,
+    trace_id: str,
+) -> Dict[str, Any]:
+    """Emit crawl.result for a stored artifact, triggering the parse stage.
+
+    Args:
+        artifact: The stored artifact
+        status_code: HTTP status of the fetch
+        headers: HTTP response headers of the fetch
+        source_id: The source ID
+        run_id: The run ID
+        trace_id: Trace ID for provenance tracking
+
+    Returns:
+        The crawl.result payload
+    """
+    result_payload = {
+        "artifact_id": artifact.id,
+        "blob_uri": artifact.blob_uri,
+        "content_type": artifact.content_type,
+        "status_code": status_code,
+        "headers": headers,
+        "run_id": run_id,
+        "trace_id": trace_id,
+        "source_url": artifact.source_url,
+        "source_id": source_id,
+    }
+    emit_event("crawl.result", result_payload, topic="crawl.result")
+    return result_payload
+
+
+def _wait_for_rate_limit(
+    source: Source,
+    url: str,
+    task_kwargs: Dict[str, Any],
+    crawl_delay: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """Take a token from the source/host bucket before fetching.
+
+    Short waits are slept inline. Longer ones reschedule the crawl for the
+    moment its reserved token becomes available, so the worker slot is freed
+    instead of blocked and the task does not fail.
+
+    Args:
+        source: Source being crawled (provides rate_limit)
+        url: The URL about to be fetched
+        task_kwargs: Keyword arguments of the current crawl_url call
+        crawl_delay: Robots.txt Crawl-delay in seconds; lowers the rate when
+            it is stricter than Source.rate_limit
+
+    Returns:
+        None if the fetch may proceed now, otherwise the rescheduled result
+    """
+    host = urlsplit(url).hostname or ""
+    rate_per_minute = source.rate_limit
+    if crawl_delay:
+        robots_rate = 60.0 / crawl_delay
+        rate_per_minute = min(rate_per_minute, robots_rate) if rate_per_minute else robots_rate
+    wait = acquire_rate_limit(source.id, host, rate_per_minute)
+    if wait <= 0:
+        return None
+
+    if wait <= RATE_LIMIT_MAX_INLINE_WAIT:
+        logger.info(f"Rate limited: waiting {wait:.2f}s for {host} (source {source.id})")
+        time.sleep(wait)
+        return None
+
+    # The token is already reserved for the rescheduled run
+    crawl_url.apply_async(
+        kwargs={**task_kwargs, "rate_limit_reserved": True},
+        countdown=wait,
+        queue="crawl",
+    )
+    logger.info(
+        f"Rate limited: rescheduled crawl of {url} in {wait:.2f}s (source {source.id})"
+    )
+    return {
+        "status": "rescheduled",
+        "countdown": wait,
+        "source_url": url,
+        "run_id": task_kwargs["run_id"],
+        "trace_id": task_kwargs["trace_id"],
+    }
+
+
 @simple_task(
     name="jobs_engine.tasks.crawl_tasks.crawl_url",
-    queue="jobs",
+    queue="crawl",
     job_type="crawl.url"
 )
 def crawl_url(
@@ -129,12 +301,34 @@ def crawl_url(
     run_id: int,
     crawl_request_id: str,
     trace_id: str,
+    rate_limit_reserved: bool = False,
     **kwargs: Any
 ) -> Dict[str, Any]:
     """Crawl a URL and store the raw content in MinIO.
     
     This is an intermediate stage of the pipeline. The run stays RUNNING
     until the final delivery stage completes.
+
+    Fetches are throttled by a token bucket shared by all crawl workers and
+    keyed by source and host (Source.rate_limit requests per minute). When
+    the next token is too far away the task reschedules itself instead of
+    failing. Depending on Source.robots_mode, robots.txt (served from a
+    local + Redis cache) may block the URL or slow the bucket down to its
+    Crawl-delay.
+
+    The fetch is conditional on the ETag / Last-Modified validators stored on
+    the latest artifact for the URL. A 304 Not Modified response, or a body
+    whose hash matches the latest artifact's fetch_hash, completes the run
+    directly without uploading a blob or emitting crawl.result, provided the
+    latest version of the document for this run's selector spec was confirmed
+    from that artifact. Otherwise (e.g. its parse failed, or the selectors
+    are new or were edited) crawl.result is emitted again for the existing
+    blob.
+
+    The body is streamed and hashed incrementally. Bodies larger than one
+    multipart upload part are streamed to a temporary MinIO key and moved to
+    their content-addressed key once the hash is known, so memory per crawl
+    is bounded by the part size.
     
     Args:
         url: The URL to crawl
@@ -142,6 +336,8 @@ def crawl_url(
         run_id: The run ID
         crawl_request_id: Unique ID for this crawl request
         trace_id: Trace ID for provenance tracking
+        rate_limit_reserved: True when a rate limit token was already
+            reserved for this call (set when the crawl was rescheduled)
         **kwargs: Additional keyword arguments
         
     Returns:
@@ -152,6 +348,9 @@ def crawl_url(
     # Emit run.started event if not already marked as running
     # (First time we execute for this run)
     emit_run_started(run_id, trace_id)
+
+    # Temporary MinIO key of a streamed upload until it has been moved or deleted
+    temp_key = None
     
     try:
         with SessionLocalSync() as db:
@@ -159,40 +358,151 @@ def crawl_url(
             source = db.get(Source, source_id)
             if not source:
                 raise ValueError(f"Source {source_id} not found")
+
+            # Robots rules: ALLOW ignores robots.txt, DISALLOW enforces its
+            # rules and Crawl-delay, CUSTOM only honours the Crawl-delay
+            crawl_delay = None
+            if source.robots_mode in (RobotsMode.DISALLOW, RobotsMode.CUSTOM):
+                robots = check_robots(url)
+                crawl_delay = robots.crawl_delay
+                if source.robots_mode == RobotsMode.DISALLOW and not robots.allowed:
+                    message = f"Blocked by robots.txt: {url}"
+                    logger.warning(message)
+                    emit_run_failed(run_id, trace_id, message)
+                    return {
+                        "status": "blocked_by_robots",
+                        "source_url": url,
+                        "run_id": run_id,
+                        "trace_id": trace_id,
+                    }
+
+            if not rate_limit_reserved:
+                rescheduled = _wait_for_rate_limit(
+                    source,
+                    url,
+                    {
+                        **kwargs,
+                        "url": url,
+                        "source_id": source_id,
+                        "run_id": run_id,
+                        "crawl_request_id": crawl_request_id,
+                        "trace_id": trace_id,
+                    },
+                    crawl_delay=crawl_delay,
+                )
+                if rescheduled is not None:
+                    return rescheduled
             
-            # Fetch the URL
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            content = response.content
-            content_type = response.headers.get("content-type", "application/octet-stream")
-            status_code = response.status_code
-            
-            # Compute SHA256 hash of content
-            content_hash = hashlib.sha256(content).hexdigest()
-            
-            # Upload to MinIO
-            minio = MinIOClient()
-            
-            # Create path: raw/{source_id}/{yyyy}/{mm}/{dd}/{sha256}.bin
-            now = datetime.now(timezone.utc)
-            object_key = (
-                f"raw/{source_id}/{now.year:04d}/{now.month:02d}/{now.day:02d}/"
-                f"{content_hash}.bin"
+            # Latest artifact for this URL carries the validators of the last fetch
+            previous_artifact = (
+                db.query(Artifact)
+                .filter(Artifact.source_url == url)
+                .order_by(Artifact.id.desc())
+                .first()
             )
-            
-            success = minio.upload_artifact(
-                bucket_name="artifacts",
-                object_key=object_key,
-                data=content,
-                content_type=content_type,
+            conditional_headers = {}
+            if previous_artifact is not None:
+                if previous_artifact.etag:
+                    conditional_headers["If-None-Match"] = previous_artifact.etag
+                if previous_artifact.last_modified:
+                    conditional_headers["If-Modified-Since"] = previous_artifact.last_modified
+
+            # Fetch the URL over the pooled keep-alive session, streaming the body
+            response = get_http_session().get(
+                url, headers=conditional_headers, timeout=HTTP_TIMEOUT, stream=True
             )
-            
+            try:
+                if response.status_code == 304 and previous_artifact is not None:
+                    if _artifact_parsed(db, previous_artifact, run_id):
+                        logger.info(f"Source not modified (304): {url}")
+                        return _complete_unchanged_crawl(
+                            previous_artifact, "not_modified", url, run_id, trace_id
+                        )
+                    # The last fetch never got versioned: parse its blob again
+                    logger.info(
+                        f"Source not modified (304), re-parsing unversioned "
+                        f"artifact_id={previous_artifact.id}: {url}"
+                    )
+                    return _emit_crawl_result(
+                        previous_artifact, response.status_code, dict(response.headers),
+                        source_id, run_id, trace_id,
+                    )
+
+                response.raise_for_status()
+
+                content_type = response.headers.get("content-type", "application/octet-stream")
+                status_code = response.status_code
+
+                # Hash the body incrementally while reading it; bodies that fit
+                # in one upload part are buffered, larger ones are streamed
+                reader = HashingChunkReader(
+                    response.iter_content(chunk_size=CRAWL_READ_CHUNK_SIZE)
+                )
+                fits_in_buffer = reader.fill(MINIO_UPLOAD_PART_SIZE)
+
+                minio = get_minio_client()
+
+                # Create path: raw/{source_id}/{yyyy}/{mm}/{dd}/{sha256}.bin
+                now = datetime.now(timezone.utc)
+                key_prefix = (
+                    f"raw/{source_id}/{now.year:04d}/{now.month:02d}/{now.day:02d}/"
+                )
+
+                if not fits_in_buffer:
+                    # The content-addressed key is only known once the last
+                    # part has been read, so upload under a temporary key first
+                    temp_key = f"{key_prefix}{uuid4()}.part"
+                    if not minio.upload_stream(
+                        "artifacts", temp_key, reader, content_type=content_type
+                    ):
+                        raise ValueError("Failed to upload artifact to MinIO")
+
+                content_hash = reader.hexdigest()
+            finally:
+                response.close()
+
+            if previous_artifact is not None and previous_artifact.fetch_hash == content_hash:
+                # Byte-identical to the last fetch: keep the existing blob and
+                # version, only refresh the validators for the next conditional GET
+                if temp_key is not None:
+                    minio.delete_object("artifacts", temp_key)
+                    temp_key = None
+                previous_artifact.etag = response.headers.get("etag")
+                previous_artifact.last_modified = response.headers.get("last-modified")
+                db.commit()
+                if _artifact_parsed(db, previous_artifact, run_id):
+                    logger.info(f"Content unchanged (hash={content_hash}): {url}")
+                    return _complete_unchanged_crawl(
+                        previous_artifact, "unchanged", url, run_id, trace_id
+                    )
+                # The last fetch never got versioned: parse its blob again
+                logger.info(
+                    f"Content unchanged (hash={content_hash}), re-parsing unversioned "
+                    f"artifact_id={previous_artifact.id}: {url}"
+                )
+                return _emit_crawl_result(
+                    previous_artifact, status_code, dict(response.headers),
+                    source_id, run_id, trace_id,
+                )
+
+            object_key = f"{key_prefix}{content_hash}.bin"
+            if temp_key is None:
+                success = minio.upload_artifact(
+                    bucket_name="artifacts",
+                    object_key=object_key,
+                    data=reader.read(),
+                    content_type=content_type,
+                )
+            else:
+                success = minio.move_object("artifacts", temp_key, object_key)
+                if success:
+                    temp_key = None
+
             if not success:
                 raise ValueError("Failed to upload artifact to MinIO")
             
             blob_uri = f"s3://artifacts/{object_key}"
-            logger.info(f"Uploaded to MinIO: {blob_uri}")
+            logger.info(f"Uploaded to MinIO: {blob_uri} ({reader.size} bytes)")
             
             # Create Artifact record
             artifact = Artifact(
@@ -200,6 +510,8 @@ def crawl_url(
                 content_type=content_type,
                 blob_uri=blob_uri,
                 fetch_hash=content_hash,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
                 run_id=run_id,
             )
             db.add(artifact)
@@ -209,19 +521,9 @@ def crawl_url(
             db.commit()
             
             # Emit crawl.result event - triggers next pipeline stage
-            result_payload = {
-                "artifact_id": artifact_id,
-                "blob_uri": blob_uri,
-                "content_type": content_type,
-                "status_code": status_code,
-                "headers": dict(response.headers),
-                "run_id": run_id,
-                "trace_id": trace_id,
-                "source_url": url,
-                "source_id": source_id,
-            }
-            
-            emit_event("crawl.result", result_payload, topic="crawl.result")
+            result_payload = _emit_crawl_result(
+                artifact, status_code, dict(response.headers), source_id, run_id, trace_id
+            )
             
             logger.info(
                 f"Successfully crawled and stored: artifact_id={artifact_id}, "
@@ -232,15 +534,102 @@ def crawl_url(
     
     except Exception as e:
         logger.exception(f"Error crawling URL {url}: {e}")
+        if temp_key is not None:
+            # Don't leave the partial/unmoved streamed upload behind
+            get_minio_client().delete_object("artifacts", temp_key)
         # Emit run.failed event - halts the pipeline
         # Don't emit crawl.result on failure - pipeline stops
         emit_run_failed(run_id, trace_id, str(e), traceback.format_exc())
         raise
 
 
+def _parse_context(run_id: int, source_id: Optional[int]) -> Dict[str, Any]:
+    """Look up the subscription selectors and source kind for a parse.
+
+    Args:
+        run_id: The run ID
+        source_id: ID of the source the artifact was crawled for
+
+    Returns:
+        Dict with "selectors" (None for runs without a subscription) and
+        "source_kind" (None if the source is unknown)
+    """
+    with SessionLocalSync() as db:
+        selectors = _run_selectors(db, run_id)
+        source = db.get(Source, source_id) if source_id is not None else None
+        source_kind = source.kind.value if source and source.kind else None
+
+    return {"selectors": selectors, "source_kind": source_kind}
+
+
+def _find_unchanged_version(db, doc, content_hash: str) -> Optional[int]:
+    """Find the latest version of a document if it already holds this content.
+
+    A version whose parsed document was never uploaded (empty parsed_uri) does
+    not count, so its content is parsed and uploaded again.
+
+    Args:
+        db: Open database session
+        doc: The Document
+        content_hash: Content hash of the newly parsed document
+
+    Returns:
+        ID of the latest version, or None if the content has to be versioned
+    """
+    from models.document_version import DocumentVersion
+
+    if doc.latest_version_id is None or doc.latest_content_hash != content_hash:
+        return None
+    latest = db.get(DocumentVersion, doc.latest_version_id)
+    if latest is None or not latest.parsed_uri:
+        return None
+    return latest.id
+
+
+def _complete_unchanged_parse(
+    run_id: int,
+    trace_id: str,
+    doc_id: int,
+    version_id: int,
+    content_hash: str,
+    source_url: str,
+) -> Dict[str, Any]:
+    """Complete a run whose parsed content equals the latest document version.
+
+    There is nothing to version or deliver, so instead of emitting
+    parse.result the run is marked completed.
+
+    Args:
+        run_id: The run ID
+        trace_id: Trace ID for provenance tracking
+        doc_id: Document ID
+        version_id: ID of the reused latest version
+        content_hash: Content hash of the parsed document
+        source_url: Source URL for the artifact
+
+    Returns:
+        Dictionary with the unchanged parse result
+    """
+    result = {
+        "status": "unchanged",
+        "doc_id": doc_id,
+        "version_id": version_id,
+        "content_hash": content_hash,
+        "run_id": run_id,
+        "trace_id": trace_id,
+        "source_url": source_url,
+    }
+    logger.info(
+        f"Parsed content unchanged for doc_id={doc_id}, "
+        f"reusing version_id={version_id}"
+    )
+    emit_run_completed(run_id, trace_id, result)
+    return result
+
+
 @simple_task(
     name="jobs_engine.tasks.crawl_tasks.parse_crawled_content",
-    queue="jobs",
+    queue="parse",
     job_type="parse.content"
 )
 def parse_crawled_content(
@@ -250,12 +639,18 @@ def parse_crawled_content(
     trace_id: str,
     source_url: str = None,
     source_id: int = None,
+    content_type: Optional[str] = None,
     **kwargs: Any
 ) -> Dict[str, Any]:
-    """Parse crawled HTML content and extract structured sections.
+    """Parse crawled HTML or PDF content and extract structured sections.
     
     This is an intermediate stage of the pipeline. The run stays RUNNING
     until the final delivery stage completes.
+
+    A new DocumentVersion is only created when the parsed content hash
+    differs from Document.latest_content_hash; otherwise the run completes
+    here. When the parse engine is too busy to take the document, the task
+    reschedules itself instead of failing the run.
     
     Args:
         artifact_id: ID of the artifact to parse
@@ -263,6 +658,9 @@ def parse_crawled_content(
         run_id: The run ID
         trace_id: Trace ID for provenance tracking
         source_url: Source URL for the artifact
+        source_id: ID of the source the artifact was crawled for
+        content_type: Content-Type header of the crawl response, whose
+            charset takes priority in encoding detection
         **kwargs: Additional keyword arguments
         
     Returns:
@@ -282,94 +680,143 @@ def parse_crawled_content(
             upload_parsed_document,
             upload_raw_metadata,
         )
-        from jobs_engine.utils.html_parser import (
-            detect_encoding,
-            parse_html_to_sections,
-        )
-        from models.document import Document
+        from jobs_engine.parse_engine import parse_document
+        from jobs_engine.utils.content_selectors import selectors_hash
         from models.document_version import DocumentVersion
 
         # Download artifact from MinIO
         logger.info(f"Downloading artifact from {blob_uri}")
         content_bytes = download_artifact(blob_uri)
 
-        # Detect encoding
-        encoding, encoding_method, confidence = detect_encoding({}, content_bytes)
-        html_text = content_bytes.decode(encoding, errors="replace")
+        # Parse HTML or PDF to sections in the parse engine's process pool,
+        # keeping only the content the run's subscription selects
+        headers = {"content-type": content_type} if content_type else {}
+        context = _parse_context(run_id, source_id)
+        parsed_doc, encoding_info = parse_document(
+            content_bytes,
+            source_url,
+            headers,
+            selectors=context["selectors"],
+            source_kind=context["source_kind"],
+        )
 
         logger.info(
-            f"Decoded artifact with {encoding} (method: {encoding_method}, "
-            f"confidence: {confidence})"
+            f"Decoded artifact with {encoding_info['encoding']} "
+            f"(method: {encoding_info['encoding_method']}, "
+            f"confidence: {encoding_info['encoding_confidence']})"
         )
 
-        # Parse HTML to sections
-        parsed_doc = parse_html_to_sections(html_text, source_url, content_bytes)
+        import hashlib
+        import json
+
+        # Content hash ignores fetch_timestamp so refetching identical
+        # content does not look like a change
+        parsed_dict = parsed_doc.model_dump()
+        hashed_fields = {k: v for k, v in parsed_dict.items() if k != "fetch_timestamp"}
+        content_hash = hashlib.sha256(
+            json.dumps(hashed_fields, sort_keys=True).encode()
+        ).hexdigest()
 
-        # Create or get Document
+        # Create or get Document; each selector spec gets its own document,
+        # so narrowed and whole-page content never share a version chain
+        spec_hash = selectors_hash(context["selectors"])
         with SessionLocalSync() as db:
-            # Get or create document
-            doc = db.query(Document).filter_by(source_url=source_url).first()
+            doc = (
+                db.query(Document)
+                .filter_by(source_url=source_url, selectors_hash=spec_hash)
+                .with_for_update()
+                .first()
+            )
             if not doc:
                 doc = Document(
                     source_id=source_id,
                     source_url=source_url,
+                    selectors_hash=spec_hash,
                     published_date=parsed_doc.published_date,
                     language=parsed_doc.language,
                 )
                 db.add(doc)
-                db.flush()
+                db.commit()
                 logger.info(f"Created new Document: id={doc.id}, url={source_url}")
             else:
                 logger.info(f"Using existing Document: id={doc.id}")
+            doc_id = doc.id
 
-            # Create DocumentVersion
-            import hashlib
-            import json
-
-            parsed_dict = parsed_doc.model_dump()
-            parsed_json = json.dumps(parsed_dict, sort_keys=True)
-            content_hash = hashlib.sha256(parsed_json.encode()).hexdigest()
+            unchanged = _find_unchanged_version(db, doc, content_hash)
+            if unchanged is not None:
+                # The artifact is confirmed; later crawls of it can stop early
+                doc.latest_artifact_id = artifact_id
+            db.commit()
 
-            version = DocumentVersion(
-                document_id=doc.id,
-                content_hash=content_hash,
-                run_id=run_id,
-                parsed_uri="",  # Will be updated after upload
-                diff_uri=None,
+        if unchanged is not None:
+            return _complete_unchanged_parse(
+                run_id, trace_id, doc_id, unchanged, content_hash, source_url
             )
-            db.add(version)
-            db.flush()
-            version_id = version.id
 
-            logger.info(f"Created DocumentVersion: id={version_id}")
-
-            db.commit()
-
-        # Upload parsed document to MinIO
-        parsed_uri = upload_parsed_document(doc.id, version_id, parsed_dict)
+        # Upload the parsed document before any version points at it, so a
+        # failed upload leaves the latest-version pointer untouched and the
+        # retry parses the content as changed again
+        parsed_uri = upload_parsed_document(doc_id, content_hash, parsed_dict)
 
         # Upload raw metadata
         raw_metadata = {
             "artifact_id": artifact_id,
             "source_url": source_url,
             "fetch_timestamp": parsed_doc.fetch_timestamp,
-            "encoding": encoding,
-            "encoding_method": encoding_method,
-            "encoding_confidence": confidence,
+            **encoding_info,
             "content_length": len(content_bytes),
         }
         upload_raw_metadata(content_hash, raw_metadata)
 
-        # Update DocumentVersion with parsed_uri
         with SessionLocalSync() as db:
-            version = db.get(DocumentVersion, version_id)
-            if version:
-                version.parsed_uri = parsed_uri
+            # The row lock serializes version creation so the latest-version
+            # pointer cannot be updated concurrently
+            doc = db.query(Document).filter_by(id=doc_id).with_for_update().one()
+
+            # Another parse may have versioned the same content meanwhile
+            unchanged = _find_unchanged_version(db, doc, content_hash)
+            if unchanged is not None:
+                doc.latest_artifact_id = artifact_id
                 db.commit()
+                return _complete_unchanged_parse(
+                    run_id, trace_id, doc_id, unchanged, content_hash, source_url
+                )
+
+            latest = (
+                db.get(DocumentVersion, doc.latest_version_id)
+                if doc.latest_version_id
+                else None
+            )
+            if latest is not None and latest.content_hash == content_hash:
+                # Left without its parsed document by an earlier failed upload
+                latest.parsed_uri = parsed_uri
+                version_id = latest.id
+                logger.info(f"Repaired parsed_uri of DocumentVersion: id={version_id}")
+            else:
+                # Create DocumentVersion chained to the current latest one
+                version = DocumentVersion(
+                    document_id=doc_id,
+                    content_hash=content_hash,
+                    previous_version_id=doc.latest_version_id,
+                    run_id=run_id,
+                    parsed_uri=parsed_uri,
+                    diff_uri=None,
+                )
+                db.add(version)
+                db.flush()
+                version_id = version.id
+
+                doc.latest_version_id = version_id
+                doc.latest_content_hash = content_hash
+
+                logger.info(f"Created DocumentVersion: id={version_id}")
+
+            doc.latest_artifact_id = artifact_id
+            db.commit()
 
         # Emit parse.result event
         result_payload = {
-            "doc_id": doc.id,
+            "doc_id": doc_id,
             "version_id": version_id,
             "parsed_uri": parsed_uri,
             "section_count": len(parsed_doc.sections),
@@ -381,12 +828,40 @@ def parse_crawled_content(
         emit_event("parse.result", result_payload, topic="parse.result")
 
         logger.info(
-            f"Successfully parsed HTML: doc_id={doc.id}, "
+            f"Successfully parsed HTML: doc_id={doc_id}, "
             f"sections={len(parsed_doc.sections)}"
         )
 
         return result_payload
 
+    except ParseEngineBusyError as e:
+        # Back-pressure, not a failure: try again once the engine drains
+        parse_crawled_content.apply_async(
+            kwargs={
+                "artifact_id": artifact_id,
+                "blob_uri": blob_uri,
+                "run_id": run_id,
+                "trace_id": trace_id,
+                "source_url": source_url,
+                "source_id": source_id,
+                "content_type": content_type,
+            },
+            countdown=PARSE_BUSY_RETRY_DELAY,
+            queue="parse",
+        )
+        logger.info(
+            f"{e}: rescheduled parse of artifact {artifact_id} "
+            f"in {PARSE_BUSY_RETRY_DELAY}s"
+        )
+        return {
+            "status": "rescheduled",
+            "countdown": PARSE_BUSY_RETRY_DELAY,
+            "artifact_id": artifact_id,
+            "source_url": source_url,
+            "run_id": run_id,
+            "trace_id": trace_id,
+        }
+
     except Exception as e:
         logger.exception(f"Error parsing HTML artifact {artifact_id}: {e}")
         # Emit run.failed event - halts the pipeline
@@ -396,7 +871,7 @@ def parse_crawled_content(
 
 @simple_task(
     name="jobs_engine.tasks.crawl_tasks.version_document",
-    queue="jobs",
+    queue="version",
     job_type="version.document"
 )
 def version_document(
@@ -405,6 +880,7 @@ def version_document(
     parsed_uri: str,
     run_id: int,
     trace_id: str,
+    section_count: Optional[int] = None,
     **kwargs: Any
 ) -> Dict[str, Any]:
     """Version a parsed document by computing diffs against previous version.
@@ -414,9 +890,9 @@ def version_document(
     
     This task:
     - Fetches the current and previous document versions
-    - Computes JSON Patch RFC 6902 diff (or sets diff_uri=NULL for first version)
-    - Stores diff to MinIO if applicable
-    - Emits versioning.result event
+    - Computes a section-level diff (or sets diff_uri=NULL for first version)
+    - Stores diff to MinIO if applicable and records DiffMetrics on the version
+    - Emits versioning.result event with a section-level change summary
     
     Args:
         doc_id: ID of the document
@@ -424,6 +900,7 @@ def version_document(
         parsed_uri: URI to the parsed content in MinIO
         run_id: The run ID
         trace_id: Trace ID for provenance tracking
+        section_count: Number of sections in the parsed document
         **kwargs: Additional keyword arguments
         
     Returns:
@@ -438,25 +915,29 @@ def version_document(
     
     try:
         import json
-        from jobs_engine.utils.minio_artifact_handler import download_artifact
-        from jobs_engine.utils.diff_generator import compute_json_patch_diff
+        from jobs_engine.utils.minio_artifact_handler import download_artifact, upload_diff
+        from jobs_engine.utils.section_diff import diff_with_metrics, summarize_section_diff
         from models.document_version import DocumentVersion
 
         # Load current (new) parsed document from MinIO
         logger.info(f"Loading parsed document from {parsed_uri}")
-        parsed_json_bytes = download_artifact(parsed_uri)
-        new_parsed_doc = json.loads(parsed_json_bytes.decode('utf-8'))
+        new_parsed_bytes = download_artifact(parsed_uri)
+        new_parsed_doc = json.loads(new_parsed_bytes)
 
         diff_uri = None
+        change_summary = None
+        if section_count is None:
+            section_count = len(new_parsed_doc.get("sections", []))
 
-        # Query for previous version (ordered by created_at DESC, skip current)
+        # Previous version via the chain pointer set when the version was created
         with SessionLocalSync() as db:
+            current_version = db.get(DocumentVersion, version_id)
+            if not current_version:
+                raise ValueError(f"DocumentVersion {version_id} not found")
             previous_version = (
-                db.query(DocumentVersion)
-                .filter(DocumentVersion.document_id == doc_id)
-                .filter(DocumentVersion.id != version_id)  # Exclude current
-                .order_by(DocumentVersion.created_at.desc())
-                .first()
+                db.get(DocumentVersion, current_version.previous_version_id)
+                if current_version.previous_version_id
+                else None
             )
 
             if previous_version:
@@ -466,54 +947,39 @@ def version_document(
                 )
 
                 # Load old parsed document
-                old_parsed_json_bytes = download_artifact(previous_version.parsed_uri)
-                old_parsed_doc = json.loads(old_parsed_json_bytes.decode('utf-8'))
-
-                # Compute JSON Patch RFC 6902 diff
-                patch_operations = compute_json_patch_diff(old_parsed_doc, new_parsed_doc)
+                old_parsed_bytes = download_artifact(previous_version.parsed_uri)
+                old_parsed_doc = json.loads(old_parsed_bytes)
 
-                if patch_operations:
-                    logger.info(
-                        f"Computed {len(patch_operations)} patch operations for "
-                        f"version {version_id}"
-                    )
+                # Compute section-level diff
+                diff, metrics = diff_with_metrics(
+                    old_parsed_doc,
+                    new_parsed_doc,
+                    old_bytes=len(old_parsed_bytes),
+                    new_bytes=len(new_parsed_bytes),
+                )
+                change_summary = summarize_section_diff(diff)
+                logger.info(f"Diff metrics for version {version_id}: {metrics}")
 
+                if diff["operations"]:
                     # Upload diff to MinIO
-                    object_key = f"diffs/{doc_id}/{version_id}.json"
-                    diff_data = json.dumps(patch_operations, indent=2).encode('utf-8')
-                    
-                    from io import BytesIO
-                    from jobs_engine.minio_client import MinIOClient
-
-                    minio = MinIOClient()
-                    data_stream = BytesIO(diff_data)
-                    minio.client.put_object(
-                        bucket_name="artifacts",
-                        object_name=object_key,
-                        data=data_stream,
-                        length=len(diff_data),
-                        content_type="application/json",
-                    )
-
-                    diff_uri = f"s3://artifacts/{object_key}"
-                    logger.info(f"Uploaded diff to {diff_uri}")
+                    diff_uri = upload_diff(doc_id, version_id, diff)
 
-                    # Update DocumentVersion with diff_uri
-                    with SessionLocalSync() as db:
-                        current_version = db.get(DocumentVersion, version_id)
-                        if current_version:
-                            current_version.diff_uri = diff_uri
-                            db.commit()
-                else:
-                    logger.info("No previous version found - this is the first version")
-                    # diff_uri stays NULL for first version
-                    pass
+                # Record diff_uri and metrics on the DocumentVersion
+                current_version.diff_uri = diff_uri
+                current_version.diff_metrics = metrics.to_dict()
+                db.commit()
+            else:
+                logger.info("No previous version found - this is the first version")
+                # diff_uri stays NULL for first version
 
         # Emit versioning.result event
         result_payload = {
             "doc_id": doc_id,
             "version_id": version_id,
             "diff_uri": diff_uri,
+            "parsed_uri": parsed_uri,
+            "section_count": section_count,
+            "change_summary": change_summary,
             "run_id": run_id,
             "trace_id": trace_id,
         }
@@ -536,7 +1002,7 @@ def version_document(
 
 @simple_task(
     name="jobs_engine.tasks.crawl_tasks.deliver_document",
-    queue="jobs",
+    queue="deliver",
     job_type="deliver.document"
 )
 def deliver_document(
@@ -544,6 +1010,9 @@ def deliver_document(
     version_id: int,
     run_id: int,
     trace_id: str,
+    section_count: Optional[int] = None,
+    change_summary: Optional[Dict[str, int]] = None,
+    diff_uri: Optional[str] = None,
     **kwargs: Any
 ) -> Dict[str, Any]:
     """Deliver a versioned document to downstream systems.
@@ -552,17 +1021,24 @@ def deliver_document(
     the entire run transitions to COMPLETED status.
     
     This task:
-    - Fetches the DocumentVersion and loads parsed content from MinIO
+    - Fetches the DocumentVersion and the stored size of its parsed content
     - Creates a DeliveryEvent record to track the delivery
     - Emits delivery.request event for downstream systems to consume
     - Emits delivery.result event to complete the pipeline
     - Updates DeliveryEvent status to COMPLETED
+
+    delivery.request is a claim check: it carries the parsed_uri, content
+    hash and size instead of the document body, which consumers fetch from
+    MinIO when they need it.
     
     Args:
         doc_id: ID of the document
         version_id: ID of the version to deliver
         run_id: The run ID
         trace_id: Trace ID for provenance tracking
+        section_count: Number of sections in the parsed document
+        change_summary: Section-level change counts from versioning
+        diff_uri: URI of the diff against the previous version, if any
         **kwargs: Additional keyword arguments
         
     Returns:
@@ -576,20 +1052,18 @@ def deliver_document(
     emit_run_started(run_id, trace_id)
     
     try:
-        import json
-        from jobs_engine.utils.minio_artifact_handler import download_artifact
+        from jobs_engine.utils.minio_artifact_handler import stat_artifact
         from models.document_version import DocumentVersion
         from models.delivery_event import DeliveryEvent, DeliveryStatus
 
-        # Fetch DocumentVersion and load parsed content
+        # Fetch DocumentVersion and the size of its parsed content
         with SessionLocalSync() as db:
             doc_version = db.get(DocumentVersion, version_id)
             if not doc_version:
                 raise ValueError(f"DocumentVersion {version_id} not found")
 
-            logger.info(f"Loading parsed document from {doc_version.parsed_uri}")
-            parsed_json_bytes = download_artifact(doc_version.parsed_uri)
-            parsed_document = json.loads(parsed_json_bytes.decode('utf-8'))
+            parsed_uri = doc_version.parsed_uri
+            size_bytes = stat_artifact(parsed_uri)
 
             # Create DeliveryEvent record
             delivery_event = DeliveryEvent(
@@ -607,14 +1081,19 @@ def deliver_document(
         delivery_request_payload = {
             "doc_id": doc_id,
             "version_id": version_id,
-            "parsed_document": parsed_document,
+            "parsed_uri": parsed_uri,
+            "content_hash": doc_version.content_hash,
+            "size_bytes": size_bytes,
+            "section_count": section_count,
+            "diff_uri": diff_uri,
+            "change_summary": change_summary,
             "run_id": run_id,
             "trace_id": trace_id,
         }
 
         logger.info(
             f"Emitting delivery.request for doc_id={doc_id}, version_id={version_id} "
-            f"with {len(parsed_document.get('sections', []))} sections"
+            f"({parsed_uri}, {size_bytes} bytes, {section_count} sections)"
         )
         emit_event("delivery.request", delivery_request_payload, topic="delivery.request")
 
@@ -625,7 +1104,7 @@ def deliver_document(
             "status": "COMPLETED",
             "result": {
                 "delivery_event_id": delivery_event_id,
-                "sections_delivered": len(parsed_document.get('sections', [])),
+                "sections_delivered": section_count,
             },
             "run_id": run_id,
             "trace_id": trace_id,
@@ -638,7 +1117,7 @@ def deliver_document(
             delivery_event = db.get(DeliveryEvent, delivery_event_id)
             if delivery_event:
                 delivery_event.status = DeliveryStatus.COMPLETED
-                delivery_event.delivery_uri = doc_version.parsed_uri
+                delivery_event.delivery_uri = parsed_uri
                 db.commit()
                 logger.info(f"Updated DeliveryEvent {delivery_event_id} to COMPLETED")
 
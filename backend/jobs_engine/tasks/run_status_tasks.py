@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 
 @simple_task(
     name="jobs_engine.tasks.run_status_tasks.update_run_status",
-    queue="jobs",
+    queue="status",
     job_type="run.status.update",
 )
 def update_run_status(
@@ -66,6 +66,21 @@ def update_run_status(
                 logger.warning(f"Invalid status: {status}")
                 return {"status": "error", "message": f"Invalid status: {status}"}
 
+            # Late run.started events (several stages emit one) must not
+            # reopen a run that has already reached a terminal state
+            if run_status == RunStatus.RUNNING and run.status in (
+                RunStatus.COMPLETED,
+                RunStatus.FAILED,
+                RunStatus.CANCELLED,
+            ):
+                logger.info(f"Run {run_id} already {run.status.value}; ignoring {status}")
+                return {
+                    "status": "ignored",
+                    "run_id": run_id,
+                    "current_status": run.status.value,
+                    "trace_id": trace_id,
+                }
+
             # Update run status
             run.status = run_status
 
@@ -0,0 +1,176 @@
+"""Local on-disk read-through cache for immutable MinIO artifacts.
+
+Parsed documents, diffs and raw crawl blobs are write-once: diffs are keyed by
+version id, raw blobs by content hash, and parsed documents by document id and
+content hash, with an existing parsed document never uploaded again. A copy on
+local disk therefore never goes stale and needs no invalidation. The cache is shared by all worker processes on a host
+through the filesystem:
+
+- entries are written to a temp file and atomically renamed into place, so
+  readers never observe partial files
+- a hit refreshes the entry's mtime, and when the cache grows beyond
+  ARTIFACT_CACHE_MAX_BYTES the least recently used entries are evicted
+- each process only counts its own writes, so it rescans the directory for
+  the writes of the others after every ARTIFACT_CACHE_RESCAN_BYTES it
+  writes, and before deciding to evict; together, N processes overshoot the
+  budget by at most N * ARTIFACT_CACHE_RESCAN_BYTES
+
+Setting ARTIFACT_CACHE_MAX_BYTES to 0 disables the cache.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_CACHE_DIR = os.getenv(
+    "ARTIFACT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "artifact-cache")
+)
+ARTIFACT_CACHE_MAX_BYTES = int(os.getenv("ARTIFACT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Bytes a process writes before it recounts the whole (shared) directory
+ARTIFACT_CACHE_RESCAN_BYTES = int(
+    os.getenv("ARTIFACT_CACHE_RESCAN_BYTES", str(ARTIFACT_CACHE_MAX_BYTES // 32))
+)
+
+# Object key prefixes whose objects are never rewritten
+IMMUTABLE_PREFIXES = ("parsed/", "diffs/", "raw/")
+
+# Fraction of the size budget kept after an eviction pass
+_EVICT_TARGET_RATIO = 0.8
+
+_size_lock = threading.Lock()
+_approx_size: Optional[int] = None
+_written_since_scan = 0
+
+
+def is_cacheable(object_key: str) -> bool:
+    """Whether an object key refers to a write-once artifact."""
+    return (
+        ARTIFACT_CACHE_MAX_BYTES > 0
+        and object_key.startswith(IMMUTABLE_PREFIXES)
+        and not object_key.endswith(".part")
+    )
+
+
+def _entry_path(object_key: str) -> str:
+    digest = hashlib.sha256(object_key.encode("utf-8")).hexdigest()
+    return os.path.join(ARTIFACT_CACHE_DIR, digest[:2], digest)
+
+
+def get(object_key: str) -> Optional[bytes]:
+    """Read an artifact from the cache.
+
+    Args:
+        object_key: Object key in the artifacts bucket
+
+    Returns:
+        Cached bytes, or None on a miss
+    """
+    if not is_cacheable(object_key):
+        return None
+
+    path = _entry_path(object_key)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.debug(f"Artifact cache read failed for {object_key}: {e}")
+        return None
+
+    logger.debug(f"Artifact cache hit: {object_key} ({len(data)} bytes)")
+    return data
+
+
+def put(object_key: str, data: bytes) -> None:
+    """Store an artifact in the cache.
+
+    Failures are logged and ignored; the cache is only an optimization.
+
+    Args:
+        object_key: Object key in the artifacts bucket
+        data: Decoded artifact bytes
+    """
+    global _approx_size, _written_since_scan
+
+    if not is_cacheable(object_key) or len(data) > ARTIFACT_CACHE_MAX_BYTES:
+        return
+
+    path = _entry_path(object_key)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug(f"Artifact cache write failed for {object_key}: {e}")
+        return
+
+    with _size_lock:
+        if _approx_size is not None:
+            _approx_size += len(data)
+            _written_since_scan += len(data)
+        if (
+            _approx_size is None
+            or _approx_size > ARTIFACT_CACHE_MAX_BYTES
+            or _written_since_scan >= ARTIFACT_CACHE_RESCAN_BYTES
+        ):
+            # Other processes write to (and evict from) the same directory
+            _approx_size = _scan_size()
+            _written_since_scan = 0
+        if _approx_size > ARTIFACT_CACHE_MAX_BYTES:
+            _approx_size = _evict(int(ARTIFACT_CACHE_MAX_BYTES * _EVICT_TARGET_RATIO))
+
+
+def _list_entries():
+    """List (mtime, size, path) for every cache entry."""
+    entries = []
+    for root, _dirs, files in os.walk(ARTIFACT_CACHE_DIR):
+        for name in files:
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+    return entries
+
+
+def _scan_size() -> int:
+    return sum(size for _mtime, size, _path in _list_entries())
+
+
+def _evict(target_bytes: int) -> int:
+    """Delete least recently used entries until the cache fits target_bytes.
+
+    Returns:
+        Size of the cache after eviction
+    """
+    entries = sorted(_list_entries())
+    total = sum(size for _mtime, size, _path in entries)
+    evicted = 0
+    for _mtime, size, path in entries:
+        if total <= target_bytes:
+            break
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        evicted += 1
+
+    logger.info(f"Artifact cache evicted {evicted} entries ({total} bytes remaining)")
+    return total
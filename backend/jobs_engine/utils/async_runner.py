@@ -4,10 +4,14 @@ Provides a clean way to run async functions within Celery tasks
 with proper error handling and logging.
 
 Note: This utility is designed to work with Celery 5.4+ which has native async support.
+It is safe under the solo, threads and prefork pools: the background loop is
+created once per process (guarded by a lock for concurrent threads) and
+recreated in forked children, where the parent's loop thread does not exist.
 """
 
 import asyncio
 import logging
+import os
 import threading
 from typing import Callable, TypeVar, Awaitable
 
@@ -18,29 +22,44 @@ T = TypeVar('T')
 # A single background event loop per worker process
 _background_loop: asyncio.AbstractEventLoop | None = None
 _background_thread: threading.Thread | None = None
+_background_pid: int | None = None
+_background_lock = threading.Lock()
 
 
 def _ensure_background_loop() -> asyncio.AbstractEventLoop:
-    global _background_loop, _background_thread
-    if _background_loop is not None and _background_loop.is_running():
-        return _background_loop
+    global _background_loop, _background_thread, _background_pid
 
-    loop = asyncio.new_event_loop()
+    loop = _background_loop
+    if loop is not None and _background_pid == os.getpid() and loop.is_running():
+        return loop
 
-    def _run_loop(loop_instance: asyncio.AbstractEventLoop) -> None:
-        asyncio.set_event_loop(loop_instance)
-        loop_instance.run_forever()
+    with _background_lock:
+        # Re-check: another thread may have started the loop while we waited
+        if (
+            _background_loop is not None
+            and _background_pid == os.getpid()
+            and _background_loop.is_running()
+        ):
+            return _background_loop
 
-    thread = threading.Thread(target=_run_loop, args=(loop,), name="celery-async-loop", daemon=True)
-    thread.start()
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
 
-    # Wait until loop is running
-    while not loop.is_running():
-        pass
+        def _run_loop(loop_instance: asyncio.AbstractEventLoop) -> None:
+            asyncio.set_event_loop(loop_instance)
+            loop_instance.call_soon(started.set)
+            loop_instance.run_forever()
 
-    _background_loop = loop
-    _background_thread = thread
-    return loop
+        thread = threading.Thread(target=_run_loop, args=(loop,), name="celery-async-loop", daemon=True)
+        thread.start()
+
+        # Wait until loop is running
+        started.wait()
+
+        _background_loop = loop
+        _background_thread = thread
+        _background_pid = os.getpid()
+        return loop
 
 
 def run_async(async_func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
@@ -48,6 +67,7 @@ def run_async(async_func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
     
     Schedules the coroutine onto a persistent background event loop to avoid
     cross-loop resource usage (e.g., asyncpg connections bound to a loop).
+    Safe to call concurrently from several pool threads.
     """
     try:
         loop = _ensure_background_loop()
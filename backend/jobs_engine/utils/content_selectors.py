@@ -0,0 +1,145 @@
+"""Subscription content selectors for narrowing a page before parsing.
+
+``Subscription.selectors`` may name the parts of a page a subscription cares
+about::
+
+    {"css": ["main article", "#regulation-text"], "xpath": ["//div[@id='annex']"]}
+
+Either key may hold a single string or a list. Other keys are ignored, and a
+spec without selectors leaves the page whole.
+
+Compiling CSS and XPath expressions is comparatively expensive, so compiled
+selectors are cached per distinct spec (in each parse engine process), and a
+subscription's rules are compiled once rather than for every document.
+"""
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from cssselect import SelectorError
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+logger = logging.getLogger(__name__)
+
+SELECTOR_CACHE_SIZE = 256
+
+
+def _as_list(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [str(v) for v in value]
+
+
+@lru_cache(maxsize=SELECTOR_CACHE_SIZE)
+def _compile(spec_key: str) -> Tuple[etree.XPath, ...]:
+    """Compile a canonical JSON selector spec into XPath evaluators."""
+    spec = json.loads(spec_key)
+    compiled = []
+    try:
+        for css in _as_list(spec.get("css")):
+            compiled.append(CSSSelector(css, translator="html"))
+        for xpath in _as_list(spec.get("xpath")):
+            compiled.append(etree.XPath(xpath))
+    except (SelectorError, etree.XPathSyntaxError) as e:
+        raise ValueError(f"Invalid subscription selector: {e}")
+    return tuple(compiled)
+
+
+def _canonical_spec(selectors: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Canonical JSON of the selector keys, or None if the spec selects nothing."""
+    if not selectors:
+        return None
+    spec = {key: selectors.get(key) for key in ("css", "xpath") if selectors.get(key)}
+    if not spec:
+        return None
+    return json.dumps(spec, sort_keys=True)
+
+
+def compile_selectors(selectors: Optional[Dict[str, Any]]) -> Tuple[etree.XPath, ...]:
+    """Compile a subscription's selectors, using the cache when possible.
+
+    Args:
+        selectors: Subscription.selectors rule JSON
+
+    Returns:
+        Tuple of compiled selectors (empty if the spec selects nothing)
+
+    Raises:
+        ValueError: If a selector does not compile
+    """
+    spec_key = _canonical_spec(selectors)
+    if spec_key is None:
+        return ()
+    return _compile(spec_key)
+
+
+def selectors_hash(selectors: Optional[Dict[str, Any]]) -> str:
+    """Stable hash of a selector spec, identifying the content it narrows to.
+
+    Documents are kept apart per spec, so narrowed and whole-page content of
+    one URL never share a version chain.
+
+    Args:
+        selectors: Subscription.selectors rule JSON
+
+    Returns:
+        SHA256 hex digest of the canonical spec, or "" for the whole page
+    """
+    spec_key = _canonical_spec(selectors)
+    if spec_key is None:
+        return ""
+    return hashlib.sha256(spec_key.encode("utf-8")).hexdigest()
+
+
+def apply_selectors(
+    tree: lxml_html.HtmlElement, selectors: Optional[Dict[str, Any]]
+) -> Tuple[lxml_html.HtmlElement, List[lxml_html.HtmlElement]]:
+    """Prune a parsed page to the subtrees matched by the selectors.
+
+    Matches are kept in document order; a match nested inside another match
+    is covered by its ancestor and not repeated. The matched elements are
+    moved into a fresh document, so source line numbers survive for byte
+    offset computation.
+
+    Args:
+        tree: Parsed HTML tree
+        selectors: Subscription.selectors rule JSON
+
+    Returns:
+        Tuple of (new tree holding only the selected content, selected
+        elements in document order), or the original tree and an empty list
+        when there are no selectors or nothing matched
+    """
+    compiled = compile_selectors(selectors)
+    if not compiled:
+        return tree, []
+
+    matched = set()
+    for selector in compiled:
+        matched.update(el for el in selector(tree) if isinstance(el, etree.ElementBase))
+    if not matched:
+        logger.warning("Subscription selectors matched nothing, keeping the whole page")
+        return tree, []
+
+    # Document order, outermost matches only
+    selected = [
+        el
+        for el in tree.iter()
+        if el in matched and not any(anc in matched for anc in el.iterancestors())
+    ]
+
+    root = lxml_html.Element("html")
+    body = etree.SubElement(root, "body")
+    for el in selected:
+        el.tail = None
+        body.append(el)
+
+    logger.info(f"Subscription selectors kept {len(selected)} subtrees")
+    return root, selected
@@ -0,0 +1,65 @@
+"""File-like reader that hashes a byte stream as it is consumed."""
+
+import hashlib
+from typing import Iterable
+
+
+class HashingChunkReader:
+    """Read-only file-like view over an iterator of byte chunks.
+
+    Every chunk pulled from the iterator is fed to a SHA-256 digest, so the
+    hash of the whole stream is known as soon as it has been read once,
+    without keeping the stream in memory. Only the chunks not yet handed to
+    the caller are buffered.
+
+    Example:
+        reader = HashingChunkReader(response.iter_content(chunk_size=65536))
+        minio.client.put_object(bucket, key, reader, length=-1, part_size=...)
+        digest = reader.hexdigest()
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = bytearray()
+        self._eof = False
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+
+    def _pull(self) -> None:
+        """Move the next non-empty chunk from the iterator into the buffer."""
+        for chunk in self._chunks:
+            if chunk:
+                self._sha256.update(chunk)
+                self.size += len(chunk)
+                self._buffer += chunk
+                return
+        self._eof = True
+
+    def fill(self, limit: int) -> bool:
+        """Buffer chunks until more than ``limit`` bytes are held or the stream ends.
+
+        Args:
+            limit: Number of bytes to buffer ahead
+
+        Returns:
+            True if the whole (remaining) stream is now buffered
+        """
+        while not self._eof and len(self._buffer) <= limit:
+            self._pull()
+        return self._eof
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (everything remaining if negative)."""
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            self._pull()
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+    def hexdigest(self) -> str:
+        """SHA-256 hex digest of all bytes pulled from the stream so far."""
+        return self._sha256.hexdigest()
@@ -1,45 +1,165 @@
-"""HTML parsing utilities using trafilatura for regulation content extraction."""
+"""HTML parsing utilities using trafilatura for regulation content extraction.
 
+The HTML is parsed once into an lxml tree that is shared by section
+building, metadata extraction and trafilatura's main-content extraction.
+"""
+
+import codecs
 import hashlib
 import logging
+import os
+import re
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import chardet
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html.defs import empty_tags
 
 from jobs_engine.schemas.parse_schemas import ParsedDocument, ParsedSection
+from jobs_engine.utils.content_selectors import apply_selectors
 
 logger = logging.getLogger(__name__)
 
+# Bytes fed to the statistical detector; the rest of the document is not read
+CHARDET_SAMPLE_BYTES = int(os.getenv("CHARDET_SAMPLE_BYTES", str(64 * 1024)))
+# How far into the document a <meta charset> declaration is looked for
+META_CHARSET_SCAN_BYTES = 4096
+
+# UTF-32 marks first: the UTF-32-LE BOM starts with the UTF-16-LE one
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# <meta charset="x"> and <meta http-equiv="Content-Type" content="...; charset=x">
+_META_CHARSET = re.compile(
+    rb"<meta[^>]*?charset\s*=\s*[\"']?\s*([a-zA-Z0-9_.:-]+)", re.IGNORECASE
+)
+
+HEADING_TAGS = ("h1", "h2", "h3", "h4")
+_SKIPPED_TAGS = {"script", "style", "noscript", "template", "head"}
+# Elements whose boundaries start a new line in section text
+_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "header", "hr", "li",
+    "main", "nav", "ol", "p", "pre", "section", "table", "tbody", "td", "tfoot",
+    "th", "thead", "tr", "ul", "h5", "h6",
+}
+
+
+@lru_cache(maxsize=128)
+def _start_tag(tag: str) -> "re.Pattern[bytes]":
+    """Opening tag of an element in the raw bytes."""
+    return re.compile(rb"<" + re.escape(tag.encode()) + rb"[\s/>]", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _start_or_end_tag(tag: str) -> "re.Pattern[bytes]":
+    """Opening or closing tag of an element; group 1 is "/" for a closing tag."""
+    return re.compile(rb"<(/?)" + re.escape(tag.encode()) + rb"[\s/>]", re.IGNORECASE)
+
+
+def build_tree(html_text: str) -> lxml_html.HtmlElement:
+    """Parse HTML text into an lxml tree.
+
+    The text is handed to libxml2 as UTF-8 bytes, which also sidesteps lxml's
+    refusal to parse str input carrying an XML encoding declaration.
+
+    Args:
+        html_text: Decoded HTML text
+
+    Returns:
+        Root element of the parsed document
+    """
+    parser = lxml_html.HTMLParser(encoding="utf-8")
+    return lxml_html.document_fromstring(html_text.encode("utf-8"), parser=parser)
+
+
+def _visible_text(tree: lxml_html.HtmlElement) -> str:
+    """All text outside script/style elements, one stripped fragment per line."""
+    fragments = tree.xpath("//text()[not(ancestor::script or ancestor::style)]")
+    return "\n".join(f.strip() for f in fragments if f.strip())
+
+
+def _lookup_charset(charset: str) -> Optional[str]:
+    """Return the charset if Python knows the codec, else None."""
+    charset = charset.strip().strip("'\"").lower()
+    if not charset:
+        return None
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        return None
+    return charset
+
+
+def _sniff_meta_charset(content_bytes: bytes) -> Optional[str]:
+    """Find a charset declared by <meta> near the start of the document."""
+    match = _META_CHARSET.search(content_bytes, 0, META_CHARSET_SCAN_BYTES)
+    if not match:
+        return None
+    charset = _lookup_charset(match.group(1).decode("ascii", errors="ignore"))
+    # A declaration readable as ASCII rules out UTF-16/32 (as browsers do)
+    if charset and charset.replace("-", "").startswith(("utf16", "utf32")):
+        return "utf-8"
+    return charset
+
 
 def detect_encoding(headers: Dict[str, str], content_bytes: bytes) -> Tuple[str, str, float]:
-    """Detect encoding from content-type header or chardet fallback.
+    """Detect the encoding of an HTML document.
+
+    Sources are tried cheapest and most authoritative first: byte order mark,
+    content-type header charset, <meta> charset, then a UTF-8 validity check
+    and chardet over the first CHARDET_SAMPLE_BYTES only, so detection cost
+    does not grow with the document.
 
     Args:
-        headers: HTTP response headers
+        headers: HTTP response headers (any key case)
         content_bytes: Raw content bytes
 
     Returns:
         Tuple of (encoding, method, confidence)
     """
-    # Try content-type charset first
-    content_type = headers.get("content-type", "").lower()
-    if "charset=" in content_type:
-        charset = content_type.split("charset=")[-1].split(";")[0].strip()
-        try:
-            # Validate encoding by attempting to decode
-            content_bytes.decode(charset)
+    for bom, bom_encoding in _BOMS:
+        if content_bytes.startswith(bom):
+            logger.info(f"Detected encoding from byte order mark: {bom_encoding}")
+            return bom_encoding, "bom", 1.0
+
+    # Try content-type charset
+    headers = {key.lower(): value for key, value in (headers or {}).items()}
+    content_type = headers.get("content-type") or ""
+    if "charset=" in content_type.lower():
+        declared = content_type.lower().split("charset=")[-1].split(";")[0]
+        charset = _lookup_charset(declared)
+        if charset:
             logger.info(f"Detected encoding from content-type: {charset}")
             return charset, "content-type", 1.0
-        except (LookupError, UnicodeDecodeError):
-            logger.warning(f"Invalid charset in content-type: {charset}")
+        logger.warning(f"Invalid charset in content-type: {declared}")
 
-    # Fallback to chardet
+    charset = _sniff_meta_charset(content_bytes)
+    if charset:
+        logger.info(f"Detected encoding from meta charset: {charset}")
+        return charset, "meta", 1.0
+
+    sample = content_bytes[:CHARDET_SAMPLE_BYTES]
+    try:
+        # A sample cut mid-character is still valid UTF-8 when final=False
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        logger.info("Detected encoding from UTF-8 validation of sample")
+        return "utf-8", "utf-8-sample", 0.99
+    except UnicodeDecodeError:
+        pass
+
+    # Fallback to chardet on the bounded sample
     try:
-        detected = chardet.detect(content_bytes)
-        encoding = detected.get("encoding", "utf-8")
+        detected = chardet.detect(sample)
+        encoding = detected.get("encoding") or "utf-8"
         confidence = detected.get("confidence", 0.0)
         logger.info(f"Detected encoding via chardet: {encoding} (confidence: {confidence})")
         return encoding, "chardet", confidence
@@ -49,7 +169,10 @@ def detect_encoding(headers: Dict[str, str], content_bytes: bytes) -> Tuple[str,
 
 
 def parse_html_to_sections(
-    html_text: str, source_url: str, content_bytes: bytes
+    html_text: str,
+    source_url: str,
+    content_bytes: bytes,
+    selectors: Optional[Dict[str, Any]] = None,
 ) -> ParsedDocument:
     """Parse HTML to structured sections using trafilatura.
 
@@ -57,6 +180,8 @@ def parse_html_to_sections(
         html_text: Decoded HTML text
         source_url: Source URL for reference
         content_bytes: Original bytes for byte offset calculation
+        selectors: Subscription selectors; when given, only the selected
+            subtrees are extracted and sectioned
 
     Returns:
         ParsedDocument with sections and metadata
@@ -67,37 +192,14 @@ def parse_html_to_sections(
     try:
         logger.info(f"Parsing HTML from {source_url}")
         logger.debug(f"HTML content length: {len(html_text)} chars, first 200 chars: {html_text[:200]}")
-        
-        # Extract main content using trafilatura
-        extracted = trafilatura.extract(
-            html_text,
-            include_comments=False,
-            favor_precision=True,
-            include_tables=True,
-        )
-        
-        if not extracted:
-            logger.warning(
-                f"Trafilatura extraction returned empty for {source_url}, "
-                "attempting fallback extraction"
-            )
-            # Fallback: use BeautifulSoup to extract any text
-            soup = BeautifulSoup(html_text, "html.parser")
-            extracted = soup.get_text(separator="\n", strip=True)
-            
-            if not extracted:
-                raise ValueError(
-                    "Could not extract any content from HTML - "
-                    "possibly malformed or non-HTML content"
-                )
 
-        # Parse with BeautifulSoup for structure
-        soup = BeautifulSoup(html_text, "html.parser")
+        # Parse once; every consumer below reuses this tree
+        tree = build_tree(html_text)
 
         # Extract metadata
         published_date = None
         try:
-            metadata = trafilatura.extract_metadata(html_text)
+            metadata = trafilatura.extract_metadata(tree)
             if metadata:
                 # trafilatura.extract_metadata returns a metadata object
                 # Try to get the date attribute
@@ -110,12 +212,43 @@ def parse_html_to_sections(
                     published_date = str(metadata)
         except Exception as e:
             logger.debug(f"Could not extract published date: {e}")
-        
+
         # Extract language (trafilatura's guess_language might not be available)
         language = "en"  # Default to English for regulations
 
-        # Build section tree from headings (H1-H4)
-        sections = _extract_sections(soup, extracted, content_bytes)
+        # Metadata above comes from the whole page; content only from the
+        # subtrees the subscription selects
+        tree, regions = apply_selectors(tree, selectors)
+
+        # Build sections before trafilatura runs: its cleaning step may
+        # prune elements of the tree it is given
+        sections = _extract_sections(tree, content_bytes, regions)
+
+        # Extract main content using trafilatura
+        extracted = trafilatura.extract(
+            tree,
+            include_comments=False,
+            favor_precision=True,
+            include_tables=True,
+        )
+
+        if not extracted:
+            logger.warning(
+                f"Trafilatura extraction returned empty for {source_url}, "
+                "attempting fallback extraction"
+            )
+            # Fallback: use any visible text
+            extracted = _visible_text(tree)
+
+            if not extracted:
+                raise ValueError(
+                    "Could not extract any content from HTML - "
+                    "possibly malformed or non-HTML content"
+                )
+
+        # If no headings found, create single section from extracted text
+        if not sections:
+            sections = [_single_section(extracted, content_bytes)]
 
         # Create parsed document
         parsed_doc = ParsedDocument(
@@ -134,96 +267,230 @@ def parse_html_to_sections(
         raise ValueError(f"Failed to parse HTML: {e}")
 
 
-def _extract_sections(
-    soup: BeautifulSoup, extracted_text: str, content_bytes: bytes
-) -> List[ParsedSection]:
-    """Extract sections from BeautifulSoup parsed HTML.
+def _line_offsets(content_bytes: bytes) -> List[int]:
+    """Byte offset of the start of every line (index 0 is line 1)."""
+    offsets = [0]
+    pos = content_bytes.find(b"\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = content_bytes.find(b"\n", pos + 1)
+    return offsets
 
-    Args:
-        soup: BeautifulSoup parsed HTML
-        extracted_text: Trafilatura extracted text
-        content_bytes: Original bytes for offset calculation
 
-    Returns:
-        List of ParsedSection objects
-    """
-    sections: List[ParsedSection] = []
-    section_id = 1
+class _SectionBuilder:
+    """Accumulates sections while the document is walked once.
 
-    # Find all headings (H1-H4)
-    headings = soup.find_all(["h1", "h2", "h3", "h4"])
+    Section text runs from a heading to the next H1-H4 heading in document
+    order. Byte offsets point at the heading's opening tag in the original
+    bytes: the element's source line narrows the search, and a cursor that
+    only moves forward keeps the total search linear in the document size.
 
-    for heading in headings:
-        try:
-            level = int(heading.name[1])  # h1 -> 1, h2 -> 2, etc.
-            heading_text = heading.get_text().strip()
-
-            if not heading_text:
-                continue
+    When the page was narrowed by subscription selectors, a section does not
+    run past the end of its selected subtree unless text of the next subtree
+    continues it. That end is only looked up for sections that need it, and
+    the scan for the closing tag stops at the next subtree's start, so
+    subtrees whose closing tag was omitted (``<p>``, ``<li>``) do not make
+    the pass quadratic.
+    """
 
-            # Collect text until next heading
-            content_parts = []
-            current = heading.next_sibling
-
-            while current:
-                if current.name in ("h1", "h2", "h3", "h4"):
-                    break
-
-                if isinstance(current, str):
-                    text = current.strip()
-                    if text:
-                        content_parts.append(text)
-                elif hasattr(current, "get_text"):
-                    text = current.get_text().strip()
-                    if text and current.name not in ("script", "style", "meta"):
-                        content_parts.append(text)
-
-                current = current.next_sibling
-
-            section_text = "\n".join(content_parts).strip()
-            if not section_text:
-                section_text = heading_text
-
-            # Compute SHA256
-            section_hash = hashlib.sha256(section_text.encode()).hexdigest()
-
-            # Estimate byte offsets (approximate)
-            byte_start = extracted_text.find(heading_text)
-            byte_end = byte_start + len(heading_text) + len(section_text)
-
-            # Create section
-            section = ParsedSection(
-                id=section_id,
-                level=level,
-                heading=heading_text,
+    def __init__(self, content_bytes: bytes):
+        self.content_bytes = content_bytes
+        self.line_offsets = _line_offsets(content_bytes)
+        self.cursor = 0
+        self.sections: List[ParsedSection] = []
+        self.stack: List[Tuple[int, int]] = []  # (level, section id) of open ancestors
+        self.current: Optional[dict] = None
+        self.parts: List[str] = []
+        self.region: Optional[Tuple[str, int]] = None  # (tag, start) of the selected subtree being walked
+        # Selected subtree the current section ran to the end of, resolved on close
+        self.pending: Optional[dict] = None
+
+    def _locate(self, element: lxml_html.HtmlElement) -> int:
+        """Byte offset of an element's opening tag, never before the cursor."""
+        pattern = _start_tag(element.tag)
+        start = self.cursor
+        line = element.sourceline
+        if line and line <= len(self.line_offsets):
+            start = max(start, self.line_offsets[line - 1])
+        match = pattern.search(self.content_bytes, start)
+        if match is None and start > self.cursor:
+            match = pattern.search(self.content_bytes, self.cursor)
+        if match is not None:
+            self.cursor = match.start()
+        return self.cursor
+
+    def _end_of(self, tag: str, start: int, limit: int) -> int:
+        """Byte offset just past the closing tag of the element opened at start.
+
+        Nested elements of the same tag are counted. The scan stops at limit,
+        which is returned when the closing tag was omitted.
+        """
+        if tag in empty_tags:
+            end = self.content_bytes.find(b">", start, limit)
+            return end + 1 if end != -1 else limit
+        depth = 0
+        for match in _start_or_end_tag(tag).finditer(self.content_bytes, start, limit):
+            depth += -1 if match.group(1) else 1
+            if depth == 0:
+                end = self.content_bytes.find(b">", match.end() - 1, limit)
+                return end + 1 if end != -1 else limit
+        return limit
+
+    def begin_region(self, element: lxml_html.HtmlElement) -> None:
+        """Enter a subtree selected by the subscription selectors."""
+        start = self._locate(element)
+        if self.pending is not None and self.pending["limit"] is None:
+            # The previous subtree ends before this one starts
+            self.pending["limit"] = start
+        self.region = (element.tag, start)
+
+    def end_region(self) -> None:
+        """Leave a selected subtree: an open section ends with it unless more
+        text follows in the next one."""
+        if self.region is not None and self.current is not None:
+            tag, start = self.region
+            self.pending = {"tag": tag, "start": start, "limit": None}
+        self.region = None
+
+    def text(self, fragment: Optional[str]) -> None:
+        if fragment and self.current is not None:
+            self.parts.append(fragment)
+            if not fragment.isspace():
+                self.pending = None
+
+    def newline(self) -> None:
+        if self.current is not None:
+            self.parts.append("\n")
+
+    def open(self, heading: lxml_html.HtmlElement) -> None:
+        """Close the current section and start one for a heading."""
+        level = int(heading.tag[1])  # h1 -> 1, h2 -> 2, etc.
+        heading_text = _normalize(heading.text_content())
+        offset = self._locate(heading)
+        self.close(offset)
+
+        while self.stack and self.stack[-1][0] >= level:
+            self.stack.pop()
+        if not heading_text:
+            return
+
+        section_id = len(self.sections) + 1
+        self.current = {
+            "id": section_id,
+            "parent_id": self.stack[-1][1] if self.stack else None,
+            "level": level,
+            "heading": heading_text,
+            "byte_offset_start": offset,
+        }
+        self.stack.append((level, section_id))
+
+    def close(self, end_offset: int) -> None:
+        """Finish the current section, ending at end_offset or where its
+        selected subtree ended."""
+        if self.current is None:
+            return
+        if self.pending is not None:
+            limit = self.pending["limit"]
+            end_offset = self._end_of(
+                self.pending["tag"],
+                self.pending["start"],
+                len(self.content_bytes) if limit is None else limit,
+            )
+            self.pending = None
+        section_text = _normalize("".join(self.parts)) or self.current["heading"]
+        self.sections.append(
+            ParsedSection(
                 text=section_text,
-                sha256=section_hash,
-                byte_offset_start=max(0, byte_start),
-                byte_offset_end=byte_end,
+                sha256=hashlib.sha256(section_text.encode()).hexdigest(),
+                byte_offset_end=max(end_offset, self.current["byte_offset_start"]),
                 tables=[],
                 language="en",
+                **self.current,
             )
-            sections.append(section)
-            section_id += 1
+        )
+        self.current = None
+        self.parts = []
 
-        except Exception as e:
-            logger.warning(f"Error extracting section from heading {heading}: {e}")
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace within lines and drop blank lines."""
+    return "\n".join(
+        " ".join(line.split()) for line in text.splitlines() if line.strip()
+    )
+
+
+def _extract_sections(
+    tree: lxml_html.HtmlElement,
+    content_bytes: bytes,
+    regions: Sequence[lxml_html.HtmlElement] = (),
+) -> List[ParsedSection]:
+    """Extract sections based on H1-H4 heading hierarchy in a single pass.
+
+    Args:
+        tree: Parsed HTML tree
+        content_bytes: Original bytes for byte offset calculation
+        regions: Subtrees of the tree selected by subscription selectors
+
+    Returns:
+        List of ParsedSection objects (empty if the document has no headings)
+    """
+    builder = _SectionBuilder(content_bytes)
+    regions = set(regions)
+    skipping = None  # element whose subtree is being skipped
+
+    for event, element in etree.iterwalk(tree, events=("start", "end", "comment", "pi")):
+        tag = element.tag
+
+        if event in ("comment", "pi"):
+            # Only the text following a comment belongs to the document
+            if skipping is None:
+                builder.text(element.tail)
             continue
 
-    # If no headings found, create single section from extracted text
-    if not sections and extracted_text:
-        section_hash = hashlib.sha256(extracted_text.encode()).hexdigest()
-        section = ParsedSection(
-            id=1,
-            level=1,
-            heading="Content",
-            text=extracted_text,
-            sha256=section_hash,
-            byte_offset_start=0,
-            byte_offset_end=len(extracted_text),
-            tables=[],
-            language="en",
-        )
-        sections.append(section)
+        if event == "start":
+            if skipping is not None:
+                continue
+            if element in regions:
+                builder.begin_region(element)
+            if tag in HEADING_TAGS:
+                try:
+                    builder.open(element)
+                except Exception as e:
+                    logger.warning(f"Error extracting section from heading {element}: {e}")
+                skipping = element
+            elif tag in _SKIPPED_TAGS:
+                skipping = element
+            else:
+                if tag in _BLOCK_TAGS:
+                    builder.newline()
+                builder.text(element.text)
+            continue
 
-    return sections
+        # end event
+        if skipping is not None:
+            if element is not skipping:
+                continue
+            skipping = None
+        elif tag in _BLOCK_TAGS:
+            builder.newline()
+        if element in regions:
+            builder.end_region()
+        builder.text(element.tail)
+
+    builder.close(len(content_bytes))
+    return builder.sections
+
+
+def _single_section(extracted_text: str, content_bytes: bytes) -> ParsedSection:
+    """Wrap a whole document without headings in one section."""
+    return ParsedSection(
+        id=1,
+        level=1,
+        heading="Content",
+        text=extracted_text,
+        sha256=hashlib.sha256(extracted_text.encode()).hexdigest(),
+        byte_offset_start=0,
+        byte_offset_end=len(content_bytes),
+        tables=[],
+        language="en",
+    )
@@ -1,19 +1,61 @@
-"""MinIO artifact handler utilities for parse pipeline."""
+"""MinIO artifact handler utilities for parse pipeline.
+
+JSON artifacts written by the pipeline (parsed documents, raw metadata and
+diffs) are stored as minified JSON compressed with zstd and tagged with a
+``Content-Encoding: zstd`` header. ``download_artifact`` decodes them
+transparently, so callers always get the plain bytes back, and objects
+written before the compressed format (indented, uncompressed JSON) are
+returned unchanged.
+
+Write-once objects are kept in a local disk cache (see
+jobs_engine.utils.artifact_cache) both when they are uploaded and when they
+are first downloaded, so later pipeline stages on the same host skip MinIO.
+"""
 
 import json
 import logging
+import os
 from io import BytesIO
 from typing import Any, Dict
 
-from jobs_engine.minio_client import MinIOClient
+import zstandard
+
+from jobs_engine.minio_client import get_minio_client
+from jobs_engine.utils import artifact_cache
 from minio.error import S3Error
 
 logger = logging.getLogger(__name__)
 
+ARTIFACT_ZSTD_LEVEL = int(os.getenv("ARTIFACT_ZSTD_LEVEL", "3"))
+
+# Frame magic number at the start of every zstd stream
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def decode_artifact(data: bytes, content_encoding: str = None) -> bytes:
+    """Undo the storage encoding of an artifact.
+
+    Only objects tagged as zstd are decompressed, so raw crawl artifacts are
+    never touched. The magic number is checked as well because some HTTP
+    clients already decode the body based on the Content-Encoding header.
+
+    Args:
+        data: Bytes as read from MinIO
+        content_encoding: Content-Encoding the object was stored with
+
+    Returns:
+        Decoded bytes
+    """
+    if (content_encoding or "").lower() == "zstd" and data[:4] == _ZSTD_MAGIC:
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    return data
+
 
 def download_artifact(blob_uri: str) -> bytes:
     """Download an artifact from MinIO by URI.
 
+    Compressed JSON artifacts are decompressed transparently.
+
     Args:
         blob_uri: URI like s3://artifacts/raw/{source}/{yyyy}/{mm}/{dd}/{sha256}.bin
 
@@ -30,12 +72,25 @@ def download_artifact(blob_uri: str) -> bytes:
 
         object_key = blob_uri.replace("s3://artifacts/", "")
 
-        minio = MinIOClient()
+        cached = artifact_cache.get(object_key)
+        if cached is not None:
+            return cached
+
+        minio = get_minio_client()
         response = minio.client.get_object("artifacts", object_key)
-        data = response.read()
-        response.close()
+        try:
+            stored = response.read()
+            content_encoding = response.headers.get("Content-Encoding")
+        finally:
+            response.close()
+            response.release_conn()
 
-        logger.info(f"Downloaded artifact: {blob_uri} ({len(data)} bytes)")
+        data = decode_artifact(stored, content_encoding)
+        artifact_cache.put(object_key, data)
+        logger.info(
+            f"Downloaded artifact: {blob_uri} ({len(stored)} bytes stored, "
+            f"{len(data)} bytes decoded)"
+        )
         return data
 
     except S3Error as e:
@@ -46,14 +101,99 @@ def download_artifact(blob_uri: str) -> bytes:
         raise
 
 
+def stat_artifact(blob_uri: str) -> int:
+    """Get the stored size of an artifact without downloading it.
+
+    Args:
+        blob_uri: URI of the artifact (s3://artifacts/...)
+
+    Returns:
+        Stored object size in bytes
+
+    Raises:
+        ValueError: If the object cannot be found
+    """
+    if not blob_uri.startswith("s3://artifacts/"):
+        raise ValueError(f"Invalid artifact URI: {blob_uri}")
+    object_key = blob_uri.replace("s3://artifacts/", "")
+    try:
+        return get_minio_client().client.stat_object("artifacts", object_key).size
+    except S3Error as e:
+        raise ValueError(f"Failed to stat artifact {blob_uri}: {e}")
+
+
+def download_json_artifact(blob_uri: str) -> Any:
+    """Download and deserialize a JSON artifact from MinIO.
+
+    Args:
+        blob_uri: URI of a parsed document, raw metadata or diff object
+
+    Returns:
+        Deserialized JSON data
+
+    Raises:
+        ValueError: If download fails
+    """
+    return json.loads(download_artifact(blob_uri))
+
+
+def _object_exists(object_key: str) -> bool:
+    """Whether an object exists in the artifacts bucket."""
+    try:
+        get_minio_client().client.stat_object("artifacts", object_key)
+        return True
+    except S3Error as e:
+        if e.code in ("NoSuchKey", "NoSuchObject"):
+            return False
+        raise
+
+
+def upload_json_artifact(object_key: str, data: Any, overwrite: bool = True) -> str:
+    """Upload JSON data to the artifacts bucket in the compressed format.
+
+    Args:
+        object_key: Object key/path in the artifacts bucket
+        data: JSON-serializable data
+        overwrite: If False, an existing object is kept as it is
+
+    Returns:
+        S3 URI of uploaded object
+
+    Raises:
+        S3Error: If the upload fails
+    """
+    if not overwrite and _object_exists(object_key):
+        logger.info(f"Keeping existing artifact: s3://artifacts/{object_key}")
+        return f"s3://artifacts/{object_key}"
+
+    json_bytes = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    encoded = zstandard.ZstdCompressor(level=ARTIFACT_ZSTD_LEVEL).compress(json_bytes)
+    get_minio_client().client.put_object(
+        bucket_name="artifacts",
+        object_name=object_key,
+        data=BytesIO(encoded),
+        length=len(encoded),
+        content_type="application/json",
+        metadata={"Content-Encoding": "zstd"},
+    )
+    # Write-through: the next stage usually reads this object right away
+    artifact_cache.put(object_key, json_bytes)
+    return f"s3://artifacts/{object_key}"
+
+
 def upload_parsed_document(
-    doc_id: int, version_id: int, parsed_doc: Dict[str, Any]
+    doc_id: int, content_hash: str, parsed_doc: Dict[str, Any]
 ) -> str:
-    """Upload parsed document JSON to MinIO.
+    """Upload parsed document JSON to MinIO (zstd-compressed).
+
+    The object is keyed by content hash rather than version ID, so it can be
+    uploaded before its DocumentVersion exists. It is written once: when the
+    same content is parsed again (e.g. on a retry), the stored object and its
+    fetch_timestamp are kept, so cached copies never go stale.
 
     Args:
         doc_id: Document ID
-        version_id: Document version ID
+        content_hash: Content hash of the parsed document
         parsed_doc: Parsed document dict
 
     Returns:
@@ -63,26 +203,10 @@ def upload_parsed_document(
         ValueError: If upload fails
     """
     try:
-        minio = MinIOClient()
-        
-        # Create object key: parsed/{doc_id}/{version_id}.json
-        object_key = f"parsed/{doc_id}/{version_id}.json"
-
-        # Serialize to JSON
-        json_data = json.dumps(parsed_doc, indent=2)
-        data_bytes = json_data.encode("utf-8")
-
-        # Upload
-        data_stream = BytesIO(data_bytes)
-        minio.client.put_object(
-            bucket_name="artifacts",
-            object_name=object_key,
-            data=data_stream,
-            length=len(data_bytes),
-            content_type="application/json",
-        )
+        # Create object key: parsed/{doc_id}/{content_hash}.json
+        object_key = f"parsed/{doc_id}/{content_hash}.json"
 
-        uri = f"s3://artifacts/{object_key}"
+        uri = upload_json_artifact(object_key, parsed_doc, overwrite=False)
         logger.info(f"Uploaded parsed document: {uri}")
         return uri
 
@@ -95,7 +219,7 @@ def upload_parsed_document(
 
 
 def upload_raw_metadata(sha256: str, metadata: Dict[str, Any]) -> str:
-    """Upload raw artifact metadata to MinIO.
+    """Upload raw artifact metadata to MinIO (zstd-compressed).
 
     Args:
         sha256: SHA256 hash of raw artifact
@@ -108,26 +232,10 @@ def upload_raw_metadata(sha256: str, metadata: Dict[str, Any]) -> str:
         ValueError: If upload fails
     """
     try:
-        minio = MinIOClient()
-        
         # Create object key: raw_meta/{sha256}.json
         object_key = f"raw_meta/{sha256}.json"
 
-        # Serialize to JSON
-        json_data = json.dumps(metadata, indent=2)
-        data_bytes = json_data.encode("utf-8")
-
-        # Upload
-        data_stream = BytesIO(data_bytes)
-        minio.client.put_object(
-            bucket_name="artifacts",
-            object_name=object_key,
-            data=data_stream,
-            length=len(data_bytes),
-            content_type="application/json",
-        )
-
-        uri = f"s3://artifacts/{object_key}"
+        uri = upload_json_artifact(object_key, metadata)
         logger.info(f"Uploaded raw metadata: {uri}")
         return uri
 
@@ -137,3 +245,33 @@ def upload_raw_metadata(sha256: str, metadata: Dict[str, Any]) -> str:
     except Exception as e:
         logger.exception(f"Error uploading metadata: {e}")
         raise
+
+
+def upload_diff(doc_id: int, version_id: int, diff: Dict[str, Any]) -> str:
+    """Upload a version diff to MinIO (zstd-compressed).
+
+    Args:
+        doc_id: Document ID
+        version_id: Document version ID the diff leads to
+        diff: Section diff (see jobs_engine.utils.section_diff)
+
+    Returns:
+        S3 URI of uploaded diff
+
+    Raises:
+        ValueError: If upload fails
+    """
+    try:
+        # Create object key: diffs/{doc_id}/{version_id}.json
+        object_key = f"diffs/{doc_id}/{version_id}.json"
+
+        uri = upload_json_artifact(object_key, diff)
+        logger.info(f"Uploaded diff: {uri}")
+        return uri
+
+    except S3Error as e:
+        logger.exception(f"MinIO error uploading diff: {e}")
+        raise ValueError(f"Failed to upload diff: {e}")
+    except Exception as e:
+        logger.exception(f"Error uploading diff: {e}")
+        raise
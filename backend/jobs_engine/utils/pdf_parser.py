@@ -0,0 +1,252 @@
+"""PDF parsing utilities for regulation content extraction.
+
+PDFs are laid out and read one page at a time with pdfminer's
+``extract_pages`` generator. Each page's layout objects are dropped as soon as
+its text lines have been folded into sections, so memory follows the size of
+the extracted text, not the page count of the gazette.
+
+There is no markup to tell headings from body text, so lines are classified by
+font size relative to the body size (the most common character size seen so
+far) and short all-bold lines count as the lowest heading level.
+
+Offsets in the resulting sections cannot point into the PDF bytes: each section
+records the pages it spans (``page_start``/``page_end``), and
+``byte_offset_start``/``byte_offset_end`` are offsets into the UTF-8 text
+extracted from the document.
+"""
+
+import hashlib
+import io
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+
+from pdfminer.high_level import extract_pages
+from pdfminer.layout import LAParams, LTChar, LTTextContainer, LTTextLine
+from pdfminer.pdfpage import PDFPage
+
+from jobs_engine.schemas.parse_schemas import ParsedDocument, ParsedSection
+
+logger = logging.getLogger(__name__)
+
+PDF_MAGIC = b"%PDF-"
+# The PDF header may follow a few bytes of junk
+PDF_MAGIC_SCAN_BYTES = 1024
+
+# (minimum size relative to body text, heading level)
+HEADING_SIZE_LEVELS = ((1.8, 1), (1.4, 2), (1.15, 3))
+# Longest line still considered a heading
+MAX_HEADING_CHARS = 200
+# Longest all-bold body-size line treated as a level 4 heading
+MAX_BOLD_HEADING_CHARS = 120
+
+
+def is_pdf(
+    content_type: Optional[str], content_bytes: bytes, source_kind: Optional[str] = None
+) -> bool:
+    """Decide whether a crawled artifact should be parsed as a PDF.
+
+    The magic bytes win; then the content-type; the source kind only decides
+    when the server sent no usable content-type and the body is not markup.
+
+    Args:
+        content_type: Content-Type header of the crawl response
+        content_bytes: Raw content bytes
+        source_kind: Source.kind value ("html", "pdf", ...)
+
+    Returns:
+        True if the artifact is a PDF
+    """
+    if PDF_MAGIC in content_bytes[:PDF_MAGIC_SCAN_BYTES]:
+        return True
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type == "application/pdf":
+        return True
+    if media_type and media_type != "application/octet-stream":
+        return False
+    # Markup served to a PDF source (e.g. an error or index page) stays HTML
+    return source_kind == "pdf" and content_bytes[:PDF_MAGIC_SCAN_BYTES].lstrip()[:1] != b"<"
+
+
+def count_pdf_pages(content_bytes: bytes) -> int:
+    """Count the pages of a PDF without laying them out.
+
+    Only the page tree is read, which costs a small fraction of a parse.
+
+    Args:
+        content_bytes: Raw PDF bytes
+
+    Returns:
+        Number of pages, or 0 if the page tree cannot be read
+    """
+    try:
+        return sum(1 for _ in PDFPage.get_pages(io.BytesIO(content_bytes)))
+    except Exception as e:
+        logger.warning(f"Could not count PDF pages: {e}")
+        return 0
+
+
+def _line_style(line: LTTextLine) -> Tuple[float, bool]:
+    """Dominant font size of a line and whether all of its characters are bold."""
+    sizes = Counter()
+    bold = True
+    for char in line:
+        if isinstance(char, LTChar):
+            sizes[round(char.size, 1)] += 1
+            bold = bold and "bold" in char.fontname.lower()
+    if not sizes:
+        return 0.0, False
+    return sizes.most_common(1)[0][0], bold
+
+
+def _heading_level(text: str, size: float, bold: bool, body_size: float) -> Optional[int]:
+    """Heading level of a line, or None for body text."""
+    if not body_size or len(text) > MAX_HEADING_CHARS:
+        return None
+    for ratio, level in HEADING_SIZE_LEVELS:
+        if size >= body_size * ratio:
+            return level
+    if bold and size >= body_size and len(text) <= MAX_BOLD_HEADING_CHARS:
+        return 4
+    return None
+
+
+class _PdfSectionBuilder:
+    """Folds classified text lines into sections as pages stream by."""
+
+    def __init__(self):
+        self.sections: List[ParsedSection] = []
+        self.stack: List[Tuple[int, int]] = []  # (level, section id) of open ancestors
+        self.current: Optional[dict] = None
+        self.lines: List[str] = []
+        self.offset = 0  # UTF-8 offset into the extracted text
+
+    def _emit(self, text: str) -> None:
+        self.offset += len(text.encode("utf-8")) + 1  # + line break
+
+    def heading(self, text: str, level: int, page: int) -> None:
+        self.close()
+        while self.stack and self.stack[-1][0] >= level:
+            self.stack.pop()
+        section_id = len(self.sections) + 1
+        self.current = {
+            "id": section_id,
+            "parent_id": self.stack[-1][1] if self.stack else None,
+            "level": level,
+            "heading": text,
+            "byte_offset_start": self.offset,
+            "page_start": page,
+            "page_end": page,
+        }
+        self.stack.append((level, section_id))
+        self._emit(text)
+
+    def text(self, text: str, page: int) -> None:
+        if self.current is None:
+            # Text before the first heading
+            self.current = {
+                "id": len(self.sections) + 1,
+                "parent_id": None,
+                "level": 1,
+                "heading": "Content",
+                "byte_offset_start": self.offset,
+                "page_start": page,
+                "page_end": page,
+            }
+        self.current["page_end"] = page
+        self.lines.append(text)
+        self._emit(text)
+
+    def close(self) -> None:
+        if self.current is None:
+            return
+        section_text = "\n".join(self.lines) or self.current["heading"]
+        self.sections.append(
+            ParsedSection(
+                text=section_text,
+                sha256=hashlib.sha256(section_text.encode()).hexdigest(),
+                byte_offset_end=self.offset,
+                tables=[],
+                language="en",
+                **self.current,
+            )
+        )
+        self.current = None
+        self.lines = []
+
+
+def parse_pdf_to_sections(content_bytes: bytes, source_url: str) -> ParsedDocument:
+    """Parse a PDF to structured sections, one page at a time.
+
+    Args:
+        content_bytes: Raw PDF bytes
+        source_url: Source URL for reference
+
+    Returns:
+        ParsedDocument with sections and metadata
+
+    Raises:
+        ValueError: If parsing fails or the PDF has no extractable text
+    """
+    try:
+        logger.info(f"Parsing PDF from {source_url} ({len(content_bytes)} bytes)")
+
+        builder = _PdfSectionBuilder()
+        size_counts = Counter()
+        page_count = 0
+
+        for page_number, page in enumerate(
+            # caching=False: pdfminer would otherwise keep every parsed PDF
+            # object of the document alive until the end
+            extract_pages(io.BytesIO(content_bytes), laparams=LAParams(), caching=False),
+            start=1,
+        ):
+            page_count = page_number
+            lines = []
+            for element in page:
+                if not isinstance(element, LTTextContainer):
+                    continue
+                for line in element:
+                    if not isinstance(line, LTTextLine):
+                        continue
+                    text = " ".join(line.get_text().split())
+                    if not text:
+                        continue
+                    size, bold = _line_style(line)
+                    size_counts[size] += len(text)
+                    lines.append((text, size, bold))
+
+            # Body size from every page so far, including this one
+            body_size = size_counts.most_common(1)[0][0] if size_counts else 0.0
+            for text, size, bold in lines:
+                level = _heading_level(text, size, bold, body_size)
+                if level is None:
+                    builder.text(text, page_number)
+                else:
+                    builder.heading(text, level, page_number)
+
+        builder.close()
+
+        if not builder.sections:
+            raise ValueError(
+                "Could not extract any text from PDF - possibly scanned or encrypted"
+            )
+
+        parsed_doc = ParsedDocument(
+            source_url=source_url,
+            published_date=None,
+            language="en",
+            fetch_timestamp=datetime.now(timezone.utc).isoformat(),
+            sections=builder.sections,
+        )
+
+        logger.info(
+            f"Parsed PDF: {len(builder.sections)} sections from {page_count} pages "
+            f"of {source_url}"
+        )
+        return parsed_doc
+
+    except Exception as e:
+        logger.exception(f"Error parsing PDF from {source_url}: {e}")
+        raise ValueError(f"Failed to parse PDF: {e}")
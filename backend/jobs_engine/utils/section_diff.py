@@ -0,0 +1,283 @@
+"""Section-level diff engine for document versions.
+
+Parsed documents are lists of sections that each carry the SHA256 of their
+text. Instead of diffing the whole document tree (where one inserted section
+shifts every following array index), versions are compared section by
+section:
+
+1. Section hashes of both versions are aligned with difflib's longest-
+   matching-block algorithm; aligned sections are unchanged.
+2. Among the unaligned sections, identical hashes are paired as moves.
+3. Remaining sections sharing a heading path are paired as modifications,
+   and only their text is diffed (word-level).
+4. Anything left is a plain add or remove.
+
+Diffs are stored as ``{"format": "section-diff/v1", "operations": [...]}``.
+Byte offsets and section ids are positional and are not compared; the
+document's fetch_timestamp is ignored as well.
+
+``diff_with_metrics`` additionally returns a ``DiffMetrics`` record for the
+versioning stage; input sizes are taken from the byte lengths the caller
+already has rather than by re-serializing the documents.
+"""
+
+import difflib
+import logging
+import re
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SECTION_DIFF_FORMAT = "section-diff/v1"
+
+# Section fields compared besides the text (covered by sha256)
+_SECTION_FIELDS = ("heading", "level", "tables", "language")
+# Document fields compared for the metadata operation
+_DOCUMENT_FIELDS = ("source_url", "published_date", "language")
+
+_TOKEN = re.compile(r"\S+\s*|\s+")
+
+# Operation order in the stored diff
+_OP_ORDER = {"metadata": 0, "remove": 1, "move": 2, "modify": 3, "add": 4}
+
+
+@dataclass(frozen=True)
+class DiffMetrics:
+    """Structured metrics for one version diff."""
+
+    old_bytes: int
+    new_bytes: int
+    old_sections: int
+    new_sections: int
+    operations: int
+    sections_added: int
+    sections_removed: int
+    sections_changed: int
+    sections_moved: int
+    duration_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _heading_paths(sections: List[Dict[str, Any]]) -> List[str]:
+    """Compute the heading path ("Title > Chapter > Article") of each section."""
+    stack: List[Tuple[int, str]] = []
+    paths = []
+    for section in sections:
+        level = section.get("level", 1)
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        stack.append((level, section.get("heading", "")))
+        paths.append(" > ".join(heading for _level, heading in stack))
+    return paths
+
+
+def _field_changes(old: Dict[str, Any], new: Dict[str, Any], fields) -> Dict[str, Any]:
+    """New values of the given fields that differ between old and new."""
+    return {field: new.get(field) for field in fields if old.get(field) != new.get(field)}
+
+
+def _text_delta(old_text: str, new_text: str) -> List[List[Any]]:
+    """Word-level edit script turning old_text into new_text.
+
+    Each entry is ``[start, end, replacement]``: old tokens ``start:end``
+    are replaced by the replacement text.
+    """
+    old_tokens = _TOKEN.findall(old_text)
+    new_tokens = _TOKEN.findall(new_text)
+    matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    return [
+        [i1, i2, "".join(new_tokens[j1:j2])]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def compute_section_diff(old_doc: Dict[str, Any], new_doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute a section-level diff between two parsed documents.
+
+    Args:
+        old_doc: Previous version of parsed document (dict)
+        new_doc: New version of parsed document (dict)
+
+    Returns:
+        Diff dict with ``format`` and ``operations``. Operations are one of:
+
+        - ``metadata``: changed document fields
+        - ``remove``: ``old_index`` section no longer present
+        - ``add``: ``new_index`` with the full new ``section``
+        - ``move``: identical text moved from ``old_index`` to ``new_index``
+        - ``modify``: ``old_index``/``new_index`` pair with a word-level
+          ``text_delta`` and, if any, the changed section fields
+    """
+    old_sections = old_doc.get("sections", [])
+    new_sections = new_doc.get("sections", [])
+    old_paths = _heading_paths(old_sections)
+    new_paths = _heading_paths(new_sections)
+
+    operations: List[Dict[str, Any]] = []
+
+    metadata = _field_changes(old_doc, new_doc, _DOCUMENT_FIELDS)
+    if metadata:
+        operations.append({"op": "metadata", "changes": metadata})
+
+    # 1. Align unchanged sections by text hash
+    matcher = difflib.SequenceMatcher(
+        None,
+        [s.get("sha256") for s in old_sections],
+        [s.get("sha256") for s in new_sections],
+        autojunk=False,
+    )
+    pairs: List[Tuple[int, int]] = []
+    unmatched_old: List[int] = []
+    unmatched_new: List[int] = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            pairs.extend(zip(range(i1, i2), range(j1, j2)))
+        else:
+            unmatched_old.extend(range(i1, i2))
+            unmatched_new.extend(range(j1, j2))
+
+    # 2. Identical text out of order: moves
+    old_by_hash = defaultdict(deque)
+    for i in unmatched_old:
+        old_by_hash[old_sections[i].get("sha256")].append(i)
+    remaining_new = []
+    moved_old = set()
+    for j in unmatched_new:
+        candidates = old_by_hash.get(new_sections[j].get("sha256"))
+        if candidates:
+            i = candidates.popleft()
+            moved_old.add(i)
+            operation = {"op": "move", "old_index": i, "new_index": j, "heading_path": new_paths[j]}
+            changes = _field_changes(old_sections[i], new_sections[j], _SECTION_FIELDS)
+            if changes:
+                operation["changes"] = changes
+            operations.append(operation)
+        else:
+            remaining_new.append(j)
+    remaining_old = [i for i in unmatched_old if i not in moved_old]
+
+    # 3. Same heading path, different text: modifications
+    old_by_path = defaultdict(deque)
+    for i in remaining_old:
+        old_by_path[old_paths[i]].append(i)
+    modified_old = set()
+    added = []
+    for j in remaining_new:
+        candidates = old_by_path.get(new_paths[j])
+        if not candidates:
+            added.append(j)
+            continue
+        i = candidates.popleft()
+        modified_old.add(i)
+        old_section, new_section = old_sections[i], new_sections[j]
+        operation = {
+            "op": "modify",
+            "old_index": i,
+            "new_index": j,
+            "heading_path": new_paths[j],
+            "sha256": new_section.get("sha256"),
+            "text_delta": _text_delta(old_section.get("text", ""), new_section.get("text", "")),
+        }
+        changes = _field_changes(old_section, new_section, _SECTION_FIELDS)
+        if changes:
+            operation["changes"] = changes
+        operations.append(operation)
+
+    # Aligned sections whose text is unchanged but heading/tables differ
+    for i, j in pairs:
+        changes = _field_changes(old_sections[i], new_sections[j], _SECTION_FIELDS)
+        if changes:
+            operations.append(
+                {
+                    "op": "modify",
+                    "old_index": i,
+                    "new_index": j,
+                    "heading_path": new_paths[j],
+                    "sha256": new_sections[j].get("sha256"),
+                    "changes": changes,
+                    "text_delta": [],
+                }
+            )
+
+    # 4. Leftovers
+    for i in remaining_old:
+        if i not in modified_old:
+            operations.append(
+                {
+                    "op": "remove",
+                    "old_index": i,
+                    "heading_path": old_paths[i],
+                    "sha256": old_sections[i].get("sha256"),
+                }
+            )
+    for j in added:
+        operations.append(
+            {"op": "add", "new_index": j, "heading_path": new_paths[j], "section": new_sections[j]}
+        )
+
+    operations.sort(
+        key=lambda op: (_OP_ORDER[op["op"]], op.get("new_index", op.get("old_index", -1)))
+    )
+    return {"format": SECTION_DIFF_FORMAT, "operations": operations}
+
+
+def summarize_section_diff(diff: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    """Summarize a section diff as per-operation section counts.
+
+    Args:
+        diff: Diff returned by compute_section_diff
+
+    Returns:
+        Dict with operation count and added/removed/changed/moved section counts
+    """
+    counts = defaultdict(int)
+    operations = (diff or {}).get("operations", [])
+    for operation in operations:
+        counts[operation["op"]] += 1
+
+    return {
+        "operations": len(operations),
+        "sections_added": counts["add"],
+        "sections_removed": counts["remove"],
+        "sections_changed": counts["modify"],
+        "sections_moved": counts["move"],
+    }
+
+
+def diff_with_metrics(
+    old_doc: Dict[str, Any],
+    new_doc: Dict[str, Any],
+    old_bytes: int,
+    new_bytes: int,
+) -> Tuple[Dict[str, Any], DiffMetrics]:
+    """Compute a section diff and measure it.
+
+    Args:
+        old_doc: Previous version of parsed document (dict)
+        new_doc: New version of parsed document (dict)
+        old_bytes: Size of the previous document as downloaded
+        new_bytes: Size of the new document as downloaded
+
+    Returns:
+        Tuple of (diff, metrics)
+    """
+    started = time.perf_counter()
+    diff = compute_section_diff(old_doc, new_doc)
+    duration_ms = (time.perf_counter() - started) * 1000
+
+    summary = summarize_section_diff(diff)
+    metrics = DiffMetrics(
+        old_bytes=old_bytes,
+        new_bytes=new_bytes,
+        old_sections=len(old_doc.get("sections", [])),
+        new_sections=len(new_doc.get("sections", [])),
+        duration_ms=round(duration_ms, 3),
+        **summary,
+    )
+    return diff, metrics
@@ -12,6 +12,8 @@ class Artifact(Base):
     content_type = Column(String, nullable=False)
     blob_uri = Column(String, nullable=False)  # MinIO URI
     fetch_hash = Column(String, nullable=False, index=True)  # Content hash for deduplication
+    etag = Column(String, nullable=True)  # ETag validator for conditional GET
+    last_modified = Column(String, nullable=True)  # Last-Modified validator for conditional GET
     fetched_at = Column(DateTime(timezone=True), server_default=func.now())
     run_id = Column(Integer, ForeignKey("runs.id"), nullable=False, index=True)
 
@@ -11,17 +11,38 @@ class Document(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     source_id = Column(Integer, ForeignKey("sources.id"), nullable=False, index=True)
-    source_url = Column(String, nullable=False, unique=True, index=True)
+    source_url = Column(String, nullable=False, index=True)
+    # Hash of the subscription selector spec the content was narrowed with ("" = whole page)
+    selectors_hash = Column(String, nullable=False, default="", server_default="")
     published_date = Column(String, nullable=True)  # ISO format or extracted date
     language = Column(String, default="en", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Pointer to the newest version, updated under a row lock when a version is created
+    latest_version_id = Column(
+        Integer,
+        ForeignKey("document_versions.id", use_alter=True, name="fk_documents_latest_version_id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    latest_content_hash = Column(String, nullable=True)  # content_hash of the latest version
+    # Artifact the latest version was confirmed from; lets the crawl skip unchanged content
+    latest_artifact_id = Column(
+        Integer,
+        ForeignKey("artifacts.id", name="fk_documents_latest_artifact_id", ondelete="SET NULL"),
+        nullable=True,
+    )
 
     # Relationships
     source = relationship("Source", backref="documents")
-    versions = relationship("DocumentVersion", back_populates="document", cascade="all, delete-orphan")
+    versions = relationship(
+        "DocumentVersion",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        foreign_keys="DocumentVersion.document_id",
+    )
 
     __table_args__ = (
         Index("idx_document_source_url", "source_url"),
+        Index("uq_document_source_url_selectors_hash", "source_url", "selectors_hash", unique=True),
         Index("idx_document_source_id", "source_id"),
     )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from database.connection import Base
@@ -12,14 +12,16 @@ class DocumentVersion(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
-    parsed_uri = Column(String, nullable=False)  # s3://artifacts/parsed/{doc_id}/{version_id}.json
-    diff_uri = Column(String, nullable=True)  # s3://artifacts/diffs/{doc_id}/{version_id}.json
-    content_hash = Column(String, nullable=False, index=True)  # SHA256 of parsed JSON
+    parsed_uri = Column(String, nullable=False)  # s3://artifacts/parsed/{doc_id}/{content_hash}.json
+    diff_uri = Column(String, nullable=True)  # s3://artifacts/diffs/{doc_id}/{version_id}.json (section-diff/v1)
+    content_hash = Column(String, nullable=False, index=True)  # SHA256 of parsed JSON (without fetch_timestamp)
+    previous_version_id = Column(Integer, ForeignKey("document_versions.id"), nullable=True)
     run_id = Column(Integer, ForeignKey("runs.id"), nullable=True, index=True)
+    diff_metrics = Column(JSON, nullable=True)  # DiffMetrics of the diff against the previous version
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    document = relationship("Document", back_populates="versions")
+    document = relationship("Document", back_populates="versions", foreign_keys=[document_id])
 
     __table_args__ = (
         Index("idx_document_version_document_id", "document_id"),
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Query, HTTPException, status
+from fastapi import APIRouter, Depends, Query, HTTPException, status
 from fastapi.responses import StreamingResponse
 import json
 import asyncio
+import logging
 
 from observability.services.observability_service import ObservabilityService
 from auth.services import get_current_user_from_token
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/observability", tags=["observability"])
 
 
@@ -60,3 +63,23 @@ async def stream_observability(token: str = Query(..., description="Authenticati
             "X-Accel-Buffering": "no",
         }
     )
+
+
+@router.get("/rate-limits/{source_id}")
+def get_rate_limit_metrics(
+    source_id: int,
+    svc: ObservabilityService = Depends(get_service),
+):
+    """Get crawl rate-limiter wait metrics for a source.
+
+    Counts requests that drew a token, were throttled or rescheduled, and the
+    total seconds crawls waited for tokens.
+    """
+    try:
+        return svc.get_rate_limit_metrics(source_id)
+    except Exception as e:
+        logger.exception(f"Error reading rate limit metrics for source {source_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Rate limit metrics unavailable",
+        )
@@ -34,6 +34,20 @@ class ObservabilityService:
             queries = QueriesAdapter(db)
             return queries.list_runs(limit=limit, offset=0)
 
+    def get_rate_limit_metrics(self, source_id: int) -> Dict[str, Any]:
+        """Fetch crawl rate-limiter wait metrics for a source.
+        
+        Args:
+            source_id: Source to report on
+            
+        Returns:
+            Dictionary with source_id, acquired, throttled and rescheduled
+            request counts and wait_seconds_total
+        """
+        from jobs_engine.rate_limiter import get_wait_metrics
+
+        return {"source_id": source_id, **get_wait_metrics(source_id)}
+
     def get_observability_snapshot(self, limit: int = 50) -> Dict[str, Any]:
         """Get a snapshot of both outbox and runs data.
         
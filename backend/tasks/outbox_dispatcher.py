@@ -2,18 +2,24 @@ from __future__ import annotations
 
 from celery import shared_task
 from datetime import datetime, timezone
+import logging
 import random
 import time
 
 from database.sync import SessionLocalSync
-from events.kafka_emitter import emit_event
+from events.kafka_emitter import flush_events, publish_event, KAFKA_FLUSH_TIMEOUT
 from scheduling.repositories.adapters.outbox import OutboxAdapter
 
+logger = logging.getLogger(__name__)
+
 
 @shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=True, max_retries=5)
 def dispatch_outbox(self, batch_size: int = 200) -> int:
     """Pick pending outbox rows, publish to Kafka, and mark published.
 
+    All picked rows are enqueued on the batching producer first, flushed once,
+    and then marked published or failed based on their delivery futures.
+
     Returns number of published messages.
     """
     # jitter to reduce thundering herd
@@ -27,18 +33,31 @@ def dispatch_outbox(self, batch_size: int = 200) -> int:
 
         picked = outbox_repo.fetch_pending_for_update(limit=batch_size)
 
+        pending = []
         for item in picked:
-            event_type = item.event_type
-            payload = item.payload
-            ok = emit_event(event_type, payload, topic=event_type)
-            if ok:
-                outbox_repo.mark_published([item.id], now)
-                published_count += 1
-            else:
+            try:
+                future = publish_event(item.event_type, item.payload, topic=item.event_type)
+            except Exception:
+                logger.exception("Failed to enqueue outbox item %s", item.id)
+                outbox_repo.increment_attempt(item.id)
+                continue
+            pending.append((item, future))
+
+        flush_events()
+
+        published_ids = []
+        for item, future in pending:
+            try:
+                future.get(timeout=KAFKA_FLUSH_TIMEOUT)
+                published_ids.append(item.id)
+            except Exception:
+                logger.exception("Failed to publish outbox item %s", item.id)
                 outbox_repo.increment_attempt(item.id)
 
+        if published_ids:
+            outbox_repo.mark_published(published_ids, now)
+            published_count = len(published_ids)
+
         db.commit()
 
     return published_count
-
-